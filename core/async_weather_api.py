@@ -0,0 +1,239 @@
+# core/async_weather_api.py
+import asyncio
+import email.utils
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+from core.gazetteer import Gazetteer, get_default_gazetteer
+from core.geocode_cache import GeocodeCache, normalize_city
+from core.rate_limit import (BACKGROUND, FOREGROUND, QuotaLimiter, get_default_limiter)
+from core.units import CANONICAL_UNITS
+from core.weather_api import (COORD_DECIMALS, RETRY_STATUSES, ResponseCache, SingleFlight,
+                              SnapshotResult, WeatherAPI, WeatherSnapshot, inject_timezone)
+
+logger = logging.getLogger(__name__)
+
+# Statuses for which a Retry-After header is honored (same as urllib3's Retry).
+RETRY_AFTER_STATUSES = (413, 429, 503)
+BACKOFF_MAX = 120
+
+
+def retry_delay(retry_number: int, backoff_factor: float = 1.0,
+                retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to sleep before retry number `retry_number` (1-based), mirroring
+    urllib3's Retry: no sleep before the first retry, then
+    backoff_factor * 2 ** (n - 1), capped at BACKOFF_MAX. A Retry-After header
+    (seconds or HTTP date) wins when present.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(retry_after)
+                return max(0.0, when.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    if retry_number <= 1:
+        return 0.0
+    return min(BACKOFF_MAX, backoff_factor * (2 ** (retry_number - 1)))
+
+
+class AsyncWeatherAPI:
+    """
+    asyncio counterpart of WeatherAPI for headless collectors polling many
+    locations. One aiohttp session (shared connection pool) serves every
+    request; a semaphore bounds how many are in flight, and each call runs
+    under an overall deadline that includes its retries.
+
+    Use as `async with AsyncWeatherAPI(key) as api: ...` or call close().
+    """
+
+    BASE_URL = WeatherAPI.BASE_URL
+    GEO_URL = WeatherAPI.GEO_URL
+
+    def __init__(self, api_key: str, timeout: int = 10, max_retries: int = 3,
+                 units: str = "imperial", lang: str = "en",
+                 geocode_cache: Optional[GeocodeCache] = None,
+                 cache_ttl: float = 600, cache_stale_ttl: float = 3600,
+                 max_concurrency: int = 32, deadline: float = 30,
+                 wind_speed: Optional[str] = None,
+                 limiter: Optional[QuotaLimiter] = None,
+                 gazetteer: Optional[Gazetteer] = None):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.units = units            # display units; requests always use CANONICAL_UNITS
+        self.wind_speed = wind_speed
+        self.lang = lang
+        self.max_concurrency = max_concurrency
+        self.deadline = deadline
+        self.geocode_cache = geocode_cache if geocode_cache is not None else GeocodeCache()
+        self.gazetteer = gazetteer if gazetteer is not None else get_default_gazetteer()
+        self.response_cache = ResponseCache(ttl=cache_ttl, stale_ttl=cache_stale_ttl)
+        self.limiter = limiter if limiter is not None else get_default_limiter()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._revalidating: Dict[tuple, asyncio.Task] = {}
+        self._inflight = SingleFlight()
+
+    async def __aenter__(self) -> "AsyncWeatherAPI":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for task in list(self._revalidating.values()):
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # -------- public setters (same as WeatherAPI) ----------
+    def set_units(self, units: str):
+        self.units = units
+
+    def set_wind_speed(self, wind_speed: Optional[str]):
+        self.wind_speed = wind_speed
+
+    def set_lang(self, lang: str):
+        self.lang = lang
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        c = self.response_cache
+        return {"hits": c.hits, "misses": c.misses, "stale": c.stale}
+
+    # -------- internal request helpers ----------
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _get_json(self, url: str, params: dict, priority: str = FOREGROUND,
+                        budgeted: bool = True, deadline: Optional[float] = None):
+        deadline = self.deadline if deadline is None else deadline
+        try:
+            return await asyncio.wait_for(
+                self._get_with_retries(url, params, priority, budgeted), deadline)
+        except asyncio.TimeoutError:
+            logger.error(f"API request to {url} exceeded its {deadline}s deadline")
+            raise ValueError(f"API error: deadline of {deadline}s exceeded")
+
+    async def _get_with_retries(self, url: str, params: dict, priority: str, budgeted: bool):
+        session = self._get_session()
+        retries = 0
+        while True:
+            retry_after = None
+            # Every attempt, retries included, goes through the shared quota
+            await self.limiter.acquire_async(priority, budgeted)
+            try:
+                async with self._semaphore:
+                    async with session.get(url, params=params) as response:
+                        if response.status in RETRY_STATUSES and retries < self.max_retries:
+                            if response.status in RETRY_AFTER_STATUSES:
+                                retry_after = response.headers.get("Retry-After")
+                        else:
+                            response.raise_for_status()
+                            return await response.json()
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"API request failed: {str(e)}")
+                raise ValueError(f"API error: {str(e)}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if retries >= self.max_retries:
+                    logger.error(f"API request failed: {str(e)}")
+                    raise ValueError(f"API error: {str(e)}")
+            retries += 1
+            delay = retry_delay(retries, retry_after=retry_after)
+            if retry_after:
+                self.limiter.defer(delay)
+            await asyncio.sleep(delay)
+
+    # -------- public API (mirrors WeatherAPI) ----------
+    async def geocode(self, city: str, priority: str = FOREGROUND) -> Tuple[float, float]:
+        local = self.gazetteer.resolve(city)
+        if local is not None:
+            return local
+        cached = self.geocode_cache.get(city, self.lang)
+        if cached is not None:
+            return cached
+        key = ("geocode", normalize_city(city), self.lang)
+        return await self._inflight.do_async(key, lambda: self._fetch_geocode(city, priority))
+
+    async def _fetch_geocode(self, city: str, priority: str) -> Tuple[float, float]:
+        results = await self._get_json(self.GEO_URL,
+                                       {'q': city, 'limit': 1, 'appid': self.api_key},
+                                       priority, budgeted=False)
+        if not results:
+            raise ValueError(f"Geocoding error: no match for '{city}'")
+        lat, lon = results[0]['lat'], results[0]['lon']
+        self.geocode_cache.put(city, self.lang, lat, lon)
+        return lat, lon
+
+    async def get_forecast_bundle(self, lat: float, lon: float,
+                                  exclude: str = "minutely,hourly",
+                                  priority: str = FOREGROUND) -> Dict:
+        return (await self._bundle_entry(lat, lon, exclude, priority))[0]
+
+    async def _bundle_entry(self, lat: float, lon: float, exclude: str,
+                            priority: str) -> Tuple[Dict, float]:
+        key = self.response_cache.make_key(lat, lon, CANONICAL_UNITS, self.lang, exclude)
+        bundle, state, fetched = self.response_cache.lookup_entry(key)
+        if state == ResponseCache.STALE and key not in self._revalidating:
+            task = asyncio.ensure_future(self._fetch_bundle(key, lat, lon, exclude, BACKGROUND))
+            self._revalidating[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish_revalidate(k, t))
+        if bundle is not None:
+            return bundle, fetched
+        return await self._fetch_bundle(key, lat, lon, exclude, priority)
+
+    def _finish_revalidate(self, key: tuple, task: asyncio.Task) -> None:
+        self._revalidating.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # already logged; keep serving the stale copy
+
+    async def _fetch_bundle(self, key: tuple, lat: float, lon: float, exclude: str,
+                            priority: str = FOREGROUND) -> Tuple[Dict, float]:
+        return await self._inflight.do_async(
+            ("onecall",) + key, lambda: self._download_bundle(key, lat, lon, exclude, priority))
+
+    async def _download_bundle(self, key: tuple, lat: float, lon: float, exclude: str,
+                               priority: str) -> Tuple[Dict, float]:
+        bundle = await self._get_json(f"{self.BASE_URL}/onecall", {
+            'lat': round(float(lat), COORD_DECIMALS),
+            'lon': round(float(lon), COORD_DECIMALS),
+            'exclude': exclude,
+            'appid': self.api_key,
+            'units': CANONICAL_UNITS,
+            'lang': self.lang,
+        }, priority)
+        inject_timezone(bundle)
+        return bundle, self.response_cache.store(key, bundle)
+
+    async def get_snapshot(self, city: str, priority: str = FOREGROUND) -> WeatherSnapshot:
+        lat, lon = await self.geocode(city, priority)
+        bundle, fetched = await self._bundle_entry(lat, lon, "minutely,hourly", priority)
+        snap = WeatherSnapshot.from_bundle(city, lat, lon, bundle)
+        snap.fetched_at = fetched
+        return snap.in_units(self.units, self.wind_speed)
+
+    async def get_snapshots(self, cities: List[str],
+                            priority: str = BACKGROUND) -> List[SnapshotResult]:
+        """Fetch many cities concurrently (bounded by max_concurrency), in input order."""
+        async def fetch(city: str) -> SnapshotResult:
+            try:
+                return SnapshotResult(city, snapshot=await self.get_snapshot(city, priority))
+            except Exception as e:
+                return SnapshotResult(city, error=e)
+
+        return list(await asyncio.gather(*(fetch(c) for c in cities)))
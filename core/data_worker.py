@@ -0,0 +1,92 @@
+# core/data_worker.py
+"""
+Background data worker for the Tk dashboard.
+
+Fetching and parsing run on worker threads; finished results wait in a
+queue until the UI thread calls poll() (from an `after()` loop), so Tk
+widgets are only ever touched on the main thread.
+
+Jobs are submitted on a named channel ("refresh", "lane", ...). A newer
+submit on the same channel supersedes the older one: a job that has not
+started yet is skipped, and one already running is allowed to finish but
+its result is dropped.
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DataWorker:
+    def __init__(self, max_workers: int = 2):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="data-worker")
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        self._generation: Dict[str, int] = {}
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, channel: str, fn: Callable[[], Any],
+               on_done: Callable[[Any], None],
+               on_error: Optional[Callable[[Exception], None]] = None) -> int:
+        """Run `fn` in the background; `on_done` / `on_error` run later inside poll()."""
+        with self._lock:
+            gen = self._generation.get(channel, 0) + 1
+            self._generation[channel] = gen
+            self._pending[channel] = gen
+
+        def run():
+            if not self._is_current(channel, gen):
+                return  # superseded before it started
+            try:
+                result, error = fn(), None
+            except Exception as e:
+                result, error = None, e
+            self._results.put((channel, gen, result, error, on_done, on_error))
+
+        self._pool.submit(run)
+        return gen
+
+    def cancel(self, channel: str) -> None:
+        """Drop whatever is queued or running on `channel`."""
+        with self._lock:
+            self._generation[channel] = self._generation.get(channel, 0) + 1
+            self._pending.pop(channel, None)
+
+    def busy(self, channel: Optional[str] = None) -> bool:
+        """True while a current job (on `channel`, or any channel) has no delivered result."""
+        with self._lock:
+            return bool(self._pending) if channel is None else channel in self._pending
+
+    def poll(self) -> int:
+        """Deliver finished, still-current results. Call from the UI thread only."""
+        delivered = 0
+        while True:
+            try:
+                channel, gen, result, error, on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                return delivered
+            with self._lock:
+                if self._generation.get(channel) != gen:
+                    continue  # superseded while running
+                self._pending.pop(channel, None)
+            delivered += 1
+            if error is None:
+                on_done(result)
+            elif on_error is not None:
+                on_error(error)
+            else:
+                logger.error(f"Background job on '{channel}' failed: {error}")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for channel in list(self._generation):
+                self._generation[channel] += 1
+            self._pending.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _is_current(self, channel: str, gen: int) -> bool:
+        with self._lock:
+            return self._generation.get(channel) == gen
@@ -0,0 +1,52 @@
+# core/downsample.py
+"""
+Largest-Triangle-Three-Buckets (LTTB) downsampling for chart series.
+
+Dense lanes (48 hourly or 60 minutely points) are reduced to a fixed point
+budget before plotting while keeping the visual shape (peaks and troughs).
+Bucket boundaries and the "next bucket" averages are computed for all
+buckets at once; only the choice of the previous anchor point is
+sequential, with each bucket's triangle areas evaluated as one NumPy
+expression.
+"""
+import numpy as np
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    Indices of the `n_out` points LTTB keeps from (x, y). The first and last
+    points are always kept. Returns every index when no reduction is needed.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 interior buckets over points 1 .. n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # For bucket i, the "next" bucket is bucket i+1; the last one looks at the final point
+    next_lo = np.append(edges[1:-1], n - 1)
+    next_hi = np.append(edges[2:], n)
+    csx = np.concatenate(([0.0], np.cumsum(x)))
+    csy = np.concatenate(([0.0], np.cumsum(y)))
+    counts = next_hi - next_lo
+    avg_x = (csx[next_hi] - csx[next_lo]) / counts
+    avg_y = (csy[next_hi] - csy[next_lo]) / counts
+
+    out = np.empty(n_out, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - avg_x[i]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (avg_y[i] - y[a]))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        out[i + 1] = a
+    return out
+
+
+def lttb(x, y, n_out: int):
+    """Downsample (x, y) to `n_out` points; returns the kept (x, y) arrays."""
+    idx = lttb_indices(x, y, n_out)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
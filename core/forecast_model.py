@@ -0,0 +1,127 @@
+# core/forecast_model.py
+"""
+Parsed, compact view of a One Call bundle.
+
+Built once per fetch (see WeatherSnapshot.model) so renderers read
+attributes and contiguous NumPy columns instead of re-walking the raw JSON
+on every card, table row and chart series.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class CurrentConditions:
+    __slots__ = ("dt", "temp", "feels_like", "humidity", "pressure", "uvi",
+                 "wind_speed", "sunrise", "sunset", "icon", "description", "timezone")
+
+    def __init__(self, d: Dict):
+        weather = (d.get("weather") or [{}])[0]
+        self.dt = d.get("dt", 0)
+        self.temp = d.get("temp", 0.0)
+        self.feels_like = d.get("feels_like", self.temp)
+        self.humidity = d.get("humidity", 0)
+        self.pressure = d.get("pressure", 0)
+        self.uvi = d.get("uvi", 0)
+        self.wind_speed = d.get("wind_speed", 0.0)
+        self.sunrise = d.get("sunrise", 0)
+        self.sunset = d.get("sunset", 0)
+        self.icon = weather.get("icon", "")
+        self.description = weather.get("description", "")
+        self.timezone = d.get("timezone", 0)
+
+
+class Alert:
+    __slots__ = ("sender", "event", "start", "end", "description", "tags")
+
+    def __init__(self, d: Dict):
+        self.sender = d.get("sender_name", "")
+        self.event = d.get("event", "Alert")
+        self.start = d.get("start", 0)
+        self.end = d.get("end", 0)
+        self.description = d.get("description", "")
+        self.tags = tuple(d.get("tags", ()))
+
+    @property
+    def key(self) -> tuple:
+        """Identity of an alert across refreshes."""
+        return self.sender, self.event, self.start, self.end
+
+
+class SeriesBlock:
+    """
+    Column-oriented daily or hourly series: one array per field, all the
+    same length. For hourly data temp_min / temp_max equal temp.
+    """
+    __slots__ = ("dt", "temp", "temp_min", "temp_max", "pop", "humidity", "wind_speed", "icon")
+
+    def __init__(self, dt, temp, temp_min, temp_max, pop, humidity, wind_speed, icon):
+        self.dt = dt
+        self.temp = temp
+        self.temp_min = temp_min
+        self.temp_max = temp_max
+        self.pop = pop
+        self.humidity = humidity
+        self.wind_speed = wind_speed
+        self.icon = icon
+
+    def __len__(self) -> int:
+        return len(self.dt)
+
+    def head(self, n: int) -> "SeriesBlock":
+        """First `n` rows (array views, no copy)."""
+        return SeriesBlock(*(getattr(self, f)[:n] for f in self.__slots__))
+
+    def take(self, indices) -> "SeriesBlock":
+        """Rows at `indices`, e.g. the points kept by core.downsample.lttb_indices."""
+        return SeriesBlock(*(getattr(self, f)[indices] for f in self.__slots__))
+
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> "SeriesBlock":
+        n = len(records)
+
+        def col(get, dtype=float):
+            return np.fromiter((get(r) for r in records), dtype=dtype, count=n)
+
+        def temp_part(r, part):
+            t = r.get("temp", np.nan)
+            if isinstance(t, dict):
+                if part == "day":
+                    return t.get("day", t.get("max", np.nan))
+                return t.get(part, np.nan)
+            return t
+
+        return cls(
+            dt=col(lambda r: r.get("dt", 0), np.int64),
+            temp=col(lambda r: temp_part(r, "day")),
+            temp_min=col(lambda r: temp_part(r, "min")),
+            temp_max=col(lambda r: temp_part(r, "max")),
+            pop=col(lambda r: r.get("pop", 0.0)),
+            humidity=col(lambda r: r.get("humidity", 0)),
+            wind_speed=col(lambda r: r.get("wind_speed", 0.0)),
+            icon=np.array([(r.get("weather") or [{}])[0].get("icon", "") for r in records],
+                          dtype="U3"),
+        )
+
+
+class ForecastModel:
+    __slots__ = ("current", "daily", "hourly", "alerts", "timezone_offset")
+
+    def __init__(self, current: CurrentConditions, daily: SeriesBlock,
+                 hourly: Optional[SeriesBlock], alerts: List[Alert], timezone_offset: int = 0):
+        self.current = current
+        self.daily = daily
+        self.hourly = hourly
+        self.alerts = alerts
+        self.timezone_offset = timezone_offset
+
+    @classmethod
+    def from_bundle(cls, bundle: Dict) -> "ForecastModel":
+        hourly = bundle.get("hourly")
+        return cls(
+            current=CurrentConditions(bundle.get("current") or {}),
+            daily=SeriesBlock.from_records(bundle.get("daily") or []),
+            hourly=SeriesBlock.from_records(hourly) if hourly else None,
+            alerts=[Alert(a) for a in bundle.get("alerts") or []],
+            timezone_offset=bundle.get("timezone_offset", 0),
+        )
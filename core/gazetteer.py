@@ -0,0 +1,151 @@
+# core/gazetteer.py
+"""
+Offline city gazetteer: instant autocomplete and local geocoding.
+
+The data lives in data/gazetteer/ as one .npy file per column (built by
+tools/build_gazetteer.py from GeoNames cities with 15k+ inhabitants) and is
+memory-mapped, so loading costs almost nothing and only touched pages are
+read. Rows are sorted by a folded search key (lowercase ASCII), which makes
+a prefix lookup two binary searches over the key column.
+"""
+import logging
+import os
+import threading
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DIR = os.path.join(_REPO_ROOT, "data", "gazetteer")
+
+COLUMNS = ("key", "name", "admin", "country", "lat", "lon", "population")
+KEY_BYTES = 24
+
+# Common ways people type a country that aren't its ISO code
+COUNTRY_ALIASES = {"uk": "GB", "usa": "US", "england": "GB"}
+
+
+def fold(text: str) -> str:
+    """Search key for a name: 'São  Paulo' -> 'sao paulo'."""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return " ".join(ascii_text.lower().split())
+
+
+class Gazetteer:
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self._cols = columns
+        self._keys = columns["key"]
+
+    @classmethod
+    def load(cls, directory: str = DEFAULT_DIR, mmap: bool = True) -> "Gazetteer":
+        mode = "r" if mmap else None
+        return cls({c: np.load(os.path.join(directory, f"{c}.npy"), mmap_mode=mode)
+                    for c in COLUMNS})
+
+    @classmethod
+    def empty(cls) -> "Gazetteer":
+        return cls({
+            "key": np.array([], dtype=f"S{KEY_BYTES}"), "name": np.array([], dtype="S1"),
+            "admin": np.array([], dtype="S2"), "country": np.array([], dtype="S2"),
+            "lat": np.array([], dtype=np.float32), "lon": np.array([], dtype=np.float32),
+            "population": np.array([], dtype=np.uint32),
+        })
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # -------- lookups ----------
+    def _prefix_range(self, key: bytes) -> Tuple[int, int]:
+        lo = int(np.searchsorted(self._keys, key, side="left"))
+        hi = int(np.searchsorted(self._keys, key + b"\xff", side="left"))
+        return lo, hi
+
+    def _exact_range(self, key: bytes) -> Tuple[int, int]:
+        lo = int(np.searchsorted(self._keys, key, side="left"))
+        hi = int(np.searchsorted(self._keys, key, side="right"))
+        return lo, hi
+
+    def label(self, i: int) -> str:
+        """Display / query string for row i: 'Miami, FL, US' or 'London, GB'."""
+        c = self._cols
+        parts = [c["name"][i].decode("utf-8", "ignore"), c["admin"][i].decode(),
+                 c["country"][i].decode()]
+        return ", ".join(p for p in parts if p)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """Up to `limit` labels whose name starts with `prefix`, most populous first."""
+        key = fold(prefix.split(",")[0]).encode("ascii")[:KEY_BYTES]
+        if not key:
+            return []
+        lo, hi = self._prefix_range(key)
+        if lo == hi:
+            return []
+        pops = self._cols["population"][lo:hi]
+        if hi - lo > limit:
+            top = np.argpartition(pops, -limit)[-limit:]
+        else:
+            top = np.arange(hi - lo)
+        top = top[np.argsort(pops[top])[::-1]]
+        labels = []
+        for i in (lo + top).tolist():
+            lbl = self.label(i)
+            if lbl not in labels:
+                labels.append(lbl)
+        return labels
+
+    def resolve(self, query: str) -> Optional[Tuple[float, float]]:
+        """
+        (lat, lon) for 'City', 'City, CC' or 'City, ST, CC' (ST = US state);
+        the most populous match wins. None when the name isn't known.
+        """
+        parts = [p.strip() for p in query.split(",") if p.strip()]
+        if not parts:
+            return None
+        key = fold(parts[0]).encode("ascii")[:KEY_BYTES]
+        lo, hi = self._exact_range(key)
+        if lo == hi:
+            return None
+
+        admin = country = None
+        if len(parts) >= 3:
+            admin, country = parts[1].upper(), parts[2]
+        elif len(parts) == 2:
+            country = parts[1]
+        if country is not None:
+            country = COUNTRY_ALIASES.get(country.lower(), country.upper())
+
+        rows = np.arange(lo, hi)
+        if country is not None:
+            countries = self._cols["country"][lo:hi]
+            mask = countries == country.encode("ascii", "ignore")
+            if not mask.any() and len(parts) == 2:
+                # 'Miami, FL' -> treat the second part as a US state
+                mask = (self._cols["admin"][lo:hi] == country.encode("ascii", "ignore")) & \
+                       (countries == b"US")
+            rows = rows[mask]
+        if admin is not None and len(rows):
+            rows = rows[self._cols["admin"][rows] == admin.encode("ascii", "ignore")]
+        if not len(rows):
+            return None
+        best = rows[int(np.argmax(self._cols["population"][rows]))]
+        return float(self._cols["lat"][best]), float(self._cols["lon"][best])
+
+
+_default: Optional[Gazetteer] = None
+_default_lock = threading.Lock()
+
+
+def get_default_gazetteer() -> Gazetteer:
+    """The bundled gazetteer (memory-mapped once per process), or an empty one."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            try:
+                _default = Gazetteer.load()
+            except (OSError, ValueError) as e:
+                logger.warning(f"Offline gazetteer unavailable ({e}); geocoding online only")
+                _default = Gazetteer.empty()
+        return _default
@@ -0,0 +1,102 @@
+# core/geocode_cache.py
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DB_PATH = os.path.join(_REPO_ROOT, "data", "geocode_cache.db")
+
+
+def normalize_city(city: str) -> str:
+    """Canonical cache key for a city string: '  New York ,US ' -> 'new york,us'."""
+    parts = (" ".join(p.split()).lower() for p in city.split(","))
+    return ",".join(p for p in parts if p)
+
+
+class GeocodeCache:
+    """
+    Disk-backed (SQLite) city -> (lat, lon) cache with TTL and LRU eviction.
+    Survives restarts, so a known city is only resolved over the network once.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, ttl_seconds: int = 90 * 86400,
+                 max_entries: int = 1000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        try:
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._conn = self._connect(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Geocode cache unavailable at {path} ({e}); using memory only")
+            self.path = ":memory:"
+            self._conn = self._connect(":memory:")
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " city TEXT NOT NULL, lang TEXT NOT NULL,"
+            " lat REAL NOT NULL, lon REAL NOT NULL,"
+            " created_at REAL NOT NULL, last_used REAL NOT NULL,"
+            " PRIMARY KEY (city, lang))"
+        )
+        conn.commit()
+        return conn
+
+    def get(self, city: str, lang: str = "en") -> Optional[Tuple[float, float]]:
+        key = normalize_city(city)
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT lat, lon, created_at FROM geocode WHERE city = ? AND lang = ?",
+                    (key, lang)).fetchone()
+                if row is None:
+                    return None
+                lat, lon, created_at = row
+                if now - created_at > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM geocode WHERE city = ? AND lang = ?", (key, lang))
+                    self._conn.commit()
+                    return None
+                self._conn.execute("UPDATE geocode SET last_used = ? WHERE city = ? AND lang = ?",
+                                   (now, key, lang))
+                self._conn.commit()
+                return lat, lon
+            except sqlite3.Error as e:
+                logger.warning(f"Geocode cache read failed: {e}")
+                return None
+
+    def put(self, city: str, lang: str, lat: float, lon: float) -> None:
+        key = normalize_city(city)
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO geocode (city, lang, lat, lon, created_at, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?)", (key, lang, lat, lon, now, now))
+                # LRU eviction: drop the least recently used rows beyond max_entries
+                self._conn.execute(
+                    "DELETE FROM geocode WHERE rowid IN ("
+                    " SELECT rowid FROM geocode ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Geocode cache write failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM geocode")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
@@ -0,0 +1,87 @@
+# core/lazy_import.py
+"""
+Deferred imports for heavy optional modules (matplotlib, mplcursors,
+scikit-learn, pandas, PIL).
+
+    plt = lazy_import("matplotlib.pyplot")   # nothing imported yet
+    plt.figure()                             # imported here, once
+
+The real import happens on first attribute access and its cost is
+recorded, so the startup report can show what was deferred and what it
+cost when it finally loaded. Set WEATHER_EAGER_IMPORTS=1 to import
+everything up front (the old behaviour) for before/after comparisons.
+"""
+import importlib
+import os
+import threading
+import time
+from typing import Dict
+
+from core.tracing import tracer
+
+EAGER = os.getenv("WEATHER_EAGER_IMPORTS", "") not in ("", "0")
+
+_timings: Dict[str, float] = {}     # module -> seconds spent importing it
+_lock = threading.RLock()
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    name = self.__dict__["_name"]
+                    t0 = time.perf_counter()
+                    with tracer.span(f"import {name}", "import", lazy=True):
+                        module = importlib.import_module(name)
+                    _timings[name] = time.perf_counter() - t0
+                    self.__dict__["_module"] = module
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+_registry: Dict[str, LazyModule] = {}
+
+
+def lazy_import(name: str) -> LazyModule:
+    """A shared LazyModule for `name` (imported immediately when EAGER)."""
+    with _lock:
+        module = _registry.get(name)
+        if module is None:
+            module = _registry[name] = LazyModule(name)
+    if EAGER:
+        module._load()
+    return module
+
+
+def import_timings() -> Dict[str, float]:
+    """Seconds spent importing each lazy module that has been loaded so far."""
+    with _lock:
+        return dict(_timings)
+
+
+def pending() -> list:
+    """Names of lazy modules that have not been needed yet."""
+    with _lock:
+        return sorted(name for name, m in _registry.items() if not m.loaded)
@@ -0,0 +1,104 @@
+# core/metrics.py
+"""
+Opt-in performance instrumentation.
+
+Timings are kept per name in a rolling window (the last `window` samples)
+and summarised as percentiles, so the diagnostics tab and the JSON dump
+show how the dashboard behaves now, not averaged over the whole session.
+Names are dotted by area: "http.onecall", "refresh.fetch", "render.chart",
+"tk.loop_lag", ...
+
+Off by default; span() is then a shared no-op. Set WEATHER_METRICS=1 or
+press Ctrl+Shift+D in the dashboard to turn it on.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Optional
+
+from core.tracing import tracer
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DUMP_PATH = os.path.join(_REPO_ROOT, "data", "diagnostics.json")
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, -(-len(ordered) * p // 100))   # ceil
+    return ordered[int(rank) - 1]
+
+
+class Metrics:
+    def __init__(self, enabled: bool = False, window: int = 512):
+        self.enabled = enabled
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, name: str, ms: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(ms)
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def span(self, name: str):
+        """
+        Context manager timing its body into `name` (no-op while disabled).
+        Spans also land in the Chrome trace when core.tracing is recording.
+        """
+        if not self.enabled:
+            return tracer.span(name)
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            with tracer.span(name):
+                yield
+        finally:
+            self.record(name, (time.perf_counter() - t0) * 1000)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """{name: {count, last, p50, p90, p99, max}} over the rolling window (ms)."""
+        with self._lock:
+            snapshot = {name: (self._counts[name], list(s)) for name, s in self._samples.items()}
+        out = {}
+        for name, (count, samples) in sorted(snapshot.items()):
+            ordered = sorted(samples)
+            row = {"count": count, "last": round(samples[-1], 2)}
+            for p in PERCENTILES:
+                row[f"p{p}"] = round(percentile(ordered, p), 2)
+            row["max"] = round(ordered[-1], 2)
+            out[name] = row
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+        self.started_at = time.time()
+
+    def dump(self, path: Optional[str] = None, extra: Optional[Dict] = None) -> str:
+        """Write summary() (plus `extra` sections) as JSON; returns the path written."""
+        path = path or DEFAULT_DUMP_PATH
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        payload = {"generated_at": time.time(), "since": self.started_at,
+                   "window": self.window, "metrics": self.summary()}
+        payload.update(extra or {})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        return path
+
+
+metrics = Metrics(enabled=os.getenv("WEATHER_METRICS", "") not in ("", "0"))
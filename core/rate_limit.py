@@ -0,0 +1,223 @@
+# core/rate_limit.py
+"""
+Process-wide API quota scheduler.
+
+One QuotaLimiter (see get_default_limiter) is shared by every WeatherAPI and
+AsyncWeatherAPI in the process. It combines:
+
+- a token bucket that caps the request rate (calls per minute + burst),
+- a daily call budget that resets at 00:00 UTC, when OpenWeather resets it,
+- priorities: foreground (the city on screen) goes first, and background
+  work (favorites prefetch, revalidation) may not dip into a reserved slice
+  of the daily budget,
+- a global pause honoring Retry-After from 429/503 responses.
+
+Counts live in memory, so they start from zero on each launch.
+"""
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from urllib3.util.retry import Retry
+
+from core.tracing import tracer
+
+FOREGROUND = "foreground"
+BACKGROUND = "background"
+
+# How long a background caller yields while a foreground caller is waiting.
+_YIELD_SECONDS = 0.05
+
+
+class QuotaExceededError(ValueError):
+    """Raised when the daily budget left for a priority level is used up."""
+
+
+class QuotaLimiter:
+    def __init__(self, rate_per_minute: float = 60, burst: int = 10,
+                 daily_budget: int = 1000, background_reserve: float = 0.2,
+                 clock: Callable[[], float] = time.time):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.daily_budget = daily_budget
+        self.background_reserve = background_reserve
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._tokens = float(burst)
+        self._last_refill = now
+        self._day = int(now // 86400)
+        self._used_today = 0
+        self._blocked_until = 0.0
+        self._foreground_waiting = 0
+
+    # -------- bookkeeping (call with the lock held) ----------
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        day = int(now // 86400)
+        if day != self._day:
+            self._day = day
+            self._used_today = 0
+
+    def _budget_left(self, priority: str) -> int:
+        left = self.daily_budget - self._used_today
+        if priority == BACKGROUND:
+            left -= int(self.daily_budget * self.background_reserve)
+        return left
+
+    # -------- public API ----------
+    def reserve(self, priority: str = FOREGROUND, budgeted: bool = True) -> float:
+        """
+        Try to take one call slot now. Returns 0.0 when granted, otherwise the
+        number of seconds to wait before trying again. Raises
+        QuotaExceededError if the daily budget for `priority` is spent.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if budgeted and self._budget_left(priority) <= 0:
+                raise QuotaExceededError(
+                    f"Daily API budget exhausted for {priority} requests "
+                    f"({self._used_today}/{self.daily_budget} used)")
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if priority == BACKGROUND and self._foreground_waiting:
+                return _YIELD_SECONDS
+            if self._tokens >= 1:
+                self._tokens -= 1
+                if budgeted:
+                    self._used_today += 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, priority: str = FOREGROUND, budgeted: bool = True) -> None:
+        """Block the calling thread until a call slot is granted."""
+        self._set_waiting(priority, +1)
+        try:
+            while True:
+                wait = self.reserve(priority, budgeted)
+                if wait <= 0:
+                    return
+                time.sleep(wait)
+        finally:
+            self._set_waiting(priority, -1)
+
+    async def acquire_async(self, priority: str = FOREGROUND, budgeted: bool = True) -> None:
+        """asyncio version of acquire()."""
+        self._set_waiting(priority, +1)
+        try:
+            while True:
+                wait = self.reserve(priority, budgeted)
+                if wait <= 0:
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            self._set_waiting(priority, -1)
+
+    def _set_waiting(self, priority: str, delta: int) -> None:
+        if priority == FOREGROUND:
+            with self._lock:
+                self._foreground_waiting += delta
+
+    def record_call(self, budgeted: bool = True) -> None:
+        """Count a call made outside reserve(), e.g. a transport-level retry."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = max(0.0, self._tokens - 1)
+            if budgeted:
+                self._used_today += 1
+
+    def defer(self, seconds: float) -> None:
+        """Pause every caller for `seconds` (server sent Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def remaining_today(self) -> int:
+        with self._lock:
+            self._refill(self._clock())
+            return max(0, self.daily_budget - self._used_today)
+
+    def pace_interval(self, min_interval: float, calls_per_refresh: int = 1,
+                      priority: str = FOREGROUND) -> float:
+        """
+        Refresh interval (seconds) that spreads the budget `priority` may
+        still spend evenly until the next UTC reset, never shorter than
+        `min_interval`. BACKGROUND pacing leaves the foreground reserve alone.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            remaining = max(0, self._budget_left(priority))
+        until_reset = 86400 - (now % 86400)
+        refreshes_left = remaining // max(1, calls_per_refresh)
+        if refreshes_left <= 0:
+            return max(min_interval, until_reset)
+        return max(min_interval, until_reset / refreshes_left)
+
+    def share_interval(self, share: float, priority: str = BACKGROUND) -> float:
+        """
+        Interval (seconds) at which a periodic lane spends `share` of the
+        daily allowance for `priority` evenly over a day.
+        """
+        allowance = self.daily_budget
+        if priority == BACKGROUND:
+            allowance -= int(self.daily_budget * self.background_reserve)
+        return 86400 / max(1.0, allowance * share)
+
+    def status(self) -> Dict[str, float]:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return {
+                "used_today": self._used_today,
+                "remaining_today": max(0, self.daily_budget - self._used_today),
+                "daily_budget": self.daily_budget,
+                "tokens": round(self._tokens, 2),
+                "blocked_for": max(0.0, self._blocked_until - now),
+            }
+
+
+class QuotaRetry(Retry):
+    """
+    urllib3 Retry that reports every retry attempt to a QuotaLimiter, so
+    retries count against the budget and Retry-After pauses all callers.
+    """
+
+    limiter: Optional[QuotaLimiter] = None
+
+    def new(self, **kw) -> "QuotaRetry":
+        retry = super().new(**kw)
+        retry.limiter = self.limiter
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        if self.limiter is not None and response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after:
+                self.limiter.defer(retry_after)
+        tracer.instant("http.retry", "http", url=url or "",
+                       status=getattr(response, "status", None), error=str(error) if error else None)
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.limiter is not None:
+            self.limiter.record_call(budgeted="/onecall" in (url or ""))
+        return new_retry
+
+    def sleep(self, response=None):
+        with tracer.span("http.retry_wait", "http"):
+            super().sleep(response)
+
+
+_default_limiter: Optional[QuotaLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_default_limiter() -> QuotaLimiter:
+    """The limiter shared by every client in this process."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = QuotaLimiter()
+        return _default_limiter
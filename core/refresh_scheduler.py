@@ -0,0 +1,177 @@
+# core/refresh_scheduler.py
+"""
+Periodic auto-refresh for the dashboard.
+
+Runs on the Tk event loop through `after()` / `after_cancel()` (any object
+with those two methods works, which keeps it testable without a display).
+Every run re-arms the next one, so one failure never stops auto-refresh:
+
+  * the base interval comes from the `refresh.interval_seconds` preference,
+    stretched by QuotaLimiter.pace_interval() when the daily budget is low;
+  * each run gets +/- `jitter` so many open dashboards don't fire in step;
+  * consecutive failures back off exponentially up to `max_backoff`;
+  * an iconified window pauses refreshes, an unfocused one runs them
+    `unfocused_factor` times less often;
+  * after align_to(), runs land just past the provider's next update slot
+    instead of polling data that cannot have changed yet.
+
+The refresh itself may be asynchronous: the scheduler calls `callback()`
+and the owner reports the outcome with finished(ok). Refreshes started
+elsewhere (the Update button) call started() so they are timed too and
+push the next scheduled run back.
+"""
+import math
+import random
+import time
+from typing import Callable, Optional
+
+from core.rate_limit import FOREGROUND, QuotaLimiter
+
+
+class RefreshScheduler:
+    def __init__(self, widget, callback: Callable[[], None], interval: float,
+                 jitter: float = 0.1, max_backoff: float = 3600,
+                 unfocused_factor: float = 3.0,
+                 limiter: Optional[QuotaLimiter] = None, calls_per_refresh: int = 1,
+                 priority: str = FOREGROUND,
+                 rng: Callable[[], float] = random.random,
+                 clock: Callable[[], float] = time.time):
+        self._widget = widget
+        self._callback = callback
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.unfocused_factor = unfocused_factor
+        self.limiter = limiter
+        self.calls_per_refresh = calls_per_refresh
+        self.priority = priority        # which share of the daily budget paces it
+        self._rng = rng
+        self._clock = clock
+
+        self.failures = 0
+        self.paused = False
+        self.focused = True
+        self.next_run_at: Optional[float] = None   # wall-clock seconds
+        self.last_latency: Optional[float] = None
+        self._started_at: Optional[float] = None
+        self._slots: Optional[tuple] = None         # (next_update, cadence)
+        self._job = None
+
+    # -------- lifecycle ----------
+    def start(self) -> None:
+        self._arm()
+
+    def stop(self) -> None:
+        self._cancel()
+        self.next_run_at = None
+
+    def set_interval(self, seconds: float) -> None:
+        self.interval = seconds
+        self._arm()
+
+    def run_now(self) -> None:
+        """Refresh immediately; the next run is re-armed on finish."""
+        self._cancel()
+        self._fire()
+
+    def started(self) -> None:
+        """A refresh began outside the timer; hold the timer until finished()."""
+        self._cancel()
+        self.next_run_at = None
+        self._started_at = self._clock()
+
+    def finished(self, ok: bool) -> None:
+        """Report the outcome of the refresh started by callback()."""
+        if self._started_at is not None:
+            self.last_latency = self._clock() - self._started_at
+            self._started_at = None
+        self.failures = 0 if ok else self.failures + 1
+        self._arm()
+
+    def align_to(self, next_update: Optional[float], cadence: float = 0) -> None:
+        """Upstream data changes at next_update + k * cadence; aim just past those times."""
+        self._slots = (next_update, cadence) if next_update is not None else None
+
+    # -------- window state ----------
+    def set_visible(self, visible: bool) -> None:
+        """Pause while the window is iconified; refresh right away when it comes back."""
+        if visible == (not self.paused):
+            return
+        self.paused = not visible
+        if self.paused:
+            self._cancel()          # keep next_run_at to resume from
+        elif self.next_run_at is None or self._clock() >= self.next_run_at:
+            if self._started_at is None:
+                self.run_now()
+        else:
+            self._arm(self.next_run_at - self._clock())
+
+    def set_focused(self, focused: bool) -> None:
+        if focused != self.focused:
+            self.focused = focused
+            self._arm()
+
+    # -------- scheduling ----------
+    def next_delay(self) -> float:
+        """Seconds until the next run under the current state (before jitter)."""
+        delay = float(self.interval)
+        if self.limiter is not None:
+            delay = self.limiter.pace_interval(delay, self.calls_per_refresh, self.priority)
+        if not self.focused:
+            delay *= self.unfocused_factor
+        if self.failures:
+            delay = min(self.max_backoff, delay * 2 ** self.failures)
+        return delay
+
+    def _arm(self, delay: Optional[float] = None) -> None:
+        self._cancel()
+        if self.interval <= 0 or self._started_at is not None:
+            self.next_run_at = None
+            return
+        if delay is None:
+            if self._slots is not None and not self.failures:
+                delay = self._aligned(self.next_delay())
+            else:
+                delay = self.next_delay() * (1 + self.jitter * (2 * self._rng() - 1))
+        self.next_run_at = self._clock() + delay
+        if not self.paused:     # otherwise set_visible(True) picks it up
+            self._job = self._widget.after(int(delay * 1000), self._fire)
+
+    def _aligned(self, delay: float) -> float:
+        """First update slot at or after `delay`, plus a little jitter past it."""
+        next_update, cadence = self._slots
+        now = self._clock()
+        target = now + delay
+        if target > next_update and cadence > 0:
+            next_update += math.ceil((target - next_update) / cadence) * cadence
+        elif target > next_update:
+            next_update = target
+        return max(0.0, next_update - now) + self._rng() * self.jitter * max(cadence, 0)
+
+    def _fire(self) -> None:
+        self._job = None
+        self.started()
+        try:
+            self._callback()
+        except Exception:
+            self.finished(False)
+
+    def _cancel(self) -> None:
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+            self._job = None
+
+    # -------- status bar ----------
+    def status_text(self) -> str:
+        parts = []
+        if self.paused:
+            parts.append("Auto-refresh paused")
+        elif self._started_at is not None:
+            parts.append("Refreshing…")
+        elif self.next_run_at is not None:
+            parts.append("Next refresh " + time.strftime("%I:%M %p", time.localtime(self.next_run_at)))
+        if self.last_latency is not None:
+            parts.append(f"last {self.last_latency:.1f}s")
+        if self.failures:
+            parts.append(f"{self.failures} failed")
+        return " · ".join(parts)
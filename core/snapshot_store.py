@@ -0,0 +1,95 @@
+# core/snapshot_store.py
+"""
+Last-known snapshot per recently viewed city, persisted to disk so the
+dashboard can paint real weather at launch before any request returns.
+
+One gzip-compressed JSON file holds the canonical (metric) One Call bundle
+of up to `max_cities` (city, language) pairs, most recently saved last.
+Writes go to a temporary file that replaces the old one, so a crash never
+leaves a half-written store behind.
+"""
+import gzip
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from core.geocode_cache import normalize_city
+from core.weather_api import WeatherSnapshot
+
+logger = logging.getLogger(__name__)
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STORE_PATH = os.path.join(_REPO_ROOT, "data", "last_snapshots.json.gz")
+STORE_VERSION = 1
+
+
+class SnapshotStore:
+    def __init__(self, path: str = DEFAULT_STORE_PATH, max_cities: int = 8):
+        self.path = path
+        self.max_cities = max_cities
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._read()
+
+    def _read(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != STORE_VERSION:
+                return
+            for entry in data.get("cities", []):
+                self._entries[self._key(entry["city"], entry["lang"])] = entry
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable snapshot store {self.path} ({e})")
+
+    @staticmethod
+    def _key(city: str, lang: str) -> str:
+        return f"{normalize_city(city)}|{lang}"
+
+    def load(self, city: str, lang: str = "en") -> Optional[WeatherSnapshot]:
+        """Last saved snapshot for `city` in `lang` (canonical units), or None."""
+        with self._lock:
+            entry = self._entries.get(self._key(city, lang))
+        if entry is None:
+            return None
+        snap = WeatherSnapshot.from_bundle(entry["city"], entry["lat"], entry["lon"], entry["bundle"])
+        snap.fetched_at = entry["fetched_at"]
+        return snap
+
+    def save(self, snapshot: WeatherSnapshot, lang: str = "en") -> None:
+        """
+        Remember `snapshot` (any unit view; its canonical source is stored).
+        Its fetched_at is the bundle's download time, which prime() turns
+        back into the same freshness after a restart.
+        """
+        base = snapshot.source or snapshot
+        entry = {"city": base.city, "lang": lang, "lat": base.lat, "lon": base.lon,
+                 "fetched_at": base.fetched_at, "bundle": base.bundle}
+        with self._lock:
+            key = self._key(base.city, lang)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_cities:
+                self._entries.popitem(last=False)
+            payload = {"version": STORE_VERSION, "cities": list(self._entries.values())}
+            self._write(payload)
+
+    def cities(self) -> List[str]:
+        """Stored city names, most recent first."""
+        with self._lock:
+            return [e["city"] for e in reversed(self._entries.values())]
+
+    def _write(self, payload: Dict) -> None:
+        tmp = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist snapshots to {self.path} ({e})")
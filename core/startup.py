@@ -0,0 +1,64 @@
+# core/startup.py
+"""
+Startup timing: phase marks from process start to the first painted window.
+
+main.py imports this first, marks phases as it goes, and the dashboard
+calls first_paint() once its window is drawn. With
+WEATHER_STARTUP_REPORT=1 the report is printed to stderr; it is always
+logged at DEBUG. Run once with WEATHER_EAGER_IMPORTS=1 to get the
+"before" number (every heavy module imported up front).
+"""
+import logging
+import os
+import sys
+import time
+from typing import List, Tuple
+
+from core import lazy_import
+from core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+_T0 = time.perf_counter()
+_marks: List[Tuple[str, float]] = []
+_reported = False
+
+
+def mark(phase: str) -> float:
+    """Record that `phase` finished now; returns ms since start."""
+    ms = (time.perf_counter() - _T0) * 1000
+    _marks.append((phase, ms))
+    tracer.instant(phase, "startup")
+    return ms
+
+
+def report() -> str:
+    lines = ["Startup timing (ms since launch)"]
+    prev = 0.0
+    for phase, ms in _marks:
+        lines.append(f"  {phase:<14} {ms:8.1f}  (+{ms - prev:.1f})")
+        prev = ms
+    loaded = lazy_import.import_timings()
+    if loaded:
+        lines.append("  lazily imported: " + ", ".join(
+            f"{name} {sec * 1000:.0f}ms" for name, sec in sorted(loaded.items())))
+    deferred = lazy_import.pending()
+    if deferred:
+        lines.append("  still deferred: " + ", ".join(deferred))
+    mode = "eager" if lazy_import.EAGER else "lazy"
+    lines.append(f"  imports: {mode}")
+    return "\n".join(lines)
+
+
+def first_paint() -> None:
+    """Mark time-to-first-paint and emit the report (once)."""
+    global _reported
+    if _reported:
+        return
+    _reported = True
+    mark("first_paint")
+    tracer.complete("startup", "startup", 0, tracer.now())
+    text = report()
+    logger.debug(text)
+    if os.getenv("WEATHER_STARTUP_REPORT", "") not in ("", "0"):
+        print(text, file=sys.stderr)
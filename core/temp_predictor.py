@@ -1,7 +1,11 @@
 import numpy as np
-from sklearn.linear_model import LinearRegression
 from typing import List
 
+from core.lazy_import import lazy_import
+
+# scikit-learn is only imported when a prediction is first needed
+linear_model = lazy_import("sklearn.linear_model")
+
 class TempPredictor:
     """
     Temperature prediction using simple linear regression
@@ -9,13 +13,18 @@ class TempPredictor:
     """
     
     def __init__(self):
-        self.model = LinearRegression()
+        self._model = None
         # Sample training data (day_number, temperature)
         self.X_train = np.array([1, 2, 3, 4, 5]).reshape(-1, 1)  # Day numbers
         self.y_train = np.array([72, 74, 76, 78, 80])  # Sample temperatures
-        
-        # Train the model
-        self.model.fit(self.X_train, self.y_train)
+
+    @property
+    def model(self):
+        """The fitted regression, trained on first use."""
+        if self._model is None:
+            self._model = linear_model.LinearRegression()
+            self._model.fit(self.X_train, self.y_train)
+        return self._model
     
     def predict(self, day_numbers: List[int]) -> List[float]:
         """
@@ -0,0 +1,166 @@
+# core/tracing.py
+"""
+Chrome / Perfetto trace recording for profiling a startup and a few
+refresh cycles on a real machine.
+
+Enable from main.py with `--trace [PATH] [--trace-cycles N]`, or with
+WEATHER_TRACE=PATH (1 for the default path) and WEATHER_TRACE_CYCLES=N.
+The trace covers module imports (main.py's up-front imports as one span,
+later lazy ones individually through an import hook), every span recorded through core.metrics (HTTP requests, refresh
+phases, render steps), retries and their back-off, icon loads, Treeview
+updates, chart draws and Team Compare CSV reads. After N refresh cycles
+(default 1) the file is written and recording stops; it is also written at
+exit if the app closes earlier. Open it at https://ui.perfetto.dev or
+chrome://tracing.
+"""
+import atexit
+import builtins
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_NOOP = nullcontext()
+
+
+def default_trace_path() -> str:
+    return os.path.join(_REPO_ROOT, "data", time.strftime("trace-%Y%m%d-%H%M%S.json"))
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.cycles = 1
+        self._cycles_done = 0
+        self._events: List[Dict] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._pid = os.getpid()
+        self._real_import = None
+
+    def now(self) -> float:
+        """Microseconds since the tracer was created (trace timestamps)."""
+        return (time.perf_counter() - self._t0) * 1e6
+
+    # -------- lifecycle ----------
+    def start(self, path: Optional[str] = None, cycles: int = 1, imports: bool = True) -> None:
+        self.path = path or default_trace_path()
+        self.cycles = max(1, cycles)
+        self.enabled = True
+        if imports:
+            self._hook_imports()
+        atexit.register(self.finish)
+        logger.info(f"Tracing startup and {self.cycles} refresh cycle(s) to {self.path}")
+
+    def cycle_done(self) -> None:
+        """A refresh cycle finished (rendered or failed); stop after the last one."""
+        if not self.enabled:
+            return
+        self._cycles_done += 1
+        self.instant("refresh.cycle", "refresh", n=self._cycles_done)
+        if self._cycles_done >= self.cycles:
+            self.finish()
+
+    def finish(self) -> Optional[str]:
+        """Stop recording and write the trace (once)."""
+        if not self.enabled:
+            return None
+        self.enabled = False
+        self._unhook_imports()
+        path = self.write(self.path)
+        print(f"Trace written to {path}", file=sys.stderr)
+        return path
+
+    def write(self, path: str) -> str:
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        meta = [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                for tid, name in threads.items()]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    # -------- events ----------
+    def _emit(self, event: Dict) -> None:
+        tid = threading.get_ident()
+        event["pid"] = self._pid
+        event["tid"] = tid
+        with self._lock:
+            if tid not in self._threads:
+                self._threads[tid] = threading.current_thread().name
+            self._events.append(event)
+
+    def complete(self, name: str, cat: str, ts: float, dur: float, **args) -> None:
+        """Record a finished span that started at `ts` (see now()) and lasted `dur` µs."""
+        if self.enabled:
+            self._emit({"name": name, "cat": cat, "ph": "X", "ts": ts, "dur": dur, "args": args})
+
+    def instant(self, name: str, cat: str, **args) -> None:
+        if self.enabled:
+            self._emit({"name": name, "cat": cat, "ph": "i", "s": "t", "ts": self.now(), "args": args})
+
+    def span(self, name: str, cat: Optional[str] = None, **args):
+        """Context manager recording its body as one trace event (no-op while off)."""
+        if not self.enabled:
+            return _NOOP
+        return self._span(name, cat or name.split(".")[0], args)
+
+    @contextmanager
+    def _span(self, name: str, cat: str, args: Dict):
+        ts = self.now()
+        try:
+            yield
+        finally:
+            self.complete(name, cat, ts, self.now() - ts, **args)
+
+    # -------- import hook ----------
+    def _hook_imports(self) -> None:
+        if self._real_import is not None:
+            return
+        real_import = self._real_import = builtins.__import__
+        modules = sys.modules
+        tracer = self
+
+        def traced_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Only first-time loads are interesting; cached imports stay cheap
+            if level or name in modules or not tracer.enabled:
+                return real_import(name, globals, locals, fromlist, level)
+            ts = tracer.now()
+            try:
+                return real_import(name, globals, locals, fromlist, level)
+            finally:
+                tracer.complete(f"import {name}", "import", ts, tracer.now() - ts)
+
+        builtins.__import__ = traced_import
+
+    def _unhook_imports(self) -> None:
+        if self._real_import is not None:
+            builtins.__import__ = self._real_import
+            self._real_import = None
+
+
+tracer = Tracer()
+
+
+def configure(argv_path: Optional[str] = None, argv_cycles: Optional[int] = None) -> bool:
+    """Start tracing from command-line values or the environment; True if on."""
+    path = argv_path
+    if path is None:
+        env = os.getenv("WEATHER_TRACE", "")
+        if env in ("", "0"):
+            return False
+        path = "" if env == "1" else env
+    cycles = argv_cycles or int(os.getenv("WEATHER_TRACE_CYCLES", "1") or 1)
+    tracer.start(path or None, cycles)
+    return True
@@ -0,0 +1,163 @@
+# core/transport.py
+"""
+Pluggable HTTP transport for WeatherAPI.
+
+- LiveTransport      talks to the network through a requests.Session (default)
+- RecordingTransport wraps another transport and writes every geocode /
+                     One Call exchange to a cassette file
+- ReplayTransport    serves responses from a cassette, optionally with
+                     simulated latency, so the refresh pipeline can be run and
+                     benchmarked offline and deterministically
+
+Cassettes are JSON (gzip-compressed when the path ends in .gz). The API key
+is never written to them.
+
+transport_from_env() picks a transport from environment variables:
+  WEATHER_CASSETTE=path/to/cassette.json.gz
+  WEATHER_CASSETTE_MODE=record | replay       (default: replay)
+  WEATHER_REPLAY_LATENCY=0.25                 (seconds per request, replay only)
+"""
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+_SECRET_PARAMS = ("appid",)
+
+
+def request_key(url: str, params: Optional[dict]) -> str:
+    """Stable lookup key for a request: URL plus sorted params, minus the API key."""
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k not in _SECRET_PARAMS)
+    return url + "?" + "&".join(f"{k}={v}" for k, v in items)
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Transport:
+    """What WeatherAPI needs from HTTP: a GET returning a requests.Response."""
+
+    def get(self, url: str, params: Optional[dict] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        raise NotImplementedError
+
+
+class LiveTransport(Transport):
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def get(self, url, params=None, timeout=None):
+        return self.session.get(url, params=params, timeout=timeout)
+
+
+class RecordingTransport(Transport):
+    """Pass requests through to `inner` and append each exchange to `path`."""
+
+    def __init__(self, inner: Transport, path: str):
+        self.inner = inner
+        self.path = path
+        self._lock = threading.Lock()
+        self._interactions: List[Dict] = []
+        if os.path.exists(path):
+            self._interactions = _load(path)
+
+    def get(self, url, params=None, timeout=None):
+        response = self.inner.get(url, params=params, timeout=timeout)
+        try:
+            body, kind = response.json(), "json"
+        except ValueError:
+            body, kind = response.text, "text"
+        entry = {
+            "key": request_key(url, params),
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items()
+                        if k.lower() in ("content-type", "retry-after")},
+            "kind": kind,
+            "body": body,
+        }
+        with self._lock:
+            self._interactions.append(entry)
+            self._save()
+        return response
+
+    def _save(self) -> None:
+        with _open(self.path, "w") as f:
+            json.dump({"version": CASSETTE_VERSION, "interactions": self._interactions},
+                      f, separators=(",", ":"))
+
+
+class ReplayTransport(Transport):
+    """
+    Serve recorded responses. Repeated requests for the same key cycle
+    through every recording of it, so a cassette with several refreshes
+    replays them in order. Unknown requests raise ConnectionError, exactly
+    like being offline.
+    """
+
+    def __init__(self, path: str, latency: float = 0.0):
+        self.path = path
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, List[Dict]] = {}
+        self._cursor: Dict[str, int] = {}
+        for entry in _load(path):
+            self._by_key.setdefault(entry["key"], []).append(entry)
+
+    def get(self, url, params=None, timeout=None):
+        key = request_key(url, params)
+        with self._lock:
+            entries = self._by_key.get(key)
+            if not entries:
+                raise requests.exceptions.ConnectionError(f"No cassette entry for {key}")
+            i = self._cursor.get(key, 0)
+            self._cursor[key] = i + 1
+            entry = entries[i % len(entries)]
+        if self.latency:
+            time.sleep(self.latency)
+        return _build_response(url, entry)
+
+
+def _load(path: str) -> List[Dict]:
+    with _open(path, "r") as f:
+        data = json.load(f)
+    if data.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version in {path}")
+    return data["interactions"]
+
+
+def _build_response(url: str, entry: Dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+    body = entry["body"]
+    text = json.dumps(body) if entry.get("kind") == "json" else body
+    response._content = text.encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = url
+    return response
+
+
+def transport_from_env(session: requests.Session) -> Transport:
+    """Live transport unless WEATHER_CASSETTE selects record / replay."""
+    path = os.getenv("WEATHER_CASSETTE")
+    if not path:
+        return LiveTransport(session)
+    mode = os.getenv("WEATHER_CASSETTE_MODE", "replay").lower()
+    if mode == "record":
+        logger.info(f"Recording API traffic to {path}")
+        return RecordingTransport(LiveTransport(session), path)
+    latency = float(os.getenv("WEATHER_REPLAY_LATENCY", "0") or 0)
+    logger.info(f"Replaying API traffic from {path}")
+    return ReplayTransport(path, latency=latency)
@@ -0,0 +1,162 @@
+# core/ui_scheduler.py
+"""
+One timer for every periodic task on the Tk event loop.
+
+The dashboard's clock, banner flash, worker polling, auto-refresh and alert
+lane all register here instead of running their own `after()` chains:
+
+  * tasks are named, so registering one again replaces it instead of
+    stacking a second chain (the banner flash used to speed up that way);
+  * only one Tk `after()` is pending at any time, aimed at the earliest
+    task, and every task due within the same frame runs on that one tick,
+    so callbacks per second stay bounded however many tasks exist;
+  * each tick measures how late it fired, which is how long the event loop
+    was blocked; lag past `lag_warn_ms` is logged.
+
+It also provides after() / after_cancel(), so RefreshScheduler (or anything
+else written against a Tk widget) can run on it unchanged. Any object with
+after() / after_cancel() can drive it, which keeps it testable without a
+display.
+"""
+import heapq
+import itertools
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Task:
+    __slots__ = ("fn", "interval", "due", "gen")
+
+    def __init__(self, fn: Callable[[], None], interval: Optional[float], due: float, gen: int):
+        self.fn = fn
+        self.interval = interval    # ms; None for one-shot tasks
+        self.due = due
+        self.gen = gen
+
+
+class UiScheduler:
+    def __init__(self, widget, frame_ms: float = 16, lag_warn_ms: float = 250,
+                 clock: Callable[[], float] = time.monotonic):
+        self._widget = widget
+        self.frame_ms = frame_ms
+        self.lag_warn_ms = lag_warn_ms
+        self._clock = clock
+        self._tasks: Dict[str, _Task] = {}
+        self._heap: List[tuple] = []          # (due, gen, name); stale entries skipped
+        self._gen = itertools.count()
+        self._ids = itertools.count(1)
+        self._job = None
+        self._job_due: Optional[float] = None
+        self.closed = False
+
+        self.ticks = 0
+        self.callbacks = 0
+        self.lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    def _now(self) -> float:
+        return self._clock() * 1000
+
+    # -------- tasks ----------
+    def every(self, name: str, interval_ms: float, fn: Callable[[], None],
+              delay_ms: Optional[float] = None) -> None:
+        """Run `fn` every `interval_ms` (first after `delay_ms`, default one interval)."""
+        self._put(name, fn, interval_ms, interval_ms if delay_ms is None else delay_ms)
+
+    def once(self, name: str, delay_ms: float, fn: Callable[[], None]) -> None:
+        """Run `fn` once after `delay_ms`, replacing any pending task called `name`."""
+        self._put(name, fn, None, delay_ms)
+
+    def cancel(self, name: str) -> None:
+        self._tasks.pop(name, None)     # its heap entry goes stale
+
+    def scheduled(self, name: str) -> bool:
+        return name in self._tasks
+
+    # Tk-compatible surface for code written against a widget
+    def after(self, ms: float, fn: Callable[[], None]) -> str:
+        name = f"after#{next(self._ids)}"
+        self.once(name, ms, fn)
+        return name
+
+    def after_cancel(self, name: str) -> None:
+        self.cancel(name)
+
+    def close(self) -> None:
+        """
+        Drop every task and the pending timer; later calls are no-ops. Call
+        before destroying the widget, even from inside a task.
+        """
+        self.closed = True
+        self._tasks.clear()
+        self._heap.clear()
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+            self._job = self._job_due = None
+
+    def stats(self) -> Dict[str, float]:
+        return {"tasks": len(self._tasks), "ticks": self.ticks, "callbacks": self.callbacks,
+                "lag_ms": round(self.lag_ms, 1), "max_lag_ms": round(self.max_lag_ms, 1)}
+
+    # -------- loop ----------
+    def _put(self, name: str, fn, interval: Optional[float], delay: float) -> None:
+        if self.closed:
+            return
+        task = _Task(fn, interval, self._now() + max(0.0, delay), next(self._gen))
+        self._tasks[name] = task
+        heapq.heappush(self._heap, (task.due, task.gen, name))
+        self._arm()
+
+    def _earliest(self) -> Optional[float]:
+        while self._heap:
+            due, gen, name = self._heap[0]
+            task = self._tasks.get(name)
+            if task is not None and task.gen == gen:
+                return due
+            heapq.heappop(self._heap)
+        return None
+
+    def _arm(self) -> None:
+        if self.closed:
+            return
+        due = self._earliest()
+        if due is None or (self._job is not None and self._job_due <= due):
+            return
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+        self._job_due = due
+        self._job = self._widget.after(max(0, int(round(due - self._now()))), self._tick)
+
+    def _tick(self) -> None:
+        now = self._now()
+        self.lag_ms = max(0.0, now - self._job_due)
+        self.max_lag_ms = max(self.max_lag_ms, self.lag_ms)
+        if self.lag_ms > self.lag_warn_ms:
+            logger.warning(f"UI event loop lagged {self.lag_ms:.0f} ms")
+        self._job = self._job_due = None
+        self.ticks += 1
+
+        # tasks due within this frame run now; a beat pushed to the horizon waits for the next tick
+        horizon = now + self.frame_ms
+        while not self.closed:
+            due = self._earliest()
+            if due is None or due >= horizon:
+                break
+            _, gen, name = heapq.heappop(self._heap)
+            task = self._tasks[name]
+            if task.interval is None:
+                del self._tasks[name]
+            else:
+                # next beat from the planned time; skip beats lost to lag
+                task.due = max(task.due + task.interval, now + self.frame_ms)
+                task.gen = next(self._gen)
+                heapq.heappush(self._heap, (task.due, task.gen, name))
+            self.callbacks += 1
+            try:
+                task.fn()
+            except Exception:
+                logger.exception(f"UI task '{name}' failed")
+        self._arm()
@@ -0,0 +1,87 @@
+# core/units.py
+"""
+Client-side unit conversion for One Call bundles.
+
+Bundles are always fetched (and cached) in CANONICAL_UNITS; views in other
+unit systems are produced here without touching the network. Each field
+group is converted in one NumPy pass over every record in the bundle
+(current, minutely, hourly, daily).
+"""
+import copy
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+CANONICAL_UNITS = "metric"          # °C, m/s, hPa
+WIND_UNITS = ("mph", "km/h", "m/s")
+
+TEMP_FIELDS = ("temp", "feels_like", "dew_point")
+WIND_FIELDS = ("wind_speed", "wind_gust")
+PRESSURE_FIELDS = ("pressure",)
+
+_HPA_TO_INHG = 0.0295299830714
+_WIND_FACTORS = {"m/s": 1.0, "km/h": 3.6, "mph": 2.2369362920544}
+
+
+def default_wind_unit(units: str) -> str:
+    return "mph" if units == "imperial" else "m/s"
+
+
+def pressure_unit(units: str) -> str:
+    return "inHg" if units == "imperial" else "hPa"
+
+
+def temp_symbol(units: str) -> str:
+    return "°F" if units == "imperial" else "°C"
+
+
+def _records(bundle: Dict) -> List[Dict]:
+    recs = []
+    if isinstance(bundle.get("current"), dict):
+        recs.append(bundle["current"])
+    for lane in ("minutely", "hourly", "daily"):
+        recs.extend(r for r in bundle.get(lane) or [] if isinstance(r, dict))
+    return recs
+
+
+def _collect(records: List[Dict], fields: Tuple[str, ...]) -> List[Tuple[Dict, str]]:
+    """(container, key) refs for every numeric value of `fields`, including
+    nested dicts such as daily temp {min, max, day, ...}."""
+    refs = []
+    for rec in records:
+        for f in fields:
+            v = rec.get(f)
+            if isinstance(v, dict):
+                refs.extend((v, k) for k, x in v.items() if isinstance(x, (int, float)))
+            elif isinstance(v, (int, float)):
+                refs.append((rec, f))
+    return refs
+
+
+def _apply(refs: List[Tuple[Dict, str]], fn: Callable[[np.ndarray], np.ndarray]) -> None:
+    if not refs:
+        return
+    values = np.fromiter((c[k] for c, k in refs), dtype=float, count=len(refs))
+    for (c, k), v in zip(refs, np.round(fn(values), 2).tolist()):
+        c[k] = v
+
+
+def convert_bundle(bundle: Dict, units: str, wind_speed: Optional[str] = None) -> Dict:
+    """
+    Return a copy of a canonical (metric) bundle expressed in `units`
+    ("imperial" | "metric") with wind speeds in `wind_speed`
+    ("mph" | "km/h" | "m/s"; defaults to the unit system's usual one).
+    """
+    wind_speed = wind_speed or default_wind_unit(units)
+    if wind_speed not in _WIND_FACTORS:
+        raise ValueError(f"Unknown wind speed unit '{wind_speed}'")
+
+    out = copy.deepcopy(bundle)
+    records = _records(out)
+    if units == "imperial":
+        _apply(_collect(records, TEMP_FIELDS), lambda c: c * 9.0 / 5.0 + 32.0)
+        _apply(_collect(records, PRESSURE_FIELDS), lambda p: p * _HPA_TO_INHG)
+    if wind_speed != "m/s":
+        factor = _WIND_FACTORS[wind_speed]
+        _apply(_collect(records, WIND_FIELDS), lambda w: w * factor)
+    return out
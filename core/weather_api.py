@@ -1,104 +1,692 @@
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import asyncio
 import logging
-from typing import Dict, Tuple
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from core.forecast_model import ForecastModel, SeriesBlock
+from core.gazetteer import Gazetteer, get_default_gazetteer
+from core.geocode_cache import GeocodeCache, normalize_city
+from core.metrics import metrics
+from core.rate_limit import (BACKGROUND, FOREGROUND, QuotaLimiter, QuotaRetry,
+                             get_default_limiter)
+from core.transport import Transport, transport_from_env
+from core.units import CANONICAL_UNITS, convert_bundle, default_wind_unit
 
 logger = logging.getLogger(__name__)
 
+# Status codes worth retrying; shared by the sync and async clients.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Opt-in data lanes. Each is its own One Call request (and cache entry)
+# excluding everything else, so the default daily bundle stays small.
+LANE_EXCLUDES = {
+    "hourly":   "current,minutely,daily,alerts",    # 48 h
+    "minutely": "current,hourly,daily,alerts",      # 60 min
+}
+
+# Alerts-only request for AlertPoller: a few hundred bytes when quiet.
+ALERTS_EXCLUDE = "current,minutely,hourly,daily"
+
+# One Call refreshes `current` roughly every 10 minutes. A cached bundle
+# cannot be superseded before its observation time (current.dt) plus this.
+PROVIDER_CADENCE = 600
+UPDATE_GRACE = 30        # give the provider a moment past the expected update
+LATE_RECHECK = 120       # min seconds between refetches when an update is overdue
+
+# One Call coordinates are sent with 4 decimals (~11 m): gazetteer float32
+# values and geocoder floats for the same place then make the same request.
+COORD_DECIMALS = 4
+
+
+def observed_at(bundle: Dict) -> Optional[int]:
+    """Observation time of a bundle (current.dt), or None for lanes without `current`."""
+    current = bundle.get("current")
+    if isinstance(current, dict) and current.get("dt"):
+        return int(current["dt"])
+    return None
+
+
+def inject_timezone(bundle: Dict) -> Dict:
+    """Compatibility: expose timezone offset on current as "timezone" (seconds)."""
+    try:
+        tz_off = bundle.get("timezone_offset", 0)
+        if "current" in bundle and isinstance(bundle["current"], dict):
+            bundle["current"]["timezone"] = tz_off
+    except Exception:
+        pass
+    return bundle
+
+
+@dataclass
+class WeatherSnapshot:
+    """
+    Everything the dashboard renders for one city, taken from a single
+    One Call bundle (one geocode + one forecast request).
+
+    Snapshots built by WeatherAPI hold canonical (metric) data; in_units()
+    returns converted views, memoized per unit system, so switching units
+    never refetches.
+    """
+    city: str
+    lat: float
+    lon: float
+    current: Dict
+    daily: List[Dict]
+    alerts: List[Dict]
+    timezone_offset: int = 0
+    fetched_at: float = field(default_factory=time.time)
+    units: str = CANONICAL_UNITS
+    wind_unit: str = "m/s"
+    bundle: Dict = field(default_factory=dict, repr=False)
+    source: Optional["WeatherSnapshot"] = field(default=None, repr=False, compare=False)
+    _views: Dict = field(default_factory=dict, repr=False, compare=False)
+    _model: Optional[ForecastModel] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_bundle(cls, city: str, lat: float, lon: float, bundle: Dict,
+                    units: str = CANONICAL_UNITS, wind_unit: str = "m/s") -> "WeatherSnapshot":
+        return cls(
+            city=city,
+            lat=lat,
+            lon=lon,
+            current=bundle.get("current", {}),
+            daily=bundle.get("daily", []),
+            alerts=bundle.get("alerts", []),
+            timezone_offset=bundle.get("timezone_offset", 0),
+            units=units,
+            wind_unit=wind_unit,
+            bundle=bundle,
+        )
+
+    @property
+    def model(self) -> ForecastModel:
+        """Parsed ForecastModel (slots records + NumPy columns), built on first use."""
+        if self._model is None:
+            self._model = ForecastModel.from_bundle(self.bundle)
+        return self._model
+
+    def in_units(self, units: str, wind_speed: Optional[str] = None) -> "WeatherSnapshot":
+        """View of this snapshot in `units` / `wind_speed`; pure in-memory, memoized."""
+        base = self.source or self
+        wind_speed = wind_speed or default_wind_unit(units)
+        if (units, wind_speed) == (base.units, base.wind_unit):
+            return base
+        key = (units, wind_speed)
+        view = base._views.get(key)
+        if view is None:
+            view = WeatherSnapshot.from_bundle(base.city, base.lat, base.lon,
+                                               convert_bundle(base.bundle, units, wind_speed),
+                                               units=units, wind_unit=wind_speed)
+            view.fetched_at = base.fetched_at
+            view.source = base
+            base._views[key] = view
+        return view
+
+    def with_alerts(self, alerts: List[Dict]) -> "WeatherSnapshot":
+        """Copy with `alerts` in place of the bundle's, in the same units."""
+        base = self.source or self
+        snap = WeatherSnapshot.from_bundle(base.city, base.lat, base.lon, dict(base.bundle, alerts=alerts),
+                                           units=base.units, wind_unit=base.wind_unit)
+        snap.fetched_at = base.fetched_at
+        return snap.in_units(self.units, self.wind_unit)
+
+
+@dataclass
+class SnapshotResult:
+    """Outcome for one city of a get_snapshots() batch."""
+    city: str
+    snapshot: Optional[WeatherSnapshot] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ResponseCache:
+    """
+    Bounded in-memory cache of One Call bundles.
+
+    An entry is fresh until newer data can exist: the first update slot
+    (observation time + n * `cadence`, plus grace) after it was fetched,
+    but never longer than `ttl` seconds and never sooner than `recheck`
+    seconds after the fetch. Bundles without an
+    observation time (hourly / minutely lanes) are fresh for `ttl`.
+    Expired entries are still served for `stale_ttl` more seconds, flagged
+    stale so the caller can revalidate in the background. Least recently
+    used entries are evicted beyond `max_entries`.
+    """
+
+    FRESH = "fresh"
+    STALE = "stale"
+
+    def __init__(self, ttl: float = 600, stale_ttl: float = 3600, max_entries: int = 64,
+                 cadence: float = PROVIDER_CADENCE, grace: float = UPDATE_GRACE,
+                 recheck: float = LATE_RECHECK, clock: Callable[[], float] = time.time):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.cadence = cadence
+        self.grace = grace
+        self.recheck = recheck
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        # key -> (fresh_until, fetched_at, bundle)
+        self._entries: "OrderedDict[tuple, Tuple[float, float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(lat: float, lon: float, units: str, lang: str, exclude: str) -> tuple:
+        parts = tuple(sorted(p.strip() for p in exclude.split(",") if p.strip()))
+        return round(lat, 3), round(lon, 3), units, lang, parts
+
+    def lookup(self, key: tuple, max_stale: Optional[float] = None) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Return (bundle, FRESH | STALE) or (None, None) on a miss; updates
+        counters. An entry expired more than `max_stale` seconds ago counts
+        as a miss but is kept for callers that accept older data.
+        """
+        return self.lookup_entry(key, max_stale)[:2]
+
+    def lookup_entry(self, key: tuple, max_stale: Optional[float] = None
+                     ) -> Tuple[Optional[Dict], Optional[str], Optional[float]]:
+        """lookup() plus when the bundle was downloaded (None on a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                fresh_until, fetched, bundle = entry
+                overdue = self._clock() - fresh_until
+                if overdue <= 0:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return bundle, self.FRESH, fetched
+                if max_stale is not None and overdue > max_stale and overdue <= self.stale_ttl:
+                    self.misses += 1
+                    return None, None, None
+                if overdue <= self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stale += 1
+                    return bundle, self.STALE, fetched
+                del self._entries[key]
+            self.misses += 1
+            return None, None, None
+
+    def peek(self, key: tuple) -> Optional[Dict]:
+        """The cached bundle for `key` if it is fresh; touches no counters or LRU order."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() <= entry[0]:
+                return entry[2]
+            return None
+
+    def fresh_until(self, fetched: float, bundle: Dict) -> float:
+        """When newer data than `bundle` (fetched at `fetched`) may exist upstream."""
+        until = fetched + self.ttl
+        observed = observed_at(bundle)
+        if observed is not None and self.cadence > 0:
+            slots = max(1, math.ceil((fetched - observed) / self.cadence))
+            expected = observed + slots * self.cadence + self.grace
+            until = min(until, max(expected, fetched + self.recheck))
+        return until
+
+    def next_update(self, key: tuple) -> Optional[float]:
+        """fresh_until of the cached entry for `key`, or None when not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def store(self, key: tuple, bundle: Dict, fetched_at: Optional[float] = None) -> float:
+        """
+        Cache `bundle`; pass `fetched_at` when it was downloaded earlier (e.g.
+        from disk). Returns the download time recorded for it.
+        """
+        fetched = self._clock() if fetched_at is None else fetched_at
+        with self._lock:
+            self._entries[key] = (self.fresh_until(fetched, bundle), fetched, bundle)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fetched
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key: the first caller runs the
+    work, and every caller arriving while it is in flight waits for and
+    shares its result or exception. do() serves threads (e.g. the
+    get_snapshots pool); do_async() serves asyncio tasks.
+    """
+
+    def __init__(self):
+        self.shared = 0   # callers that piggy-backed on an in-flight call
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], object]):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def do_async(self, key: Hashable, coro_fn: Callable[[], Awaitable]):
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = self._tasks[task_key] = loop.create_task(coro_fn())
+            task.add_done_callback(lambda _t: self._tasks.pop(task_key, None))
+        else:
+            self.shared += 1
+        # shield: one waiter being cancelled must not cancel the shared request
+        return await asyncio.shield(task)
+
+
+class AlertPoller:
+    """
+    Fast lane for alerts. poll() asks One Call for alerts only and returns
+    the new list when the alert set for that place changed since it was last
+    seen (by a poll or a full refresh passed to reconcile()), else None, so
+    the dashboard only redraws alerts when there is something new.
+    """
+
+    def __init__(self, api: "WeatherAPI", clock: Callable[[], float] = time.time):
+        self._api = api
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._seen: Dict[tuple, Tuple[float, tuple, List[Dict]]] = {}   # place -> (at, signature, alerts)
+
+    @staticmethod
+    def signature(alerts: List[Dict]) -> tuple:
+        return tuple((a.get("sender_name", ""), a.get("event", ""), a.get("start", 0), a.get("end", 0),
+                      a.get("description", "")) for a in alerts)
+
+    @staticmethod
+    def _place(lat: float, lon: float) -> tuple:
+        return round(lat, 3), round(lon, 3)
+
+    def poll(self, lat: float, lon: float) -> Optional[List[Dict]]:
+        """Worker thread: fetch alerts; the new list if they changed, else None."""
+        at = self._clock()
+        return self._observe(self._place(lat, lon), self._api.get_alerts_only(lat, lon), at)
+
+    def reconcile(self, snapshot: WeatherSnapshot) -> WeatherSnapshot:
+        """
+        `snapshot` with the newest alerts known for its place: a full bundle
+        served from the cache can be older than the last poll.
+        """
+        place = self._place(snapshot.lat, snapshot.lon)
+        with self._lock:
+            held = self._seen.get(place)
+        if held is not None and held[0] > snapshot.fetched_at:
+            if held[1] != self.signature(snapshot.alerts):
+                return snapshot.with_alerts(held[2])
+            return snapshot
+        self._observe(place, snapshot.alerts, snapshot.fetched_at)
+        return snapshot
+
+    def _observe(self, place: tuple, alerts: List[Dict], at: float) -> Optional[List[Dict]]:
+        sig = self.signature(alerts)
+        with self._lock:
+            held = self._seen.get(place)
+            if held is not None and held[0] > at:
+                return None     # a newer observation already landed
+            self._seen[place] = (at, sig, alerts)
+        return alerts if held is None or held[1] != sig else None
+
+
 class WeatherAPI:
     """
     OpenWeatherMap API client using One Call API 3.0 (student plan)
     """
 
     BASE_URL = "https://api.openweathermap.org/data/3.0"
+    GEO_URL = "https://api.openweathermap.org/geo/1.0/direct"
+    KEY_CHECK_URL = "https://api.openweathermap.org/data/2.5/weather"
+    DEFAULT_POOL_SIZE = 10  # requests' own default
 
     def __init__(self, api_key: str, timeout: int = 10, max_retries: int = 3,
-                 units: str = "imperial", lang: str = "en"):
+                 units: str = "imperial", lang: str = "en",
+                 geocode_cache: Optional[GeocodeCache] = None,
+                 cache_ttl: float = 600, cache_stale_ttl: float = 3600,
+                 wind_speed: Optional[str] = None,
+                 limiter: Optional[QuotaLimiter] = None,
+                 transport: Optional[Transport] = None,
+                 gazetteer: Optional[Gazetteer] = None):
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
-        self.units = units
+        self.units = units            # display units; requests always use CANONICAL_UNITS
+        self.wind_speed = wind_speed
         self.lang = lang
+        self.geocode_cache = geocode_cache if geocode_cache is not None else GeocodeCache()
+        self.gazetteer = gazetteer if gazetteer is not None else get_default_gazetteer()
+        self.response_cache = ResponseCache(ttl=cache_ttl, stale_ttl=cache_stale_ttl)
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+        self._inflight = SingleFlight()
+        self._lane_views: Dict[tuple, tuple] = {}
+        # Shared by every client in the process unless one is passed in
+        self.limiter = limiter if limiter is not None else get_default_limiter()
 
-        retry = Retry(
+        self._retry = QuotaRetry(
             total=max_retries,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            status_forcelist=list(RETRY_STATUSES)
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        self._retry.limiter = self.limiter
         self.session = requests.Session()
+        self._mount_adapter(self.DEFAULT_POOL_SIZE)
+        # Live by default; WEATHER_CASSETTE switches to record / replay
+        self.transport = transport if transport is not None else transport_from_env(self.session)
+
+    def _mount_adapter(self, pool_size: int) -> None:
+        """(Re)mount the retrying adapter with room for `pool_size` open connections."""
+        adapter = HTTPAdapter(max_retries=self._retry,
+                              pool_connections=pool_size, pool_maxsize=pool_size)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
+        self._pool_size = pool_size
 
     # -------- public setters (used by GUI) ----------
     def set_units(self, units: str):
+        """Change display units. Cached data is reused; nothing is refetched."""
         self.units = units
 
+    def set_wind_speed(self, wind_speed: Optional[str]):
+        self.wind_speed = wind_speed
+
     def set_lang(self, lang: str):
         self.lang = lang
 
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit / miss / stale counters of the One Call response cache."""
+        c = self.response_cache
+        return {"hits": c.hits, "misses": c.misses, "stale": c.stale}
+
     # -------- internal request helper ----------
-    def _request(self, endpoint: str, params: dict) -> Dict:
+    def _request(self, endpoint: str, params: dict, priority: str = FOREGROUND) -> Dict:
         params['appid'] = self.api_key
-        params['units'] = self.units
+        params['units'] = CANONICAL_UNITS
         params['lang']  = self.lang
+        self.limiter.acquire(priority)
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/{endpoint}",
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+            with metrics.span(f"http.{endpoint}"):   # transport retries included
+                response = self.transport.get(
+                    f"{self.BASE_URL}/{endpoint}",
+                    params=params,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {str(e)}")
             raise ValueError(f"API error: {str(e)}")
 
-    def geocode(self, city: str) -> Tuple[float, float]:
-        url = "https://api.openweathermap.org/data/2.5/weather"
-        params = {'q': city, 'appid': self.api_key, 'lang': self.lang}
+    def geocode(self, city: str, priority: str = FOREGROUND) -> Tuple[float, float]:
+        """
+        Resolve a city name to (lat, lon): offline gazetteer first, then the
+        geocode cache, and the network only when neither knows the name.
+        """
+        local = self.gazetteer.resolve(city)
+        if local is not None:
+            return local
+        cached = self.geocode_cache.get(city, self.lang)
+        if cached is not None:
+            return cached
+
+        key = ("geocode", normalize_city(city), self.lang)
+        return self._inflight.do(key, lambda: self._fetch_geocode(city, priority))
+
+    def _fetch_geocode(self, city: str, priority: str) -> Tuple[float, float]:
+        params = {'q': city, 'limit': 1, 'appid': self.api_key}
+        # Geocoding is rate limited but does not count against the One Call budget
+        self.limiter.acquire(priority, budgeted=False)
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-            return data['coord']['lat'], data['coord']['lon']
+            with metrics.span("http.geocode"):
+                response = self.transport.get(self.GEO_URL, params=params, timeout=self.timeout)
+                response.raise_for_status()
+                results = response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Geocoding failed: {str(e)}")
             raise ValueError(f"Geocoding error: {str(e)}")
+        if not results:
+            raise ValueError(f"Geocoding error: no match for '{city}'")
 
-    def get_forecast_bundle(self, lat: float, lon: float) -> Dict:
-        bundle = self._request("onecall", {
-            'lat': lat,
-            'lon': lon,
-            'exclude': 'minutely,hourly',
-        })
-        # Compatibility: expose timezone offset on current as "timezone" (seconds)
+        lat, lon = results[0]['lat'], results[0]['lon']
+        self.geocode_cache.put(city, self.lang, lat, lon)
+        return lat, lon
+
+    def validate_key(self) -> bool:
+        """
+        True if the provider accepts the API key, False if it rejects it
+        (401 / 403). Raises ValueError when the provider can't be reached.
+        """
+        self.limiter.acquire(FOREGROUND, budgeted=False)
         try:
-            tz_off = bundle.get("timezone_offset", 0)
-            if "current" in bundle and isinstance(bundle["current"], dict):
-                bundle["current"]["timezone"] = tz_off
-        except Exception:
-            pass
-        return bundle
+            with metrics.span("http.key_check"):
+                response = self.transport.get(
+                    self.KEY_CHECK_URL,
+                    params={"q": "London", "appid": self.api_key, "units": self.units, "lang": self.lang},
+                    timeout=self.timeout
+                )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Key check failed: {str(e)}")
+            raise ValueError(f"API error: {str(e)}")
+        return response.status_code not in (401, 403)
+
+    def prime(self, snapshot: WeatherSnapshot) -> None:
+        """
+        Seed the caches with a snapshot fetched earlier (e.g. loaded from
+        disk) under the current language. It is served like any cached
+        bundle: without a request while the provider has nothing newer.
+        """
+        base = snapshot.source or snapshot
+        key = self.response_cache.make_key(base.lat, base.lon, CANONICAL_UNITS, self.lang,
+                                           "minutely,hourly")
+        self.response_cache.store(key, base.bundle, fetched_at=base.fetched_at)
+        self.geocode_cache.put(base.city, self.lang, base.lat, base.lon)
+
+    def next_expected_update(self, lat: float, lon: float,
+                             exclude: str = "minutely,hourly") -> Optional[float]:
+        """
+        Wall-clock time after which a refetch can return newer data for
+        (lat, lon); None if nothing is cached. Refreshes before then are
+        served from the cache, so schedulers should aim just past it.
+        """
+        key = self.response_cache.make_key(lat, lon, CANONICAL_UNITS, self.lang, exclude)
+        return self.response_cache.next_update(key)
+
+    def get_forecast_bundle(self, lat: float, lon: float, exclude: str = "minutely,hourly",
+                            priority: str = FOREGROUND, max_stale: Optional[float] = None) -> Dict:
+        """
+        Return the One Call bundle for (lat, lon) in CANONICAL_UNITS, from the
+        response cache when possible. Stale entries are returned immediately
+        and refreshed in the background, unless they expired more than
+        `max_stale` seconds ago: then the request waits for the fetch (pass 0
+        when the caller is about to show the result, e.g. a user's Update).
+        Use core.units.convert_bundle (or get_snapshot) for other unit systems.
+        """
+        return self._bundle_entry(lat, lon, exclude, priority, max_stale)[0]
+
+    def _bundle_entry(self, lat: float, lon: float, exclude: str, priority: str,
+                      max_stale: Optional[float]) -> Tuple[Dict, float]:
+        """get_forecast_bundle() plus when that bundle was downloaded."""
+        key = self.response_cache.make_key(lat, lon, CANONICAL_UNITS, self.lang, exclude)
+        bundle, state, fetched = self.response_cache.lookup_entry(key, max_stale)
+        if state == ResponseCache.STALE:
+            self._revalidate(key, lat, lon, exclude)
+        if bundle is not None:
+            return bundle, fetched
+        return self._fetch_bundle(key, lat, lon, exclude, priority)
+
+    def _revalidate(self, key: tuple, lat: float, lon: float, exclude: str) -> None:
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def worker():
+            try:
+                self._fetch_bundle(key, lat, lon, exclude, BACKGROUND)
+            except ValueError:
+                pass  # keep serving the stale copy; already logged by _request
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=worker, name="bundle-revalidate", daemon=True).start()
+
+    def _fetch_bundle(self, key: tuple, lat: float, lon: float, exclude: str,
+                      priority: str = FOREGROUND) -> Tuple[Dict, float]:
+        # Auto-refresh, a manual Update and a favorites prefetch can all ask
+        # for the same bundle at once; they share one request.
+        return self._inflight.do(("onecall",) + key,
+                                 lambda: self._download_bundle(key, lat, lon, exclude, priority))
+
+    def _download_bundle(self, key: tuple, lat: float, lon: float, exclude: str,
+                         priority: str) -> Tuple[Dict, float]:
+        bundle = self._request("onecall", {
+            'lat': round(float(lat), COORD_DECIMALS),
+            'lon': round(float(lon), COORD_DECIMALS),
+            'exclude': exclude,
+        }, priority)
+        inject_timezone(bundle)
+        return bundle, self.response_cache.store(key, bundle)
+
+    def get_snapshot(self, city: str, priority: str = FOREGROUND,
+                     max_stale: Optional[float] = None) -> WeatherSnapshot:
+        """
+        Resolve `city` once, fetch its One Call bundle once, return all of it
+        in the current display units (see WeatherSnapshot.in_units).
+        `max_stale` is passed to get_forecast_bundle. fetched_at is when the
+        bundle was downloaded, even if it came from the cache.
+        """
+        lat, lon = self.geocode(city, priority)
+        bundle, fetched = self._bundle_entry(lat, lon, "minutely,hourly", priority, max_stale)
+        snap = WeatherSnapshot.from_bundle(city, lat, lon, bundle)
+        snap.fetched_at = fetched
+        return snap.in_units(self.units, self.wind_speed)
+
+    def get_snapshots(self, cities: List[str], max_workers: int = 8,
+                      priority: str = BACKGROUND) -> List[SnapshotResult]:
+        """
+        Fetch snapshots for many cities concurrently on a bounded thread pool.
+        Results come back in input order; a failing city carries its error
+        instead of failing the whole batch. Runs at background priority by
+        default so it never delays the city on screen.
+        """
+        if not cities:
+            return []
+        workers = max(1, min(max_workers, len(cities)))
+        if workers > self._pool_size:
+            self._mount_adapter(workers)
+
+        def fetch(city: str) -> SnapshotResult:
+            try:
+                return SnapshotResult(city, snapshot=self.get_snapshot(city, priority))
+            except Exception as e:
+                return SnapshotResult(city, error=e)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snapshot") as pool:
+            return list(pool.map(fetch, cities))
+
+    def get_lane(self, lat: float, lon: float, lane: str,
+                 priority: str = FOREGROUND, max_stale: Optional[float] = None) -> SeriesBlock:
+        """
+        Hourly (48 h) or minutely (60 min) series for (lat, lon) in the current
+        display units. Fetched only when asked for and cached separately from
+        the daily bundle; the parsed block is reused until the data or the
+        units change.
+        """
+        if lane not in LANE_EXCLUDES:
+            raise ValueError(f"Unknown data lane '{lane}'")
+        bundle = self.get_forecast_bundle(lat, lon, exclude=LANE_EXCLUDES[lane], priority=priority,
+                                          max_stale=max_stale)
+        return self._lane_block(lat, lon, lane, bundle)
+
+    def peek_lane(self, lat: float, lon: float, lane: str) -> Optional[SeriesBlock]:
+        """
+        get_lane() from the response cache only: the block when a fresh copy
+        is cached, else None. Never touches the network, so the UI thread
+        may call it; fetch with get_lane() on a worker otherwise.
+        """
+        if lane not in LANE_EXCLUDES:
+            raise ValueError(f"Unknown data lane '{lane}'")
+        key = self.response_cache.make_key(lat, lon, CANONICAL_UNITS, self.lang, LANE_EXCLUDES[lane])
+        bundle = self.response_cache.peek(key)
+        return None if bundle is None else self._lane_block(lat, lon, lane, bundle)
+
+    def _lane_block(self, lat: float, lon: float, lane: str, bundle: Dict) -> SeriesBlock:
+        view_key = (lane, round(lat, 3), round(lon, 3))
+        units = (self.units, self.wind_speed)
+        held = self._lane_views.get(view_key)
+        if held is not None and held[0] is bundle and held[1] == units:
+            return held[2]
+        records = convert_bundle({lane: bundle.get(lane, [])}, *units)[lane]
+        block = SeriesBlock.from_records(records)
+        self._lane_views[view_key] = (bundle, units, block)
+        return block
+
+    def get_alerts_only(self, lat: float, lon: float, priority: str = BACKGROUND) -> List[Dict]:
+        """
+        Active alerts for (lat, lon) from an alerts-only One Call request.
+        Never served from the response cache: the point is to see a new
+        alert before the full bundle is due.
+        """
+        key = ("alerts", round(lat, 3), round(lon, 3), self.lang)
+        bundle = self._inflight.do(key, lambda: self._request("onecall", {
+            'lat': round(float(lat), COORD_DECIMALS),
+            'lon': round(float(lon), COORD_DECIMALS),
+            'exclude': ALERTS_EXCLUDE,
+        }, priority))
+        return bundle.get("alerts", [])
 
     # ─── Adapter methods for gui.py ──────────────────────────────────────────
+    # Each of these costs a full snapshot; callers that need more than one
+    # piece should call get_snapshot() once instead.
 
     def get_current(self, city: str) -> Dict:
         """Return the `current` dict for a given city name (with timezone injected)."""
-        lat, lon = self.geocode(city)
-        return self.get_forecast_bundle(lat, lon)["current"]
+        return self.get_snapshot(city).current
 
     def get_daily(self, city: str) -> list:
         """Return the `daily` list for a given city name."""
-        lat, lon = self.geocode(city)
-        return self.get_forecast_bundle(lat, lon)["daily"]
+        return self.get_snapshot(city).daily
 
     def get_alerts(self, city: str) -> list:
         """Return the `alerts` list (possibly empty) for a given city name."""
-        lat, lon = self.geocode(city)
-        bundle = self.get_forecast_bundle(lat, lon)
-        return bundle.get("alerts", [])
+        return self.get_snapshot(city).alerts
 
     def get_uv_index(self, coord: Dict) -> float:
         """Return the UV index from a coord/current dict."""
@@ -1,8 +1,21 @@
 # features/__init__.py
-# Keep the package lightweight: only expose modules that actually exist.
+# Keep the package lightweight: names resolve to their modules on first use,
+# so importing `features` does not pull in PIL or pandas.
+import importlib
 
-from .current_conditions_icons import load_icon
-from .weather_alerts import show_alerts
-from .team_compare_random import TeamCompareRandomFrame
+_EXPORTS = {
+    "load_icon": "current_conditions_icons",
+    "show_alerts": "weather_alerts",
+    "TeamCompareRandomFrame": "team_compare_random",
+}
 
-__all__ = ["load_icon", "show_alerts", "TeamCompareRandomFrame"]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
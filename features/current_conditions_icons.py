@@ -1,5 +1,29 @@
+# features/current_conditions_icons.py
+"""
+Weather icons for the dashboard.
+
+IconService hands out shared PhotoImage objects from an LRU cache keyed on
+(icon code, size, theme), so a refresh that shows the same icons costs no
+image work at all. Misses are served from the pre-resized sprite atlas
+(features/icons/atlas.png, built by tools/build_icon_atlas.py) with a plain
+Tk region copy; sizes or themes the atlas doesn't have fall back to PIL,
+decoding each source PNG once.
+
+A theme may override any icon by shipping icons/<theme>/<file>.png.
+"""
+import json
 import os
-from PIL import Image, ImageTk
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from core.lazy_import import lazy_import
+from core.tracing import tracer
+
+# PIL loads only when an icon isn't in the atlas, not at startup
+Image = lazy_import("PIL.Image")
+ImageTk = lazy_import("PIL.ImageTk")
 
 ICON_MAP = {
     "01d": "sun.png", "01n": "moon.png",
@@ -14,13 +38,108 @@ ICON_MAP = {
 }
 _THIS_DIR = os.path.dirname(__file__)
 ICONS_DIR = os.path.join(_THIS_DIR, "icons")
+ATLAS_PNG = "atlas.png"
+ATLAS_INDEX = "atlas.json"
+
+
+def atlas_key(filename: str, size: Tuple[int, int], theme: Optional[str] = None) -> str:
+    """Atlas index key: 'sun.png@50x50' or 'dark/sun.png@50x50'."""
+    prefix = f"{theme}/" if theme else ""
+    return f"{prefix}{filename}@{size[0]}x{size[1]}"
+
+
+class IconService:
+    def __init__(self, icons_dir: str = ICONS_DIR, max_entries: int = 64, use_atlas: bool = True):
+        self.icons_dir = icons_dir
+        self.max_entries = max_entries
+        self.use_atlas = use_atlas
+        self.hits = 0
+        self.misses = 0
+        self._photos: "OrderedDict[tuple, tk.PhotoImage]" = OrderedDict()
+        self._decoded: Dict[str, "Image.Image"] = {}   # source path -> decoded RGBA
+        self._atlas: Optional[tk.PhotoImage] = None
+        self._atlas_index: Optional[Dict[str, list]] = None
+        self._lock = threading.Lock()
+
+    def get(self, icon_code: str, size=(50,50), theme: str = "light"):
+        """Shared PhotoImage for `icon_code`; don't modify it."""
+        fn = ICON_MAP.get(icon_code)
+        if not fn:
+            raise KeyError(f"No mapping for icon code '{icon_code}'")
+        size = tuple(size)
+        key = (icon_code, size, theme)
+        with self._lock:
+            photo = self._photos.get(key)
+            if photo is not None:
+                self._photos.move_to_end(key)
+                self.hits += 1
+                return photo
+            self.misses += 1
+            with tracer.span("icon.load", code=icon_code, size=list(size), theme=theme):
+                photo = self._from_atlas(fn, size, theme) or self._from_source(fn, size, theme)
+            self._photos[key] = photo
+            while len(self._photos) > self.max_entries:
+                self._photos.popitem(last=False)
+            return photo
+
+    def clear(self) -> None:
+        with self._lock:
+            self._photos.clear()
+            self._decoded.clear()
+
+    # -------- sources ----------
+    def _themed_path(self, fn: str, theme: str) -> Optional[str]:
+        path = os.path.join(self.icons_dir, theme, fn)
+        return path if os.path.exists(path) else None
+
+    def _from_atlas(self, fn: str, size, theme: str) -> Optional[tk.PhotoImage]:
+        if not self.use_atlas or not self._load_atlas():
+            return None
+        if self._themed_path(fn, theme):
+            rect = self._atlas_index.get(atlas_key(fn, size, theme))
+        else:
+            rect = self._atlas_index.get(atlas_key(fn, size))
+        if rect is None:
+            return None
+        x, y, w, h = rect
+        photo = tk.PhotoImage(width=w, height=h)
+        photo.tk.call(photo, "copy", self._atlas, "-from", x, y, x + w, y + h, "-to", 0, 0)
+        return photo
+
+    def _load_atlas(self) -> bool:
+        if self._atlas_index is None:
+            self._atlas_index = {}
+            index_path = os.path.join(self.icons_dir, ATLAS_INDEX)
+            png_path = os.path.join(self.icons_dir, ATLAS_PNG)
+            if os.path.exists(index_path) and os.path.exists(png_path):
+                with open(index_path, encoding="utf-8") as f:
+                    index = json.load(f)
+                self._atlas = tk.PhotoImage(file=png_path)   # decoded once
+                self._atlas_index = index.get("sprites", {})
+        return bool(self._atlas_index)
+
+    def _from_source(self, fn: str, size, theme: str):
+        path = self._themed_path(fn, theme) or os.path.join(self.icons_dir, fn)
+        img = self._decoded.get(path)
+        if img is None:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Icon not found: {path}")
+            with Image.open(path) as src:
+                img = src.convert("RGBA")
+            self._decoded[path] = img
+        return ImageTk.PhotoImage(img.resize(size, Image.LANCZOS))
+
+
+_service: Optional[IconService] = None
+
+
+def get_icon_service() -> IconService:
+    global _service
+    if _service is None:
+        _service = IconService()
+    return _service
+
 
-def load_icon(icon_code: str, size=(50,50)):
-    fn = ICON_MAP.get(icon_code)
-    if not fn:
-        raise KeyError(f"No mapping for icon code '{icon_code}'")
-    path = os.path.join(ICONS_DIR, fn)
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Icon not found: {path}")
-    img = Image.open(path).resize(size, Image.LANCZOS)
-    return ImageTk.PhotoImage(img)
\ No newline at end of file
+def load_icon(icon_code: str, size=(50,50), theme: str = "light"):
+    """Shared PhotoImage for an OpenWeather icon code (see IconService)."""
+    return get_icon_service().get(icon_code, size, theme)
@@ -5,6 +5,8 @@ from pathlib import Path
 import random
 import pandas as pd
 
+from core.tracing import tracer
+
 ORANGE = "#FF8800"  # accent to match your app
 BLUE   = "#00AAFF"
 
@@ -330,14 +332,15 @@ class TeamCompareRandomFrame(tk.Frame):
             self.tree.insert("", "end", values=(label_key, left_val, right_val))
 
     def _safe_read(self, path: Path) -> pd.DataFrame | None:
-        try:
-            return pd.read_csv(path)
-        except Exception:
-            # try with latin-1 as fallback
+        with tracer.span("csv.load", path=str(path)):
             try:
-                return pd.read_csv(path, encoding="latin-1")
+                return pd.read_csv(path)
             except Exception:
-                return None
+                # try with latin-1 as fallback
+                try:
+                    return pd.read_csv(path, encoding="latin-1")
+                except Exception:
+                    return None
 
     # ---------------- Fun Mode (Quiz) ----------------
     def _toggle_fun(self):
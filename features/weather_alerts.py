@@ -1,89 +1,237 @@
 # features/weather_alerts.py
+"""
+Alerts tab renderer.
+
+AlertsView keeps one scroll canvas for the life of the tab and diffs each
+refresh against what it already shows, keyed on (sender, event, start, end):
+unchanged alerts keep their widgets, changed ones are reconfigured in place
+and only new or expired alerts create or destroy anything. Rows are
+virtualized: only those intersecting the visible part of the canvas (plus a
+little overscan) exist as widgets; the rest are just a height in the layout.
+"""
 import tkinter as tk
+from bisect import bisect_right
 from datetime import datetime
-from typing import List, Dict
-
-def show_alerts(alerts: List[Dict], parent: tk.Frame, theme: Dict):
-    """Render weather alerts full‐page with improved formatting"""
-    # Clear previous
-    for widget in parent.winfo_children():
-        widget.destroy()
-
-    # If no alerts, show a placeholder
-    if not alerts:
-        lbl = tk.Label(
-            parent,
-            text="No active weather alerts",
-            bg=theme['bg'],
-            fg=theme['fg'],
-            font=('Helvetica', 14),
-            wraplength=parent.winfo_width(),
-            justify='center'
-        )
-        lbl.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        return
-
-    # Create a full‐page scrollable canvas
-    canvas = tk.Canvas(parent, bg=theme['bg'], highlightthickness=0)
-    scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-    scroll_frame = tk.Frame(canvas, bg=theme['bg'])
-
-    # Configure scroll region
-    def on_frame_config(e):
-        canvas.configure(scrollregion=canvas.bbox("all"))
-    scroll_frame.bind("<Configure>", on_frame_config)
-
-    canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
-
-    # Pack full‐page
-    canvas.pack(side="left", fill="both", expand=True)
-    scrollbar.pack(side="right", fill="y")
-
-    # Populate alerts
-    for alert in alerts:
-        frame = tk.Frame(
-            scroll_frame,
-            bg=theme['bg'],
-            padx=10,
-            pady=10,
-            relief=tk.RIDGE,
-            borderwidth=2
-        )
-        frame.pack(fill=tk.X, padx=10, pady=5)
-
-        # Header
-        start = datetime.utcfromtimestamp(alert.get('start', 0)).strftime('%Y-%m-%d %I:%M %p')
-        end   = datetime.utcfromtimestamp(alert.get('end',   0)).strftime('%Y-%m-%d %I:%M %p')
-        header = tk.Label(
-            frame,
-            text=f"⚠️  {alert.get('event', 'Alert')}\n({start} to {end})",
-            font=('Helvetica', 14, 'bold'),
-            bg=theme['bg'],
-            fg='red',
-            justify='left'
-        )
-        header.pack(fill=tk.X, pady=(0,5))
-
-        # Description
-        desc = tk.Label(
-            frame,
-            text=alert.get('description', 'No details available'),
-            font=('Helvetica', 12),
-            bg=theme['bg'],
-            fg=theme['fg'],
-            wraplength=parent.winfo_width() - 40,
-            justify='left'
-        )
-        desc.pack(fill=tk.X, pady=(0,5))
-
-        # Sender
-        sender = tk.Label(
-            frame,
-            text=f"Source: {alert.get('sender_name', 'Unknown')}",
-            font=('Helvetica', 10, 'italic'),
-            bg=theme['bg'],
-            fg=theme['fg'],
-            justify='left'
-        )
-        sender.pack(fill=tk.X)
\ No newline at end of file
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+ROW_GAP = 10         # vertical space between alert cards
+OVERSCAN = 200       # px realized above and below the viewport
+LINE_HEIGHT = 18     # used to estimate heights of rows not yet measured
+
+
+def alert_key(alert: Dict) -> Tuple:
+    """Identity of an alert across refreshes."""
+    return (alert.get('sender_name', ''), alert.get('event', 'Alert'),
+            alert.get('start', 0), alert.get('end', 0))
+
+
+def layout(heights: List[int], gap: int = ROW_GAP) -> List[int]:
+    """Top y of each row stacked with `gap` between (and before) rows."""
+    if not heights:
+        return []
+    return [gap * (i + 1) + top for i, top in enumerate(accumulate([0] + heights[:-1]))]
+
+
+def visible_range(tops: List[int], heights: List[int], top: float, bottom: float) -> range:
+    """Indices of rows overlapping [top, bottom]."""
+    first = max(0, bisect_right(tops, top) - 1)
+    while first < len(tops) and tops[first] + heights[first] < top:
+        first += 1
+    last = bisect_right(tops, bottom)
+    return range(first, max(first, last))
+
+
+def _alert_text(alert: Dict) -> Tuple[str, str, str]:
+    start = datetime.utcfromtimestamp(alert.get('start', 0)).strftime('%Y-%m-%d %I:%M %p')
+    end   = datetime.utcfromtimestamp(alert.get('end',   0)).strftime('%Y-%m-%d %I:%M %p')
+    return (f"⚠️  {alert.get('event', 'Alert')}\n({start} to {end})",
+            alert.get('description', 'No details available'),
+            f"Source: {alert.get('sender_name', 'Unknown')}")
+
+
+class _Row:
+    """Widgets of one realized alert card."""
+    __slots__ = ("frame", "header", "desc", "sender", "window", "text")
+
+    def __init__(self, canvas: tk.Canvas, theme: Dict):
+        self.frame = tk.Frame(canvas, bg=theme['bg'], padx=10, pady=10, relief=tk.RIDGE, borderwidth=2)
+        self.header = tk.Label(self.frame, font=('Helvetica', 14, 'bold'), bg=theme['bg'], fg='red', justify='left')
+        self.header.pack(fill=tk.X, pady=(0,5))
+        self.desc = tk.Label(self.frame, font=('Helvetica', 12), bg=theme['bg'], fg=theme['fg'], justify='left')
+        self.desc.pack(fill=tk.X, pady=(0,5))
+        self.sender = tk.Label(self.frame, font=('Helvetica', 10, 'italic'), bg=theme['bg'], fg=theme['fg'], justify='left')
+        self.sender.pack(fill=tk.X)
+        self.window = canvas.create_window(10, 0, window=self.frame, anchor="nw")
+        self.text = None
+
+    def show(self, text: Tuple[str, str, str]) -> None:
+        if text != self.text:
+            self.header.configure(text=text[0])
+            self.desc.configure(text=text[1])
+            self.sender.configure(text=text[2])
+            self.text = text
+
+    def theme(self, theme: Dict) -> None:
+        for w in (self.frame, self.header, self.desc, self.sender):
+            w.configure(bg=theme['bg'])
+        self.desc.configure(fg=theme['fg'])
+        self.sender.configure(fg=theme['fg'])
+
+
+class AlertsView:
+    def __init__(self, parent: tk.Frame, theme: Dict):
+        self.parent = parent
+        self.theme = dict(theme)
+        self._keys: List[Tuple] = []
+        self._text: Dict[Tuple, Tuple[str, str, str]] = {}
+        self._heights: Dict[Tuple, int] = {}
+        self._measured: set = set()
+        self._tops: List[int] = []
+        self._rows: Dict[Tuple, _Row] = {}
+        self._width = 0
+        self._rendering = False
+
+        self.placeholder = tk.Label(parent, text="No active weather alerts", bg=theme['bg'], fg=theme['fg'],
+                                    font=('Helvetica', 14), justify='center')
+        self.canvas = tk.Canvas(parent, bg=theme['bg'], highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(parent, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.bind("<Configure>", self._on_resize)
+        self._showing_list: Optional[bool] = None
+
+    # -------- public ----------
+    def update(self, alerts: List[Dict]) -> None:
+        """Show exactly `alerts`, touching only what changed."""
+        keys, seen = [], set()
+        for alert in alerts:
+            key = alert_key(alert)
+            if key in seen:
+                continue                       # provider duplicate
+            seen.add(key)
+            text = _alert_text(alert)
+            if self._text.get(key) != text:
+                self._text[key] = text
+                self._measured.discard(key)
+                self._heights[key] = self._estimate(text)
+            keys.append(key)
+        gone = set(self._text) - seen
+        for key in gone:
+            del self._text[key], self._heights[key]
+            self._measured.discard(key)
+            row = self._rows.pop(key, None)
+            if row is not None:
+                self._destroy(row)
+        self._keys = keys
+        self._show_list(bool(keys))
+        self._relayout()
+
+    def set_theme(self, theme: Dict) -> None:
+        if theme == self.theme:
+            return
+        self.theme = dict(theme)
+        self.placeholder.configure(bg=theme['bg'], fg=theme['fg'])
+        self.canvas.configure(bg=theme['bg'])
+        for row in self._rows.values():
+            row.theme(theme)
+
+    # -------- layout ----------
+    def _show_list(self, show: bool) -> None:
+        if show == self._showing_list:
+            return
+        self._showing_list = show
+        if show:
+            self.placeholder.pack_forget()
+            self.canvas.pack(side="left", fill="both", expand=True)
+            self.scrollbar.pack(side="right", fill="y")
+        else:
+            self.canvas.pack_forget()
+            self.scrollbar.pack_forget()
+            self.placeholder.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+    def _wrap(self) -> int:
+        return max(100, (self._width or self.parent.winfo_width()) - 60)
+
+    def _estimate(self, text: Tuple[str, str, str]) -> int:
+        chars_per_line = max(20, self._wrap() // 7)
+        desc_lines = sum(1 + len(line) // chars_per_line for line in text[1].split("\n"))
+        return 2 * 22 + desc_lines * LINE_HEIGHT + 16 + 34
+
+    def _relayout(self) -> None:
+        heights = [self._heights[k] for k in self._keys]
+        self._tops = layout(heights)
+        total = (self._tops[-1] + heights[-1] + ROW_GAP) if heights else 0
+        self.canvas.configure(scrollregion=(0, 0, self._width, total))
+        self._render_visible()
+
+    def _render_visible(self) -> None:
+        if not self._keys or self._rendering:
+            return
+        self._rendering = True
+        try:
+            remeasure = self._realize_visible()
+        finally:
+            self._rendering = False
+        if remeasure:
+            self._relayout()
+
+    def _realize_visible(self) -> bool:
+        """Create/move/destroy rows for the viewport; True if a height changed."""
+        heights = [self._heights[k] for k in self._keys]
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), 1)
+        wanted = {self._keys[i]: i for i in visible_range(self._tops, heights, top - OVERSCAN, bottom + OVERSCAN)}
+        for key in [k for k in self._rows if k not in wanted]:
+            self._destroy(self._rows.pop(key))
+        remeasure = False
+        for key, i in wanted.items():
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = _Row(self.canvas, self.theme)
+                self._size(row)
+            row.show(self._text[key])
+            self.canvas.coords(row.window, 10, self._tops[i])
+            if key not in self._measured:
+                row.frame.update_idletasks()
+                self._measured.add(key)
+                h = row.frame.winfo_reqheight()
+                if h != self._heights[key]:
+                    self._heights[key] = h
+                    remeasure = True
+        return remeasure
+
+    def _size(self, row: _Row) -> None:
+        row.desc.configure(wraplength=self._wrap())
+        if self._width:
+            self.canvas.itemconfigure(row.window, width=self._width - 20)
+
+    def _destroy(self, row: _Row) -> None:
+        self.canvas.delete(row.window)
+        row.frame.destroy()
+
+    # -------- events ----------
+    def _on_scroll(self, first, last) -> None:
+        self.scrollbar.set(first, last)
+        self._render_visible()
+
+    def _on_resize(self, event) -> None:
+        if event.width == self._width:
+            self._render_visible()
+            return
+        self._width = event.width
+        for row in self._rows.values():
+            self._size(row)
+        self._measured.clear()                  # wrap changed; heights are stale
+        for key in self._keys:
+            self._heights[key] = self._estimate(self._text[key])
+        self._relayout()
+
+
+def show_alerts(alerts: List[Dict], parent: tk.Frame, theme: Dict) -> AlertsView:
+    """Render weather alerts into `parent`, reusing its AlertsView across calls."""
+    view = getattr(parent, "_alerts_view", None)
+    if view is None:
+        view = parent._alerts_view = AlertsView(parent, theme)
+    view.set_theme(theme)
+    view.update(alerts)
+    return view
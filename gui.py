@@ -1,19 +1,43 @@
 # gui.py
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timezone, timedelta
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import mplcursors
-
-from core.weather_api import WeatherAPI
+import numpy as np
+
+from core.weather_api import AlertPoller, WeatherAPI, PROVIDER_CADENCE
+from core.rate_limit import BACKGROUND, QuotaExceededError
+from core.data_worker import DataWorker
+from core.refresh_scheduler import RefreshScheduler
+from core.ui_scheduler import UiScheduler
+from core.snapshot_store import SnapshotStore
+from core.units import pressure_unit
+from core.downsample import lttb_indices
 from core.temp_predictor import TempPredictor
+from core.lazy_import import lazy_import
+from core.metrics import metrics
+from core.tracing import tracer
+from core import startup
 from features.current_conditions_icons import load_icon
 from features.weather_alerts import show_alerts
-from features.team_compare_random import TeamCompareRandomFrame  # popup uses this frame
 import preferences
 
+# Heavy modules load when the Charts tab / Team Compare popup first opens
+figure = lazy_import("matplotlib.figure")
+backend_tkagg = lazy_import("matplotlib.backends.backend_tkagg")
+mplcursors = lazy_import("mplcursors")
+team_compare_random = lazy_import("features.team_compare_random")
+
 FLASH_INTERVAL = 500  # ms for alert banner flash
+CLOCK_INTERVAL = 60000
+HEARTBEAT_MS = 250      # event-loop lag sampling while metrics are on
+DIAG_REFRESH_MS = 1000
+DIAG_COLUMNS = ("metric", "count", "last", "p50", "p90", "p99", "max")
+CHART_POINT_BUDGET = 24  # max points per series; denser lanes are LTTB-downsampled
+WORKER_POLL_MS = 50     # how often finished background fetches are picked up
+LOADING_STEP_MS = 48    # busy-bar animation frame, driven by UiScheduler (not Progressbar.start)
+ALERT_BUDGET_SHARE = 0.25  # of the background budget, for the default alert poll interval
+STALE_AFTER = 2 * PROVIDER_CADENCE  # show the "updated … ago" badge past this age (s)
 TEAM_DATA_DIR = "/Users/margaritapascual/JTC/Pathways/weather-dashboard-margaritapascual/Team Data"
 
 # --- Minimal i18n helper (EN/ES) ---
@@ -42,6 +66,12 @@ I18N = {
         "rain_word": "rain",
         "temp_label_f": "Temp (°F)",
         "temp_label_c": "Temp (°C)",
+        "city_not_found": "City not found",
+        "city_not_found_msg": "Couldn't find '{city}'. Pick a suggestion or try 'City, Country'.",
+        "updated_ago": "Updated {age} ago",
+        "key_rejected": "API Rejected",
+        "key_rejected_msg": "The provider rejected WEATHER_API_KEY. Check your .env.",
+        "alerts_quota": "Alerts paused: daily API quota used",
     },
     "es": {
         "app_title": "Panel del Clima de Margarita",
@@ -67,11 +97,238 @@ I18N = {
         "rain_word": "lluvia",
         "temp_label_f": "Temp (°F)",
         "temp_label_c": "Temp (°C)",
+        "city_not_found": "Ciudad no encontrada",
+        "city_not_found_msg": "No se encontró '{city}'. Elige una sugerencia o prueba 'Ciudad, País'.",
+        "updated_ago": "Actualizado hace {age}",
+        "key_rejected": "Clave rechazada",
+        "key_rejected_msg": "El proveedor rechazó WEATHER_API_KEY. Revisa tu .env.",
+        "alerts_quota": "Alertas en pausa: cuota diaria de la API agotada",
     }
 }
 def t(key, lang):  # tiny helper
     return I18N.get(lang, I18N["en"]).get(key, I18N["en"].get(key, key))
 
+def format_age(seconds):
+    """'45 min', '3 h', '2 d'."""
+    minutes = int(seconds // 60)
+    if minutes < 120:
+        return f"{minutes} min"
+    if minutes < 48 * 60:
+        return f"{minutes // 60} h"
+    return f"{minutes // 1440} d"
+
+
+class ViewModel:
+    """
+    Last values rendered into each widget. Only options whose value changed
+    are pushed to Tk, icons are reloaded only when their code changes, and
+    Treeview rows are updated in place.
+    """
+    def __init__(self):
+        self._options = {}   # widget -> {option: value}
+        self._rows = {}      # treeview -> [iid, ...] in display order
+        self._values = {}    # (treeview, iid) -> values tuple
+        self._keys = {}      # arbitrary name -> last signature
+
+    def set(self, widget, **options) -> bool:
+        last = self._options.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if k not in last or last[k] != v}
+        if changed:
+            widget.configure(**changed)
+            last.update(changed)
+        return bool(changed)
+
+    def set_icon(self, widget, code, loader, theme="light") -> bool:
+        last = self._options.setdefault(widget, {})
+        if last.get("icon") == (code, theme):
+            return False
+        img = loader(code, theme=theme)
+        widget.configure(image=img); widget.image = img
+        last["icon"] = (code, theme)
+        return True
+
+    def sync_rows(self, tree, rows) -> int:
+        """Make `tree` show `rows` (value tuples); returns how many rows were touched."""
+        with tracer.span("tk.treeview", rows=len(rows)):
+            return self._sync_rows(tree, rows)
+
+    def _sync_rows(self, tree, rows) -> int:
+        iids = self._rows.setdefault(tree, [])
+        touched = 0
+        for i, values in enumerate(rows):
+            values = tuple(values)
+            if i < len(iids):
+                iid = iids[i]
+                if self._values.get((tree, iid)) != values:
+                    tree.item(iid, values=values)
+                    touched += 1
+            else:
+                iid = tree.insert("", "end", values=values)
+                iids.append(iid)
+                touched += 1
+            self._values[(tree, iid)] = values
+        for iid in iids[len(rows):]:
+            tree.delete(iid)
+            self._values.pop((tree, iid), None)
+            touched += 1
+        del iids[len(rows):]
+        return touched
+
+    def changed(self, name, signature) -> bool:
+        """True (and remembered) when `signature` differs from the last one for `name`."""
+        if self._keys.get(name, self) == signature:
+            return False
+        self._keys[name] = signature
+        return True
+
+    def forget(self, widget) -> None:
+        """Drop what we know about a widget that was destroyed or rebuilt."""
+        self._options.pop(widget, None)
+        for iid in self._rows.pop(widget, []):
+            self._values.pop((widget, iid), None)
+
+class ChartEngine:
+    """
+    The Charts tab figure. Axes (including the humidity twin axis), every
+    line and bar artist, the legend and the hover cursor are created once;
+    updates only change artist data. When the axes layout (ticks, limits,
+    labels) is unchanged, the cached background is restored and just the
+    series artists are redrawn and blitted.
+    """
+    MAX_POINTS = 48  # bars pre-allocated per series (30-day view, hourly lane)
+
+    def __init__(self, master):
+        self.fig = figure.Figure(figsize=(6,4), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.ax2 = self.ax.twinx()
+        self.ax.set_ylabel("Temp / Precip (%)")
+        self.ax2.set_ylabel("Humidity (%)")
+        self.ax2.set_ylim(0, 100)
+        self.fig.tight_layout()
+
+        zeros = [0] * self.MAX_POINTS
+        idx = list(range(self.MAX_POINTS))
+        self.temp_bars = self.ax.bar(idx, zeros, width=0.35, alpha=0.6)
+        self.precip_bars = self.ax.bar(idx, zeros, width=0.35, alpha=0.4, label="Precip (%)")
+        (self.temp_line,) = self.ax.plot([], [], marker="o")
+        (self.precip_line,) = self.ax.plot([], [], marker="x", linestyle="--", label="Precip (%)")
+        (self.pred_line,) = self.ax.plot([], [], linestyle=":", color="purple", label="ML Pred")
+        (self.humid_line,) = self.ax2.plot([], [], marker="s", linestyle=":", color="tab:blue",
+                                           label="Humidity (%)")
+        self._lines = [self.temp_line, self.precip_line, self.pred_line, self.humid_line]
+        self._bars = list(self.temp_bars.patches) + list(self.precip_bars.patches)
+        for artist in self._lines + self._bars:
+            artist.set_animated(True)   # drawn by us, not by canvas.draw()
+
+        self.canvas = backend_tkagg.FigureCanvasTkAgg(self.fig, master=master)
+        self._background = None
+        self._layout = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.draw()
+
+        mplcursors.cursor(self._lines, hover=True).connect(
+            "add", lambda sel: sel.annotation.set_text(f"{sel.artist.get_label()}: {sel.target[1]:.1f}")
+        )
+
+    def widget(self):
+        return self.canvas.get_tk_widget()
+
+    def update(self, x, temps, precip, humid, dates, title, temp_label, chart_type, pred=None):
+        """Show new series; a full draw happens only when the axes layout changed."""
+        x = np.asarray(x, dtype=float)[:self.MAX_POINTS]
+        n = len(x)
+        temps, precip, humid = (np.asarray(v, dtype=float)[:n] for v in (temps, precip, humid))
+        dates = list(dates)[:n]
+        lines = chart_type in ("line", "both")
+        bars = chart_type in ("bar", "both")
+
+        for line, y in ((self.temp_line, temps), (self.precip_line, precip), (self.humid_line, humid)):
+            line.set_data(x, y)
+        self.temp_line.set_visible(lines)
+        self.precip_line.set_visible(lines)
+        self.temp_line.set_label(temp_label)
+        self.temp_bars.set_label(temp_label)
+
+        spacing = float(np.median(np.diff(x))) if n > 1 else 1.0
+        width = 0.35 * spacing
+        for container, offset, y in ((self.temp_bars, -width/2, temps),
+                                     (self.precip_bars, width/2, precip)):
+            for i, rect in enumerate(container.patches):
+                if bars and i < n:
+                    rect.set_x(x[i] + offset - width/2)
+                    rect.set_width(width)
+                    rect.set_height(y[i])
+                    rect.set_visible(True)
+                else:
+                    rect.set_visible(False)
+
+        if pred is not None:
+            self.pred_line.set_data(*pred)
+        self.pred_line.set_visible(pred is not None)
+
+        # Limits snap outward to multiples of 10 so small changes keep the layout
+        ys = np.concatenate([temps, precip] + ([np.asarray(pred[1], dtype=float)] if pred else []))
+        ys = ys[np.isfinite(ys)]
+        lo = float(np.floor(min(ys.min(), 0) / 10) * 10) if len(ys) else 0.0
+        hi = float(np.ceil(max(ys.max(), 10) / 10) * 10) if len(ys) else 100.0
+        step = max(1, n // 8)   # keep tick labels readable on dense lanes
+        pad = spacing * 0.6
+        xlim = (x[0] - pad, x[-1] + pad) if n else (-1.0, 1.0)
+        layout = (title, temp_label, chart_type, pred is not None, lo, hi, xlim,
+                  tuple(x[::step].tolist()), tuple(dates[::step]))
+
+        if layout != self._layout:
+            self._layout = layout
+            self.ax.set_title(title)
+            self.ax.set_ylim(lo, hi)
+            self.ax.set_xlim(*xlim)
+            self.ax.set_xticks(x[::step])
+            self.ax.set_xticklabels(dates[::step], rotation=45)
+            shown = [(self.temp_line, lines), (self.precip_line, lines),
+                     (self.temp_bars, bars), (self.precip_bars, bars),
+                     (self.pred_line, pred is not None), (self.humid_line, True)]
+            handles = [h for h, show in shown if show]
+            self.ax.legend(handles, [h.get_label() for h in handles], loc="upper left")
+            with tracer.span("chart.draw", points=n):
+                self.canvas.draw()      # _on_draw recaptures the background
+        else:
+            with tracer.span("chart.blit", points=n):
+                self._blit()
+
+    def set_theme(self, bg, fg):
+        """Recolour for the dashboard theme; the cached background is stale, so redraw fully."""
+        self.fig.set_facecolor(bg)
+        self.ax.set_facecolor(bg)
+        for ax in (self.ax, self.ax2):
+            ax.tick_params(colors=fg)
+            ax.yaxis.label.set_color(fg)
+            ax.title.set_color(fg)
+            for spine in ax.spines.values():
+                spine.set_edgecolor(fg)
+        self._layout = None
+        self._background = None
+        with tracer.span("chart.draw", points=0):
+            self.canvas.draw()
+
+    def _series_artists(self):
+        return [a for a in self._lines + self._bars if a.get_visible()]
+
+    def _on_draw(self, event):
+        # Runs after every full draw (layout change, resize, hover annotation)
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._series_artists():
+            self.fig.draw_artist(artist)
+
+    def _blit(self):
+        if self._background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self._series_artists():
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+
+
 def launch_gui(weather_api, predictor):
     app = WeatherDashboard(weather_api, predictor)
     app.mainloop()
@@ -83,8 +340,15 @@ class WeatherDashboard(tk.Tk):
         self.title(t("app_title", self.prefs["language"]))
 
         self._team_compare_win = None  # popup handle
+        self.view = ViewModel()        # only changed values reach Tk
+        self.ui   = UiScheduler(self)    # one timer for every periodic UI task
         self.weather   = weather_api
         self.predictor = predictor
+        # Network + parsing happen on the worker; results come back via worker.poll()
+        self.worker    = DataWorker()
+        self.store     = SnapshotStore()   # last-known snapshot per recent city
+        self._snapshot = None
+        self.tz_offset = 0
 
         # --- Tabs setup ---
         self.nb = ttk.Notebook(self)
@@ -107,25 +371,92 @@ class WeatherDashboard(tk.Tk):
         self.geometry("1024x700")
 
         # --- Build UI sections ---
+        # Charts, Alerts and Settings are built on first activation (see _on_tab_changed);
+        # their variables exist up front because refresh / settings code reads them.
+        self._init_vars()
         self._build_top_bar()
         self._build_overview()
         self._build_forecast()
-        self._build_charts()
-        self._build_alerts_tab()
-        self._build_settings()
-
-        # --- Bottom status bar clock (city-local, persistent) ---
-        self.status = tk.Label(self, anchor="w", bg=self.bg_color, fg=self.fg_color, font=(None, 12))
-        self.status.pack(side="bottom", fill="x")
-
-        # Auto-refresh
-        interval = self.prefs["refresh"]["interval_seconds"]
-        if interval > 0:
-            self.after(interval * 1000, self.refresh_all)
+        self._lazy_tabs = {
+            str(self.tab_charts):   self._build_charts,
+            str(self.tab_alerts):   self._build_alerts_tab,
+            str(self.tab_settings): self._build_settings,
+        }
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # --- Bottom status bar: clock (city-local, persistent) + refresh schedule ---
+        status_bar = tk.Frame(self, bg=self.bg_color)
+        status_bar.pack(side="bottom", fill="x")
+        self.status = tk.Label(status_bar, anchor="w", bg=self.bg_color, fg=self.fg_color, font=(None, 12))
+        self.status.pack(side="left", fill="x", expand=True)
+        self.refresh_status = tk.Label(status_bar, anchor="e", bg=self.bg_color, fg=self.fg_color,
+                                       font=(None, 12))
+        self.refresh_status.pack(side="right", padx=(0, 8))
+
+        # Auto-refresh: re-arms after every run, backs off on errors, paced by the quota
+        self.scheduler = RefreshScheduler(self.ui, self.refresh_all,
+                                          self.prefs["refresh"]["interval_seconds"],
+                                          limiter=self.weather.limiter,
+                                          calls_per_refresh=self._refresh_cost())
+        # Alerts-only lane: tiny requests on a shorter interval, redraws only on change
+        self.alert_poller = AlertPoller(self.weather)
+        self._alerts_quota_hit = False
+        self.alert_scheduler = RefreshScheduler(self.ui, self._poll_alerts, self._alert_poll_interval(),
+                                                limiter=self.weather.limiter, priority=BACKGROUND)
+        self.alert_scheduler.start()
+        self.bind("<Unmap>", self._on_visibility, add="+")
+        self.bind("<Map>", self._on_visibility, add="+")
+        self.bind("<FocusIn>", lambda e: self.after_idle(self._on_focus_change), add="+")
+        self.bind("<FocusOut>", lambda e: self.after_idle(self._on_focus_change), add="+")
 
         self._flash_state = False
-        self.refresh_all()  # also sets tz_offset
+        self.ui.every("worker", WORKER_POLL_MS, self.worker.poll)
+        # Paint the last saved snapshot now; the key check and the real refresh
+        # run side by side on the worker.
+        self._show_cached(self.prefs["location"]["default_city"])
+        self.worker.submit("validate", self.weather.validate_key,
+                           on_done=self._on_key_checked, on_error=lambda e: None)
+        self.refresh_all()  # tz_offset is set once the first snapshot arrives
         self._update_clock()
+        self.ui.every("clock", CLOCK_INTERVAL, self._update_clock)
+        # Hidden diagnostics tab (rolling timings, loop lag, JSON dump)
+        self.tab_diag = None
+        self.bind_all("<Control-Shift-D>", self._toggle_diagnostics)
+        if metrics.enabled:
+            self.ui.every("heartbeat", HEARTBEAT_MS, self._heartbeat)
+        self.bind("<Expose>", self._on_first_paint, add="+")
+        startup.mark("window_built")
+
+    def _on_first_paint(self, event):
+        if event.widget is self:
+            self.after_idle(startup.first_paint)
+
+    def _init_vars(self):
+        p = self.prefs
+        default_freq = p["forecast"].get("default_tab", "7_day")
+        if default_freq not in ("daily","7_day","30_day"):
+            default_freq = "7_day"
+        self.freq       = tk.StringVar(value=default_freq)
+        self.unit       = tk.StringVar(value=p["units"]["temperature"])
+        self.wind_unit  = tk.StringVar(value=p["units"]["wind_speed"])
+        self.lang       = tk.StringVar(value=p["language"])
+        self.theme_var  = tk.StringVar(value=p["theme"]["mode"])
+        self.alert_chk  = tk.BooleanVar(value=p["alerts"]["enabled"])
+        self.chart_type = tk.StringVar(value=p["chart"]["default_type"])
+
+    def _on_tab_changed(self, event):
+        build = self._lazy_tabs.pop(self.nb.select(), None)
+        if build is not None:
+            build()
+
+    def _tab_built(self, tab) -> bool:
+        return str(tab) not in self._lazy_tabs
+
+    def destroy(self):
+        # May run inside a UiScheduler task (a rejected key); nothing may touch Tk after this
+        self.ui.close()
+        self.worker.shutdown()
+        super().destroy()
 
     # ---------- Theming ----------
     def _apply_theme(self, mode):
@@ -137,6 +468,8 @@ class WeatherDashboard(tk.Tk):
                     self.tab_charts,   self.tab_alerts,
                     self.tab_settings):
             tab.configure(bg=self.bg_color)
+        if hasattr(self, "chart"):
+            self.chart.set_theme(self.bg_color, self.fg_color)
         style = ttk.Style(self)
         style.theme_use("clam")
         style.configure("AlertBanner.TLabel",
@@ -172,12 +505,20 @@ class WeatherDashboard(tk.Tk):
         self.lbl_city.pack(side="left", padx=(8,0))
 
         self.city_var = tk.StringVar(value=self.prefs["location"]["default_city"])
-        ent = ttk.Entry(top, textvariable=self.city_var, width=25, font=(None,14))
-        ent.pack(side="left", padx=4)
-        ent.bind("<Return>", lambda e: self._update_city())
+        # Suggestions come from the offline gazetteer (no network per keystroke)
+        self.city_box = ttk.Combobox(top, textvariable=self.city_var, width=25, font=(None,14))
+        self.city_box.pack(side="left", padx=4)
+        self.city_box.bind("<Return>", lambda e: self._update_city())
+        self.city_box.bind("<KeyRelease>", self._suggest_cities)
+        self.city_box.bind("<<ComboboxSelected>>", lambda e: self._update_city())
 
         self.btn_update = ttk.Button(top, text=t("btn_update", lang), command=self._update_city)
         self.btn_update.pack(side="left", padx=4)
+        # Shown only while a fetch is in flight; the window stays usable
+        self.loading = ttk.Progressbar(top, mode="indeterminate", length=80)
+        # "Updated 3 h ago" when what's on screen is old (e.g. loaded from disk)
+        self.stale_lbl = ttk.Label(top, text="", style="SubText.TLabel")
+        self.stale_lbl.pack(side="right", padx=8)
         self.btn_theme  = ttk.Button(top, text=t("btn_theme", lang),  command=self._toggle_theme)
         self.btn_theme.pack(side="left", padx=4)
         self.btn_team   = ttk.Button(top, text=t("btn_team_compare", lang), command=self._open_team_compare)
@@ -215,7 +556,7 @@ class WeatherDashboard(tk.Tk):
         container = tk.Frame(win, bg=self.bg_color)
         container.pack(fill="both", expand=True, padx=10, pady=10)
 
-        frm = TeamCompareRandomFrame(container, default_dir=TEAM_DATA_DIR)
+        frm = team_compare_random.TeamCompareRandomFrame(container, default_dir=TEAM_DATA_DIR)
         frm.pack(fill="both", expand=True)
 
         def _on_close():
@@ -229,10 +570,31 @@ class WeatherDashboard(tk.Tk):
         self.theme_var.set(new)
         self._save_theme()
 
+    def _suggest_cities(self, event):
+        if event.keysym in ("Return", "Up", "Down", "Escape"):
+            return
+        self.city_box["values"] = self.weather.gazetteer.complete(self.city_var.get())
+
     def _update_city(self):
-        self.prefs["location"]["default_city"] = self.city_var.get()
-        preferences.save_preferences(self.prefs)
-        self.refresh_all()
+        city = self.city_var.get().strip()
+        self._show_cached(city)
+        # Supersedes any fetch still running for the previous city
+        self.refresh_all(city)
+
+    def _show_cached(self, city):
+        """Render the saved snapshot for `city`, if any, while the real fetch runs."""
+        snap = self.store.load(city, self.weather.lang)
+        if snap is None:
+            return
+        self.weather.prime(snap)   # no refetch at all while upstream has nothing newer
+        self._snapshot = snap
+        self._render()
+
+    def _on_key_checked(self, accepted):
+        if not accepted:
+            lang = self.prefs["language"]
+            messagebox.showerror(t("key_rejected", lang), t("key_rejected_msg", lang))
+            self.destroy()
 
     # ---------- Overview ----------
     def _build_overview(self):
@@ -288,6 +650,8 @@ class WeatherDashboard(tk.Tk):
 
     def _rebuild_forecast_tree(self, lang):
         f = self.tab_forecast
+        if hasattr(self, "tree"):
+            self.view.forget(self.tree)
         for child in f.winfo_children():
             child.destroy()
         cols = (t("table_day", lang), t("table_hi", lang), t("table_lo", lang), t("table_precip", lang))
@@ -302,11 +666,6 @@ class WeatherDashboard(tk.Tk):
         # Bring back: Daily • 7-Day • 30-Day
         f = self.tab_charts
         btnf = tk.Frame(f, bg=self.bg_color); btnf.pack(fill="x", pady=(10,0))
-        default_freq = self.prefs["forecast"].get("default_tab", "7_day")
-        if default_freq not in ("daily","7_day","30_day"):
-            default_freq = "7_day"
-        self.freq = tk.StringVar(value=default_freq)
-
         # buttons with localized labels
         self.btn_daily  = tk.Button(btnf, text=t("chart_daily",  self.prefs["language"]),
                                     font=(None,12), command=lambda:self._set_freq("daily"))
@@ -317,16 +676,18 @@ class WeatherDashboard(tk.Tk):
         for b in (self.btn_daily, self.btn_week, self.btn_30day):
             b.pack(side="left", padx=5)
 
-        fig = Figure(figsize=(6,4), dpi=100)
-        self.ax = fig.add_subplot(111)
-        fig.tight_layout()
+        self.chart = ChartEngine(f)
+        self.chart.set_theme(self.bg_color, self.fg_color)
+        self.chart.widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self._plot_chart()
 
-        self.canvas = FigureCanvasTkAgg(fig, master=f)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+    def _refresh_cost(self):
+        """Budgeted One Call requests per refresh: the Daily view also fetches the hourly lane."""
+        return 2 if self.freq.get() == "daily" else 1
 
     def _set_freq(self, val):
         self.freq.set(val)
+        self.scheduler.calls_per_refresh = self._refresh_cost()
         # keep saving so next open matches last choice
         self.prefs["forecast"]["default_tab"] = val
         preferences.save_preferences(self.prefs)
@@ -337,33 +698,33 @@ class WeatherDashboard(tk.Tk):
         f = self.tab_alerts; f.configure(bg=self.bg_color)
         self.alerts_frame = tk.Frame(f, bg=self.bg_color)
         self.alerts_frame.pack(fill="both", expand=True)
+        self._render_alerts()
 
     # ---------- Settings ----------
     def _build_settings(self):
         f = self.tab_settings; f.configure(bg=self.bg_color)
         row = 0
         ttk.Label(f, text="Units:", background=self.bg_color, foreground=self.fg_color).grid(row=row, column=0, sticky="w", padx=10)
-        self.unit = tk.StringVar(value=self.prefs["units"]["temperature"])
         for i,u in enumerate(("imperial","metric")):
             ttk.Radiobutton(f, text=u, variable=self.unit, value=u, command=self._save_settings).grid(row=row, column=1+i)
         row += 1
+        ttk.Label(f, text="Wind:", background=self.bg_color, foreground=self.fg_color).grid(row=row, column=0, sticky="w", padx=10)
+        for i,w in enumerate(("mph","km/h","m/s")):
+            ttk.Radiobutton(f, text=w, variable=self.wind_unit, value=w, command=self._save_settings).grid(row=row, column=1+i)
+        row += 1
         ttk.Label(f, text="Language:", background=self.bg_color, foreground=self.fg_color).grid(row=row, column=0, sticky="w", padx=10)
-        self.lang = tk.StringVar(value=self.prefs["language"])
         for i,l in enumerate(("en","es")):
             ttk.Radiobutton(f, text=l.upper(), variable=self.lang, value=l, command=self._save_settings).grid(row=row, column=1+i)
         row += 1
         ttk.Label(f, text="Theme:", background=self.bg_color, foreground=self.fg_color).grid(row=row, column=0, sticky="w", padx=10)
-        self.theme_var = tk.StringVar(value=self.prefs["theme"]["mode"])
         for i,m in enumerate(("light","dark")):
             ttk.Radiobutton(f, text=m.title(), variable=self.theme_var, value=m, command=self._save_theme).grid(row=row, column=1+i)
         row += 1
         ttk.Label(f, text="Weather Alerts:", background=self.bg_color, foreground=self.fg_color).grid(row=row, column=0, sticky="w", padx=10)
-        self.alert_chk = tk.BooleanVar(value=self.prefs["alerts"]["enabled"])
         for i,val in enumerate((True,False)):
             ttk.Radiobutton(f, text="On" if val else "Off", variable=self.alert_chk, value=val, command=self._save_settings).grid(row=row, column=1+i)
         row += 1
         ttk.Label(f, text="Chart Type:", background=self.bg_color, foreground=self.fg_color).grid(row=row, column=0, sticky="w", padx=10)
-        self.chart_type = tk.StringVar(value=self.prefs["chart"]["default_type"])
         for i,t_ in enumerate(("line","bar","both")):
             ttk.Radiobutton(f, text=t_.title(), variable=self.chart_type, value=t_, command=self._save_settings).grid(row=row, column=1+i)
 
@@ -400,20 +761,25 @@ class WeatherDashboard(tk.Tk):
         # Rebuild forecast table (headings are localized)
         self._rebuild_forecast_tree(lang)
         # Rebuild chart buttons text
-        self.btn_daily.config(text=t("chart_daily", lang))
-        self.btn_week.config(text=t("chart_7day", lang))
-        self.btn_30day.config(text=t("chart_30day", lang))
+        if self._tab_built(self.tab_charts):
+            self.btn_daily.config(text=t("chart_daily", lang))
+            self.btn_week.config(text=t("chart_7day", lang))
+            self.btn_30day.config(text=t("chart_30day", lang))
         # Update popup title if open
         if self._team_compare_win and self._team_compare_win.winfo_exists():
             self._team_compare_win.title(t("btn_team_compare", lang))
 
     def _save_settings(self):
         new_units = self.unit.get()
+        new_wind  = self.wind_unit.get()
         new_lang  = self.lang.get()
+        lang_changed = (new_lang != self.prefs["language"])
 
         self.prefs["units"]["temperature"]  = new_units
+        self.prefs["units"]["wind_speed"]   = new_wind
         self.prefs["language"]              = new_lang
         self.prefs["alerts"]["enabled"]     = self.alert_chk.get()
+        self.alert_scheduler.set_interval(self._alert_poll_interval())
         self.prefs["chart"]["default_type"] = self.chart_type.get()
         preferences.save_preferences(self.prefs)
 
@@ -421,92 +787,255 @@ class WeatherDashboard(tk.Tk):
         try:
             self.weather.set_lang(new_lang)
             self.weather.set_units(new_units)
+            self.weather.set_wind_speed(new_wind)
         except Exception:
             pass
 
         self._apply_theme(self.theme_var.get())
         self._apply_language_texts()
-        self.refresh_all()
+        # Units are converted client-side; only a language change needs new data
+        if lang_changed:
+            self.refresh_all()
+        else:
+            self._render()
 
     # ---------- Data refresh ----------
-    def refresh_all(self):
+    def refresh_all(self, city=None):
+        """
+        Fetch `city` in the background and render it when done. Without a
+        city this is an auto-refresh of the saved one, and errors only show
+        in the status bar.
+        """
+        manual = city is not None
+        city = city or self.prefs["location"]["default_city"]
+        want_hourly = (self.freq.get() == "daily")
+        self._set_loading(True)
+        self._refresh_t0 = time.perf_counter()
+        self._refresh_ts = tracer.now()
+        self.scheduler.started()
+        self._update_refresh_status()
+        # Every refresh here is about to be shown, and the scheduler aims it just
+        # past the cache's fresh_until, so it waits for new data rather than
+        # getting a stale copy whose revalidation would never reach the screen
+        self.worker.submit("refresh", lambda: self._fetch(city, want_hourly),
+                           on_done=lambda snap: self._on_fetched(city, snap),
+                           on_error=lambda e: self._on_fetch_failed(city, e, manual))
+
+    def _fetch(self, city, want_hourly):
+        """Worker thread: network and parsing only, never touches Tk."""
+        with metrics.span("refresh.fetch"):
+            snap = self.weather.get_snapshot(city, max_stale=0)
+        with metrics.span("refresh.parse"):
+            snap.model  # parse off the UI thread
+        self.store.save(snap, self.weather.lang)
+        if want_hourly:
+            try:
+                self.weather.get_lane(snap.lat, snap.lon, "hourly", max_stale=0)
+            except ValueError:
+                pass  # chart falls back to the daily point
+        return snap
+
+    def _on_fetched(self, city, snap):
+        self._set_loading(False)
+        # Next auto-refresh lands just after the provider can have newer data
+        self.scheduler.align_to(self.weather.next_expected_update(snap.lat, snap.lon),
+                                PROVIDER_CADENCE)
+        self.scheduler.finished(True)
+        self._update_refresh_status()
+        if city != self.prefs["location"]["default_city"]:
+            self.prefs["location"]["default_city"] = city
+            preferences.save_preferences(self.prefs)
+        self._snapshot = self.alert_poller.reconcile(snap)
+        with metrics.span("refresh.render"):
+            self._render()
+        metrics.record("refresh.total", (time.perf_counter() - self._refresh_t0) * 1000)
+        tracer.complete("refresh", "refresh", self._refresh_ts, tracer.now() - self._refresh_ts, city=city)
+        tracer.cycle_done()
+
+    def _on_fetch_failed(self, city, error, manual):
+        self._set_loading(False)
+        tracer.complete("refresh", "refresh", self._refresh_ts, tracer.now() - self._refresh_ts,
+                        city=city, error=str(error))
+        tracer.cycle_done()
+        self.scheduler.finished(False)
+        self._update_refresh_status()
+        if not manual and self._snapshot is not None:
+            return  # keep showing the last data; the scheduler backs off
         lang = self.prefs["language"]
-        city   = self.city_var.get()
-        cur    = self.weather.get_current(city)
-        daily  = self.weather.get_daily(city)
-        alerts = self.weather.get_alerts(city)
-
-        if alerts and self.prefs["alerts"]["enabled"]:
-            ev    = alerts[0]["event"]
-            until = datetime.fromtimestamp(alerts[0]["end"]).strftime("%I:%M %p")
-            self.alert_var.set(f"⚠ {ev} {t('alerts_until', lang)} {until}")
-            self._flash_banner()
+        if "no match" in str(error):
+            messagebox.showerror(t("city_not_found", lang),
+                                 t("city_not_found_msg", lang).format(city=city))
         else:
-            self.alert_var.set("")
-            if hasattr(self, "_flash_job"): self.after_cancel(self._flash_job)
-            self.alert_lbl.configure(background=self.bg_color)
-
-        icon = load_icon(cur["weather"][0]["icon"])
-        self.current_icon.config(image=icon); self.current_icon.image = icon
-        temp = round(cur["temp"])
-        if self.prefs["units"]["temperature"] == "metric":
-            temp = round((temp-32)*5/9)
-        self.current_lbl.config(text=f"{temp}°")
-
-        today_hi = round(daily[0]["temp"]["max"])
-        today_lo = round(daily[0]["temp"]["min"])
-        if self.prefs["units"]["temperature"] == "metric":
-            today_hi = round((today_hi-32)*5/9)
-            today_lo = round((today_lo-32)*5/9)
-        pop = int(daily[0].get("pop",0)*100)
-        hum = cur.get("humidity",0)
-        uv  = cur.get("uvi",0)
-        self.details_lbl.config(
-            text=f"H:{today_hi} L:{today_lo}   Precip:{pop}%   Humidity:{hum}%   UV:{uv}"
+            messagebox.showerror(t("app_title", lang), str(error))
+
+    # ---------- Alerts lane ----------
+    def _alert_poll_interval(self):
+        a = self.prefs["alerts"]
+        if not a["enabled"]:
+            return 0
+        seconds = a.get("poll_seconds")
+        if seconds is None:
+            # Spend a fixed share of the background budget, leaving the rest for prefetches
+            seconds = self.weather.limiter.share_interval(ALERT_BUDGET_SHARE, BACKGROUND)
+        return seconds
+
+    def _poll_alerts(self):
+        snap = self._snapshot
+        if snap is None:
+            self.alert_scheduler.finished(True)  # nothing on screen yet
+            return
+        self.worker.submit("alerts", lambda: self.alert_poller.poll(snap.lat, snap.lon),
+                           on_done=lambda alerts: self._on_alerts_polled(snap, alerts),
+                           on_error=self._on_alerts_failed)
+
+    def _on_alerts_failed(self, error):
+        self.alert_scheduler.finished(False)
+        if isinstance(error, QuotaExceededError) and not self._alerts_quota_hit:
+            self._alerts_quota_hit = True   # polling resumes after the UTC reset
+            self._update_refresh_status()
+
+    def _on_alerts_polled(self, polled, alerts):
+        self.alert_scheduler.finished(True)
+        if self._alerts_quota_hit:
+            self._alerts_quota_hit = False
+            self._update_refresh_status()
+        snap = self._snapshot
+        if alerts is None or snap is None or (snap.lat, snap.lon) != (polled.lat, polled.lon):
+            return  # unchanged, or the city changed meanwhile
+        self._snapshot = snap.with_alerts(alerts)
+        units = self.prefs["units"]["temperature"]
+        self._render_banner(self._snapshot.in_units(units, self.prefs["units"]["wind_speed"]).model.alerts)
+        self._render_alerts()
+
+    def _on_visibility(self, event):
+        if event.widget is self:
+            self.scheduler.set_visible(event.type == tk.EventType.Map)
+            self.alert_scheduler.set_visible(event.type == tk.EventType.Map)
+            self._update_refresh_status()
+
+    def _on_focus_change(self):
+        try:
+            focused = self.focus_displayof() is not None
+        except KeyError:
+            focused = True  # focus is in a Combobox popdown, which has no Python widget
+        self.scheduler.set_focused(focused)
+        self.alert_scheduler.set_focused(focused)
+        self._update_refresh_status()
+
+    def _update_refresh_status(self):
+        text = self.scheduler.status_text()
+        if self._alerts_quota_hit:
+            text = " · ".join(p for p in (text, t("alerts_quota", self.prefs["language"])) if p)
+        self.refresh_status.config(text=text)
+
+    def _set_loading(self, on):
+        if on:
+            self.loading.pack(side="left", padx=4)
+            self.ui.every("loading", LOADING_STEP_MS, lambda: self.loading.step(3))
+        elif not self.worker.busy("refresh"):
+            self.ui.cancel("loading")
+            self.loading.pack_forget()
+
+    def _render(self):
+        """Draw the last snapshot in the selected units (no network)."""
+        if self._snapshot is None:
+            return  # first fetch still in flight
+        lang  = self.prefs["language"]
+        units = self.prefs["units"]["temperature"]
+        snap  = self._snapshot.in_units(units, self.prefs["units"]["wind_speed"])
+        model = snap.model          # parsed once per fetch / unit system
+        cur   = model.current
+        daily = model.daily
+        alerts = model.alerts
+
+        # Everything below goes through self.view: unchanged values cost nothing
+        self._render_banner(alerts)
+
+        with metrics.span("render.icons"):
+            self.view.set_icon(self.current_icon, cur.icon, load_icon, self.current_theme)
+            for card, code in zip(self.five_cards, daily.icon.tolist()):
+                self.view.set_icon(card[0], str(code), load_icon, self.current_theme)
+
+        # Columns as plain ints once, shared by cards and table
+        columns = self._daily_columns(daily)
+        with metrics.span("render.cards"):
+            self._render_cards(snap, model, columns, units, lang)
+
+        # Update forecast table in place (item() on changed rows only)
+        with metrics.span("render.table"):
+            self.view.sync_rows(self.tree, [
+                (day.strftime("%a %m/%d"), f"{hi3}°", f"{lo3}°", f"{pop3}%")
+                for day, hi3, lo3, pop3 in zip(*columns)
+            ])
+
+        self._model = model
+        with metrics.span("render.alerts"):
+            self._render_alerts()
+        self._plot_chart()
+
+    @staticmethod
+    def _daily_columns(daily):
+        his  = daily.temp_max.round().astype(int).tolist()
+        los  = daily.temp_min.round().astype(int).tolist()
+        pops = (daily.pop*100).astype(int).tolist()
+        days = [datetime.fromtimestamp(ts) for ts in daily.dt.tolist()]
+        return days, his, los, pops
+
+    def _render_cards(self, snap, model, columns, units, lang):
+        """Current conditions and forecast card text (icons are set in _render)."""
+        cur, daily = model.current, model.daily
+        temp = round(cur.temp)
+        self.view.set(self.current_lbl, text=f"{temp}°")
+
+        today_hi = round(daily.temp_max[0])
+        today_lo = round(daily.temp_min[0])
+        pop = int(daily.pop[0]*100)
+        wind = round(cur.wind_speed, 1)
+        self.view.set(
+            self.details_lbl,
+            text=f"H:{today_hi} L:{today_lo}   Precip:{pop}%   Humidity:{cur.humidity}%   UV:{cur.uvi}\n"
+                 f"Wind:{wind} {snap.wind_unit}   Pressure:{cur.pressure} {pressure_unit(units)}"
         )
 
         # City-local timezone offset is injected by WeatherAPI
-        self.tz_offset = cur.get("timezone", 0)
+        self.tz_offset = cur.timezone
+        self._update_stale_badge()
 
-        sr = datetime.fromtimestamp(cur["sunrise"]).strftime("%I:%M %p")
-        ss = datetime.fromtimestamp(cur["sunset"]).strftime("%I:%M %p")
-        self.sunrise_lbl.config(text=f"{t('sunrise', lang)}: {sr}")
-        self.sunset_lbl.config(text=f"{t('sunset',  lang)}:  {ss}")
+        sr = datetime.fromtimestamp(cur.sunrise).strftime("%I:%M %p")
+        ss = datetime.fromtimestamp(cur.sunset).strftime("%I:%M %p")
+        self.view.set(self.sunrise_lbl, text=f"{t('sunrise', lang)}: {sr}")
+        self.view.set(self.sunset_lbl, text=f"{t('sunset',  lang)}:  {ss}")
 
         # Update forecast cards
+        days, his, los, pops = columns
         for i,card in enumerate(self.five_cards):
             if i < len(daily):
-                d = daily[i]
-                img2 = load_icon(d["weather"][0]["icon"])
-                card[0].config(image=img2); card[0].image = img2
-                day = datetime.fromtimestamp(d["dt"]).strftime("%a")
-                hi2 = round(d["temp"]["max"])
-                lo2 = round(d["temp"]["min"])
-                if self.prefs["units"]["temperature"] == "metric":
-                    hi2 = round((hi2-32)*5/9)
-                    lo2 = round((lo2-32)*5/9)
-                pop2 = int(d.get("pop",0)*100)
-                card[1].config(text=day)
-                card[2].config(text=f"H:{hi2} L:{lo2}")
-                card[3].config(text=f"{pop2}% {t('rain_word', lang)}")
-
-        # Update forecast table
-        for r in self.tree.get_children(): self.tree.delete(r)
-        for d in daily:
-            day = datetime.fromtimestamp(d["dt"]).strftime("%a %m/%d")
-            hi3 = round(d["temp"]["max"])
-            lo3 = round(d["temp"]["min"])
-            if self.prefs["units"]["temperature"] == "metric":
-                hi3 = round((hi3-32)*5/9)
-                lo3 = round((lo3-32)*5/9)
-            pop3 = int(d.get("pop",0)*100)
-            self.tree.insert("", "end",
-                             values=(day, f"{hi3}°", f"{lo3}°", f"{pop3}%"))
-
-        show_alerts(alerts, self.alerts_frame,
+                self.view.set(card[1], text=days[i].strftime("%a"))
+                self.view.set(card[2], text=f"H:{his[i]} L:{los[i]}")
+                self.view.set(card[3], text=f"{pops[i]}% {t('rain_word', lang)}")
+
+    def _render_banner(self, alerts):
+        lang = self.prefs["language"]
+        if alerts and self.prefs["alerts"]["enabled"]:
+            ev    = alerts[0].event
+            until = datetime.fromtimestamp(alerts[0].end).strftime("%I:%M %p")
+            banner = f"⚠ {ev} {t('alerts_until', lang)} {until}"
+        else:
+            banner = ""
+        if self.view.changed("banner", banner):
+            self.alert_var.set(banner)
+            if banner:
+                self.ui.every("flash", FLASH_INTERVAL, self._flash_banner, delay_ms=0)
+            else:
+                self.ui.cancel("flash")
+                self.alert_lbl.configure(background=self.bg_color)
+
+    def _render_alerts(self):
+        """Alerts tab; AlertsView diffs against what it already shows."""
+        if self._snapshot is None or not self._tab_built(self.tab_alerts):
+            return
+        show_alerts(self._snapshot.alerts, self.alerts_frame,
                     {"bg":self.bg_color, "fg":self.fg_color})
-        self._daily = daily
-        self._plot_chart()
 
     # ---------- Clock (status bar only) ----------
     def _update_clock(self):
@@ -515,72 +1044,124 @@ class WeatherDashboard(tk.Tk):
         time_str = now.strftime("%I:%M %p")
         tz_label = f"UTC{'+' if self.tz_offset//3600>=0 else ''}{self.tz_offset//3600}"
         self.status.config(text=f"{date_str} — {time_str}  ({tz_label})")
-        self.after(60000, self._update_clock)
+        self._update_stale_badge()
+
+    def _update_stale_badge(self):
+        text = ""
+        if self._snapshot is not None:
+            observed = self._snapshot.model.current.dt or self._snapshot.fetched_at
+            age = time.time() - observed
+            if age > STALE_AFTER:
+                text = "⏱ " + t("updated_ago", self.prefs["language"]).format(age=format_age(age))
+        self.view.set(self.stale_lbl, text=text)
 
     def _flash_banner(self):
         color = "red" if self._flash_state else self.bg_color
         self.alert_lbl.configure(background=color)
         self._flash_state = not self._flash_state
-        self._flash_job = self.after(FLASH_INTERVAL, self._flash_banner)
+
+    # ---------- Diagnostics (Ctrl+Shift+D) ----------
+    def _heartbeat(self):
+        # UiScheduler measured how late this tick fired: time Tk spent blocked
+        metrics.record("tk.loop_lag", self.ui.lag_ms)
+
+    def _toggle_diagnostics(self, event=None):
+        if self.tab_diag is None:
+            metrics.enabled = True
+            self.ui.every("heartbeat", HEARTBEAT_MS, self._heartbeat)
+            self._build_diagnostics()
+        elif self.nb.select() == str(self.tab_diag):
+            self.nb.hide(self.tab_diag)
+            self.ui.cancel("diagnostics")
+            return
+        else:
+            self.nb.add(self.tab_diag)
+        self.nb.select(self.tab_diag)
+        self.ui.every("diagnostics", DIAG_REFRESH_MS, self._refresh_diagnostics, delay_ms=0)
+
+    def _build_diagnostics(self):
+        f = self.tab_diag = tk.Frame(self.nb, bg=self.bg_color)
+        self.nb.add(f, text="Diagnostics")
+        bar = tk.Frame(f, bg=self.bg_color)
+        bar.pack(fill="x", padx=10, pady=(10, 0))
+        ttk.Button(bar, text="Dump JSON", command=self._dump_diagnostics).pack(side="left")
+        ttk.Button(bar, text="Reset", command=metrics.reset).pack(side="left", padx=5)
+        self.diag_info = tk.Label(bar, anchor="w", bg=self.bg_color, fg=self.fg_color)
+        self.diag_info.pack(side="left", fill="x", expand=True, padx=10)
+        self.diag_tree = ttk.Treeview(f, columns=DIAG_COLUMNS, show="headings")
+        for col in DIAG_COLUMNS:
+            self.diag_tree.heading(col, text=col if col in ("metric", "count") else f"{col} (ms)")
+            self.diag_tree.column(col, width=220 if col == "metric" else 80, anchor="w" if col == "metric" else "e")
+        self.diag_tree.pack(fill="both", expand=True, padx=10, pady=10)
+
+    def _refresh_diagnostics(self):
+        rows = [(name,) + tuple(stats[c] for c in DIAG_COLUMNS[1:])
+                for name, stats in metrics.summary().items()]
+        self.view.sync_rows(self.diag_tree, rows)
+        ui = self.ui.stats()
+        self.view.set(self.diag_info, text=f"UI tasks {ui['tasks']} · ticks {ui['ticks']} · "
+                                           f"callbacks {ui['callbacks']} · max lag {ui['max_lag_ms']} ms")
+
+    def _dump_diagnostics(self):
+        path = metrics.dump(extra={"ui": self.ui.stats(), "cache": self.weather.cache_stats})
+        self.view.set(self.diag_info, text=f"Wrote {path}")
 
     # ---------- Charting ----------
-    def _plot_chart(self):
+    def _on_lane_ready(self, where, hourly):
+        snap = self._snapshot
+        if self.freq.get() == "daily" and snap is not None and (snap.lat, snap.lon) == where:
+            self._plot_chart(hourly)
+
+    def _plot_chart(self, hourly=None):
+        with metrics.span("render.chart"):
+            self._draw_chart(hourly)
+
+    def _draw_chart(self, hourly=None):
+        """`hourly`: the hourly lane just fetched on the worker; otherwise read from the cache."""
         lang = self.prefs["language"]
         freq = self.freq.get()
 
+        if self._snapshot is None or not self._tab_built(self.tab_charts):
+            return
+        block = None
         if freq == "daily":
-            subset = self._daily[:1]
+            # Hourly lane (48 h), fetched only for this view
             subtitle = t("chart_daily", lang)
-        elif freq == "30_day":
-            subset = self._daily[:30]  # One Call may provide fewer than 30; we show what we have
-            subtitle = t("chart_30day", lang)
+            where = (self._snapshot.lat, self._snapshot.lon)
+            if hourly is None:
+                hourly = self.weather.peek_lane(*where, "hourly")     # cache only, never blocks
+            if hourly is None:
+                # Not cached (or expired): fetch on the worker, draw the daily point until it lands
+                self.worker.submit("lane", lambda: self.weather.get_lane(*where, "hourly", max_stale=0),
+                                   on_done=lambda lane: self._on_lane_ready(where, lane),
+                                   on_error=lambda e: None)   # keep the daily point
+            elif len(hourly):
+                block = hourly.take(lttb_indices(hourly.dt, hourly.temp, CHART_POINT_BUDGET))
+        if block is not None:
+            x = (block.dt - block.dt[0]) / 3600.0     # hours; keeps LTTB spacing
+            dates = [datetime.fromtimestamp(ts).strftime("%a %H:%M") for ts in block.dt.tolist()]
         else:
-            subset = self._daily[:7]
-            subtitle = t("chart_7day", lang)
-
-        dates = [datetime.fromtimestamp(d["dt"]).strftime("%m/%d") for d in subset]
-        # prefer "day" temp if present, else fallback to max
-        temps_raw = [d["temp"].get("day", d["temp"]["max"]) for d in subset]
+            if freq == "daily":
+                n = 1
+            elif freq == "30_day":
+                n = 30  # One Call may provide fewer than 30; we show what we have
+                subtitle = t("chart_30day", lang)
+            else:
+                n = 7
+                subtitle = t("chart_7day", lang)
+            block = self._model.daily.head(n)
+            x = list(range(len(block)))
+            dates = [datetime.fromtimestamp(ts).strftime("%m/%d") for ts in block.dt.tolist()]
         is_metric = (self.prefs["units"]["temperature"] == "metric")
-        temps = [round((t-32)*5/9) for t in temps_raw] if is_metric else temps_raw
-        precip = [int(d.get("pop",0)*100) for d in subset]
-        humid = [d.get("humidity",0) for d in subset]
-
-        chart_type = self.chart_type.get()
-        self.ax.clear()
-        ax2 = self.ax.twinx()
-        self.ax.set_title(f"{t('chart_title', lang)} — {subtitle}")
-        self.ax.set_ylabel("Temp / Precip (%)")
-        ax2.set_ylabel("Humidity (%)")
-
         temp_label = t("temp_label_c", lang) if is_metric else t("temp_label_f", lang)
 
-        if chart_type in ("line", "both"):
-            self.ax.plot(dates, temps, marker="o", label=temp_label)
-            self.ax.plot(dates, precip, marker="x", linestyle="--", label="Precip (%)")
-            ax2.plot(dates, humid, marker="s", linestyle=":", color="tab:blue", label="Humidity (%)")
-
-        if chart_type in ("bar", "both"):
-            width = 0.35
-            x = list(range(len(dates)))
-            self.ax.bar([i - width/2 for i in x], temps, width=width, alpha=0.6, label=temp_label)
-            self.ax.bar([i + width/2 for i in x], precip, width=width, alpha=0.4, label="Precip (%)")
-            ax2.plot(dates, humid, marker="s", linestyle=":", color="tab:blue", label="Humidity (%)")
-
-        self.ax.set_xticks(range(len(dates)))
-        self.ax.set_xticklabels(dates, rotation=45)
-
+        pred = None
         try:
-            pdx, pt = self.predictor.get_series(self.city_var.get(), freq)
-            self.ax.plot(pdx, pt, linestyle=":", color="purple", label="ML Pred")
+            pred = self.predictor.get_series(self.city_var.get(), freq)
         except Exception:
             pass
 
-        h1, l1 = self.ax.get_legend_handles_labels()
-        h2, l2 = ax2.get_legend_handles_labels()
-        self.ax.legend(h1 + h2, l1 + l2, loc="upper left")
-
-        self.canvas.draw()
-        mplcursors.cursor(self.ax, hover=True).connect(
-            "add", lambda sel: sel.annotation.set_text(f"{sel.artist.get_label()}: {sel.target[1]:.1f}")
-        )
+        # "day" temp (falls back to max when absent; see SeriesBlock)
+        self.chart.update(x, block.temp, block.pop*100, block.humidity, dates,
+                          title=f"{t('chart_title', lang)} — {subtitle}",
+                          temp_label=temp_label, chart_type=self.chart_type.get(), pred=pred)
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
+from core import startup  # first: starts the time-to-first-paint clock
+from core import tracing
+import argparse
 import os
 import sys
 import tkinter as tk
 from tkinter import messagebox
-import requests
 from dotenv import load_dotenv
 
 from core.weather_api import WeatherAPI
@@ -11,7 +13,25 @@ from core.temp_predictor import TempPredictor
 from gui import launch_gui
 import preferences  # NEW: read units/lang from saved prefs
 
+startup.mark("imports")
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Weather dashboard")
+    ap.add_argument("--trace", nargs="?", const="", default=None, metavar="PATH",
+                    help="record a Chrome/Perfetto trace of startup and refresh cycles "
+                         "(default path data/trace-<time>.json; env WEATHER_TRACE)")
+    ap.add_argument("--trace-cycles", type=int, default=None, metavar="N",
+                    help="refresh cycles to trace before writing the file (default 1)")
+    return ap.parse_args(argv)
+
+
 def main():
+    args = parse_args()
+    if tracing.configure(args.trace, args.trace_cycles):
+        # The imports above ran before tracing started; show them as one span
+        tracing.tracer.complete("imports", "import", 0, tracing.tracer.now())
+
     # 1) Create & hide root so messageboxes have a valid parent
     root = tk.Tk()
     root.withdraw()
@@ -43,43 +63,20 @@ def main():
     # Load saved preferences for units/lang so API matches the UI
     prefs = preferences.load_preferences()
     units = prefs.get("units", {}).get("temperature", "imperial")
+    wind  = prefs.get("units", {}).get("wind_speed", "mph")
     lang  = prefs.get("language", "en")
 
-    # 5) Test & launch
+    # 5) Launch. The window paints the last saved snapshot right away; the key
+    #    check and the first real refresh run in the background (see gui.py).
     try:
-        print(f"Testing key: {API_KEY[:4]}...{API_KEY[-4:]}")
-        resp = requests.get(
-            "https://api.openweathermap.org/data/2.5/weather",
-            params={"q": "London", "appid": API_KEY, "units": units, "lang": lang},
-            timeout=10
-        )
-        if resp.status_code == 200:
-            print("Key works! Launching app…")
-            root.destroy()
-            launch_gui(WeatherAPI(API_KEY, units=units, lang=lang), TempPredictor())
-        else:
-            messagebox.showerror(
-                title="API Rejected",
-                message=f"Status {resp.status_code}\n\n{resp.text}",
-                parent=root
-            )
-            root.destroy()
-            sys.exit(1)
-
+        api = WeatherAPI(API_KEY, units=units, lang=lang, wind_speed=wind)
+        startup.mark("api_ready")
     except Exception as e:
-        # Safe fallback if Tk context is gone
-        try:
-            messagebox.showerror(
-                title="Connection Failed",
-                message=str(e),
-                parent=root
-            )
-        except Exception:
-            print("Connection Failed:", e)
-        finally:
-            try: root.destroy()
-            except Exception: pass
+        messagebox.showerror(title="Startup Failed", message=str(e), parent=root)
+        root.destroy()
         sys.exit(1)
+    root.destroy()
+    launch_gui(api, TempPredictor())
 
 if __name__ == "__main__":
     main()
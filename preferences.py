@@ -33,7 +33,8 @@ DEFAULT_PREFS = {
         "interval_seconds": 900                # 0 disables auto-refresh
     },
     "alerts": {
-        "enabled": True
+        "enabled": True,
+        "poll_seconds": None                   # alerts-only lane; None = paced by the API budget, 0 disables
     }
 }
 
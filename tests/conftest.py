@@ -0,0 +1,110 @@
+# tests/conftest.py
+"""Fakes shared by the test modules: HTTP transport, WeatherAPI factory, clock and Tk loop."""
+
+import pytest
+
+from core.gazetteer import Gazetteer
+from core.geocode_cache import GeocodeCache
+from core.rate_limit import QuotaLimiter
+from core.weather_api import WeatherAPI
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeTransport:
+    """Answers get() with FakeResponse(handler(url, params)); records every call."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []     # urls
+        self.params = []
+
+    def get(self, url, params=None, timeout=None):
+        params = dict(params or {})
+        self.calls.append(url)
+        self.params.append(params)
+        return FakeResponse(self.handler(url, params))
+
+
+def no_network(url, params):
+    """FakeTransport handler for tests that must be served from caches."""
+    raise AssertionError(f"network used: {url}")
+
+
+class FakeClock:
+    """Manual wall clock; set or advance `now`."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeTk:
+    """after() / after_cancel() driven by a manual clock (seconds)."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.jobs = {}
+        self._next_id = 0
+
+    def after(self, ms, fn):
+        self._next_id += 1
+        self.jobs[self._next_id] = (self.now + ms / 1000, fn)
+        return self._next_id
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def advance(self, seconds, block=0.0):
+        """Run due jobs up to now + seconds; each callback blocks the loop `block` s."""
+        end = self.now + seconds
+        while self.jobs:
+            job, (due, fn) = min(self.jobs.items(), key=lambda kv: kv[1][0])
+            if due > end:
+                break
+            del self.jobs[job]
+            self.now = max(self.now, due) + block
+            fn()
+        self.now = max(self.now, end)
+
+
+@pytest.fixture
+def api_kwargs():
+    """Client arguments for offline tests: in-memory geocode cache, no gazetteer, a limiter that never waits."""
+    return lambda: {"geocode_cache": GeocodeCache(":memory:"), "gazetteer": Gazetteer.empty(),
+                    "limiter": QuotaLimiter(rate_per_minute=60000, burst=100)}
+
+
+@pytest.fixture
+def make_api(api_kwargs):
+    """Factory for an offline WeatherAPI; with a handler it talks to a FakeTransport."""
+    def make(handler=None, **kwargs):
+        kwargs = {**api_kwargs(), **kwargs}
+        if handler is not None:
+            kwargs["transport"] = FakeTransport(handler)
+        return WeatherAPI(api_key="KEY123", **kwargs)
+    return make
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_tk():
+    return FakeTk()
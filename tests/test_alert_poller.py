@@ -0,0 +1,87 @@
+# tests/test_alert_poller.py
+
+import pytest
+
+from core.weather_api import ALERTS_EXCLUDE, AlertPoller
+
+FLOOD = {"sender_name": "NWS", "event": "Flood Watch", "start": 100, "end": 200, "description": "x"}
+WIND = {"sender_name": "NWS", "event": "Wind Advisory", "start": 150, "end": 250, "description": "y"}
+
+
+class Alerts:
+    """Geocodes to Miami; One Call answers with whatever `alerts` currently holds."""
+
+    def __init__(self):
+        self.alerts = []
+
+    def __call__(self, url, params):
+        if "/geo/" in url:
+            return [{"name": params["q"], "lat": 25.77, "lon": -80.19}]
+        payload = {"lat": 25.77, "lon": -80.19, "timezone_offset": 0}
+        if self.alerts:
+            payload["alerts"] = list(self.alerts)
+        return payload
+
+
+def ticking_clock(now):
+    """A clock that moves one second per reading, so every poll is newer."""
+    def clock():
+        clock.now += 1
+        return clock.now
+    clock.now = now
+    return clock
+
+
+@pytest.fixture
+def feed():
+    return Alerts()
+
+
+@pytest.fixture
+def api(make_api, feed):
+    return make_api(feed)
+
+
+def test_alerts_only_request_is_never_cached(api, feed):
+    assert api.get_alerts_only(25.77, -80.19) == []
+    feed.alerts = [FLOOD]
+    assert api.get_alerts_only(25.77, -80.19) == [FLOOD]
+    assert [p["exclude"] for p in api.transport.params] == [ALERTS_EXCLUDE] * 2
+
+
+def test_poll_reports_only_changes(api, feed):
+    poller = AlertPoller(api, clock=ticking_clock(1000.0))
+    assert poller.poll(25.77, -80.19) == []          # first look is news
+    assert poller.poll(25.77, -80.19) is None
+    feed.alerts = [FLOOD]
+    assert poller.poll(25.77, -80.19) == [FLOOD]
+    assert poller.poll(25.77, -80.19) is None
+    feed.alerts = [dict(FLOOD, description="updated")]
+    assert poller.poll(25.77, -80.19) is not None
+    feed.alerts = []
+    assert poller.poll(25.77, -80.19) == []
+
+
+def test_reconcile_prefers_newer_poll_over_cached_bundle(api, feed):
+    clock = ticking_clock(2000.0)
+    api.response_cache._clock = clock
+    poller = AlertPoller(api, clock=clock)
+    first = api.get_snapshot("Miami, US")
+    assert poller.reconcile(first).alerts == []
+
+    feed.alerts = [FLOOD]
+    assert poller.poll(25.77, -80.19) == [FLOOD]
+    cached = api.get_snapshot("Miami, US", max_stale=0)     # still fresh: served from the cache
+    assert len(api.transport.calls) == 3                      # geocode, bundle, alerts poll
+    assert cached.fetched_at == first.fetched_at              # when it was downloaded, not built
+    shown = poller.reconcile(cached)
+    assert shown.alerts == [FLOOD]
+    assert cached.alerts == []                               # original untouched
+    assert poller.poll(25.77, -80.19) is None                # not reported as new again
+
+    clock.now += 3600                                         # the bundle expires
+    feed.alerts = []
+    fresh = api.get_snapshot("Miami, US", max_stale=0)
+    assert fresh.fetched_at > first.fetched_at
+    assert poller.reconcile(fresh) is fresh
+    assert poller.poll(25.77, -80.19) is None                # the refresh already showed "none"
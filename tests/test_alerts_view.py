@@ -0,0 +1,144 @@
+from types import SimpleNamespace
+
+import pytest
+
+from features import weather_alerts
+from features.weather_alerts import OVERSCAN, AlertsView, alert_key, layout, visible_range
+
+ROW_HEIGHT = 100       # what every fake card measures
+
+
+class FakeWidget:
+    """Enough of a Tk widget for AlertsView: records creation and destruction."""
+    created = []
+
+    def __init__(self, *args, **kwargs):
+        self.options = dict(kwargs)
+        self.destroyed = False
+        FakeWidget.created.append(self)
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+    def pack(self, **kwargs):
+        pass
+
+    def pack_forget(self):
+        pass
+
+    def bind(self, *args):
+        pass
+
+    def set(self, *args):
+        pass
+
+    def destroy(self):
+        self.destroyed = True
+
+    def update_idletasks(self):
+        pass
+
+    def winfo_reqheight(self):
+        return ROW_HEIGHT
+
+    def winfo_width(self):
+        return 600
+
+
+class FakeCanvas(FakeWidget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scroll_y = 0
+        self.height = 300
+        self.windows = {}       # id -> frame
+        self._ids = 0
+
+    def yview(self, *args):
+        pass
+
+    def canvasy(self, y):
+        return self.scroll_y + y
+
+    def winfo_height(self):
+        return self.height
+
+    def create_window(self, x, y, window, anchor):
+        self._ids += 1
+        self.windows[self._ids] = window
+        return self._ids
+
+    def coords(self, item, x, y):
+        pass
+
+    def itemconfigure(self, item, **kwargs):
+        pass
+
+    def delete(self, item):
+        del self.windows[item]
+
+
+@pytest.fixture
+def view(monkeypatch):
+    FakeWidget.created = []
+    fake_tk = SimpleNamespace(Frame=FakeWidget, Label=FakeWidget, Scrollbar=FakeWidget, Canvas=FakeCanvas,
+                              RIDGE="ridge", X="x", BOTH="both")
+    monkeypatch.setattr(weather_alerts, "tk", fake_tk)
+    return AlertsView(FakeWidget(), {"bg": "#fff", "fg": "#000"})
+
+
+def make_alerts(n):
+    return [{"sender_name": "NWS", "event": f"Alert {i}", "start": i, "end": i + 1, "description": "x"}
+            for i in range(n)]
+
+
+def test_alert_key_ignores_description_changes():
+    a = {"sender_name": "NWS", "event": "Flood Watch", "start": 1, "end": 2, "description": "old"}
+    b = dict(a, description="updated text")
+    assert alert_key(a) == alert_key(b)
+    assert alert_key(a) != alert_key(dict(a, end=3))
+
+
+def test_layout_stacks_rows_with_gap():
+    assert layout([]) == []
+    assert layout([100, 50, 80], gap=10) == [10, 120, 180]
+
+
+def test_visible_range_only_covers_viewport():
+    heights = [100] * 50
+    tops = layout(heights, gap=10)             # row i spans [10 + 110 i, 110 + 110 i]
+    assert list(visible_range(tops, heights, 0, 300)) == [0, 1, 2]
+    assert list(visible_range(tops, heights, 1105, 1300)) == [10, 11]
+    assert list(visible_range(tops, heights, 115, 119)) == []      # inside a gap
+    assert list(visible_range(tops, heights, 10_000, 11_000)) == []
+
+
+def test_unchanged_alerts_keep_their_row_widgets(view):
+    alerts = make_alerts(2)
+    view.update(alerts)
+    rows = dict(view._rows)
+    created = len(FakeWidget.created)
+    view.update([dict(a) for a in alerts])                # same alerts, new dicts
+    assert view._rows == rows
+    assert len(FakeWidget.created) == created
+
+    view.update(alerts[1:] + make_alerts(3)[2:])          # one expired, one new
+    assert view._rows[alert_key(alerts[1])] is rows[alert_key(alerts[1])]
+    assert rows[alert_key(alerts[0])].frame.destroyed
+
+
+def test_only_the_visible_window_is_realized(view):
+    view.update(make_alerts(100))
+    span = ROW_HEIGHT + weather_alerts.ROW_GAP
+    per_screen = (view.canvas.height + 2 * OVERSCAN) // span + 2
+    assert 0 < len(view._rows) <= per_screen
+    assert len(view.canvas.windows) == len(view._rows)
+
+    first = dict(view._rows)
+    view.canvas.scroll_y = 50 * span
+    view._on_scroll(0.5, 0.55)
+    assert len(view._rows) <= per_screen
+    assert not set(first) & set(view._rows)
+    assert all(row.frame.destroyed for row in first.values())   # released, not kept around
+    keys = [alert_key(a) for a in make_alerts(100)]
+    shown = sorted(keys.index(k) for k in view._rows)
+    assert shown[0] <= 50 <= shown[-1]
@@ -0,0 +1,55 @@
+# tests/test_async_weather_api.py
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from core.async_weather_api import AsyncWeatherAPI, retry_delay
+
+
+def test_retry_delay_matches_urllib3_backoff():
+    assert [retry_delay(n) for n in (1, 2, 3)] == [0.0, 2.0, 4.0]
+    assert retry_delay(3, retry_after="7") == 7.0
+
+
+async def _run_against_fake_server(cities, client_kwargs):
+    hits = {"onecall": 0}
+
+    async def geo(request):
+        q = request.query["q"]
+        return web.json_response([] if q == "Atlantis" else [{"lat": 25.77, "lon": -80.19}])
+
+    async def onecall(request):
+        hits["onecall"] += 1
+        if hits["onecall"] == 1:
+            return web.Response(status=503)  # first call is retried
+        return web.json_response({"timezone_offset": -14400,
+                                  "current": {"temp": 81.0}, "daily": []})
+
+    app = web.Application()
+    app.router.add_get("/geo", geo)
+    app.router.add_get("/onecall", onecall)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with AsyncWeatherAPI("KEY123", units="metric", **client_kwargs) as api:
+            api.BASE_URL = f"http://127.0.0.1:{port}"
+            api.GEO_URL = f"http://127.0.0.1:{port}/geo"
+            return await api.get_snapshots(cities), hits
+    finally:
+        await runner.cleanup()
+
+
+def test_batch_snapshots_retry_and_isolate_errors(api_kwargs):
+    results, hits = asyncio.run(_run_against_fake_server(["Miami", "Atlantis"], api_kwargs()))
+    assert [r.city for r in results] == ["Miami", "Atlantis"]
+    assert results[0].snapshot.current == {"temp": 81.0, "timezone": -14400}
+    assert isinstance(results[1].error, ValueError)
+    assert hits["onecall"] == 2
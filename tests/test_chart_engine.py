@@ -0,0 +1,70 @@
+# tests/test_chart_engine.py
+
+from types import SimpleNamespace
+
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import gui
+
+
+class RecordingCanvas(FigureCanvasAgg):
+    """Agg canvas standing in for FigureCanvasTkAgg; counts full draws and blits."""
+
+    def __init__(self, fig, master=None):
+        super().__init__(fig)
+        self.draws = 0
+        self.blits = 0
+
+    def draw(self):
+        self.draws += 1
+        super().draw()
+
+    def blit(self, bbox=None):
+        self.blits += 1
+
+
+@pytest.fixture
+def chart(monkeypatch):
+    monkeypatch.setattr(gui, "backend_tkagg", SimpleNamespace(FigureCanvasTkAgg=RecordingCanvas))
+    monkeypatch.setattr(gui, "mplcursors", SimpleNamespace(
+        cursor=lambda *a, **kw: SimpleNamespace(connect=lambda *a, **kw: None)))
+    return gui.ChartEngine(master=None)
+
+
+def show(chart, temps, title="7-Day", chart_type="both"):
+    n = len(temps)
+    chart.update(range(n), temps, [20.0] * n, [60.0] * n, [f"d{i}" for i in range(n)],
+                 title, "Temp (°C)", chart_type)
+
+
+def counts(chart):
+    return chart.canvas.draws, chart.canvas.blits
+
+
+def test_data_change_within_the_layout_blits(chart):
+    show(chart, [21.0, 23.0, 22.0])
+    draws, blits = counts(chart)
+    show(chart, [24.0, 22.5, 21.0])                       # same ticks and limits
+    assert counts(chart) == (draws, blits + 1)
+
+
+def test_layout_change_forces_a_full_draw(chart):
+    show(chart, [21.0, 23.0, 22.0])
+    draws, blits = counts(chart)
+    show(chart, [21.0, 23.0, 35.0])                       # y limit 30 -> 40
+    assert counts(chart) == (draws + 1, blits)
+    show(chart, [21.0, 23.0, 35.0], title="30-Day")
+    assert counts(chart) == (draws + 2, blits)
+    show(chart, [21.0, 23.0, 35.0, 30.0], title="30-Day")  # more points: new x range
+    assert counts(chart) == (draws + 3, blits)
+
+
+def test_theme_change_invalidates_the_background(chart):
+    show(chart, [21.0, 23.0, 22.0])
+    before = chart._background
+    chart.set_theme("#2E3F4F", "#FFFFFF")
+    assert chart._background is not before                # recaptured by the full draw
+    draws, blits = counts(chart)
+    show(chart, [21.0, 23.0, 22.0])                       # layout forgotten: no blit of the old one
+    assert counts(chart) == (draws + 1, blits)
@@ -0,0 +1,56 @@
+# tests/test_data_worker.py
+
+import threading
+import time
+
+from core.data_worker import DataWorker
+
+
+def wait_for(worker, results, n, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while len(results) < n and time.monotonic() < deadline:
+        worker.poll()
+        time.sleep(0.005)
+
+
+def test_result_delivered_only_on_poll():
+    worker = DataWorker()
+    got = []
+    worker.submit("refresh", lambda: 42, got.append)
+    time.sleep(0.05)
+    assert got == [] and worker.busy("refresh")
+    wait_for(worker, got, 1)
+    assert got == [42] and not worker.busy()
+    worker.shutdown()
+
+
+def test_newer_submit_supersedes_running_job():
+    worker = DataWorker()
+    release = threading.Event()
+    got = []
+    worker.submit("refresh", lambda: release.wait(1) and "old", got.append)
+    worker.submit("refresh", lambda: "new", got.append)
+    release.set()
+    wait_for(worker, got, 1)
+    time.sleep(0.05)
+    worker.poll()
+    assert got == ["new"]
+    worker.shutdown()
+
+
+def test_errors_and_cancel():
+    worker = DataWorker()
+    errors, got = [], []
+
+    def boom():
+        raise ValueError("API error: 500")
+
+    worker.submit("refresh", boom, got.append, errors.append)
+    wait_for(worker, errors, 1)
+    assert isinstance(errors[0], ValueError) and got == []
+
+    worker.submit("lane", lambda: 1, got.append)
+    worker.cancel("lane")
+    time.sleep(0.05)
+    assert worker.poll() == 0 and got == [] and not worker.busy("lane")
+    worker.shutdown()
@@ -0,0 +1,27 @@
+# tests/test_downsample.py
+
+import numpy as np
+
+from core.downsample import lttb, lttb_indices
+
+
+def test_short_series_untouched():
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 10).tolist() == [0, 1, 2]
+
+
+def test_budget_and_endpoints():
+    x = np.arange(48)
+    y = np.sin(x / 5.0)
+    idx = lttb_indices(x, y, 12)
+    assert len(idx) == 12
+    assert idx[0] == 0 and idx[-1] == 47
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_keeps_spikes():
+    x = np.arange(60)
+    y = np.zeros(60)
+    y[31] = 10.0
+    xs, ys = lttb(x, y, 8)
+    assert 31 in xs.tolist()
+    assert ys.max() == 10.0
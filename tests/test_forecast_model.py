@@ -0,0 +1,42 @@
+# tests/test_forecast_model.py
+
+import json
+import os
+
+import numpy as np
+
+from core.forecast_model import ForecastModel, SeriesBlock
+from core.weather_api import WeatherSnapshot
+
+CASSETTE = os.path.join(os.path.dirname(__file__), "fixtures", "miami.cassette.json")
+
+
+def load_bundle():
+    with open(CASSETTE, encoding="utf-8") as f:
+        return json.load(f)["interactions"][1]["body"]
+
+
+def test_model_columns_and_records():
+    model = ForecastModel.from_bundle(load_bundle())
+    assert model.current.icon == "02d"
+    assert model.current.timezone == 0            # injected later by WeatherAPI
+    assert len(model.daily) == 8
+    assert model.daily.temp_max.dtype == np.float64
+    assert model.daily.temp_max[0] == 31.8
+    assert model.daily.icon[0] == "10d"
+    assert model.alerts[0].key == ("NWS Miami FL", "Heat Advisory", 1752422400, 1752458400)
+    assert model.hourly is None
+
+
+def test_hourly_block_uses_scalar_temp():
+    block = SeriesBlock.from_records([{"dt": 1, "temp": 20.5, "pop": 0.1}, {"dt": 2, "temp": 21.0}])
+    assert block.temp.tolist() == block.temp_max.tolist() == [20.5, 21.0]
+    assert block.head(1).pop.tolist() == [0.1]
+
+
+def test_snapshot_model_built_once_per_view():
+    snap = WeatherSnapshot.from_bundle("Miami", 25.77, -80.19, load_bundle())
+    assert snap.model is snap.model
+    imperial = snap.in_units("imperial")
+    assert imperial.model is not snap.model
+    assert round(imperial.model.current.temp, 1) == 84.9
@@ -0,0 +1,74 @@
+# tests/test_gazetteer.py
+
+import numpy as np
+
+from conftest import no_network
+from core.gazetteer import Gazetteer, fold
+
+ROWS = [
+    # key, name, admin, country, lat, lon, population
+    ("london", "London", "", "GB", 51.5, -0.12, 8_900_000),
+    ("london", "London", "", "CA", 42.98, -81.25, 350_000),
+    ("miami", "Miami", "FL", "US", 25.77, -80.19, 440_000),
+    ("miami beach", "Miami Beach", "FL", "US", 25.79, -80.13, 90_000),
+    ("new york", "New York City", "NY", "US", 40.71, -74.0, 8_800_000),
+    ("new york city", "New York City", "NY", "US", 40.71, -74.0, 8_800_000),
+    ("sao paulo", "São Paulo", "", "BR", -23.55, -46.64, 10_000_000),
+]
+
+
+def make_gazetteer():
+    return Gazetteer({
+        "key": np.array([r[0].encode() for r in ROWS], dtype="S24"),
+        "name": np.array([r[1].encode("utf-8") for r in ROWS], dtype="S24"),
+        "admin": np.array([r[2].encode() for r in ROWS], dtype="S2"),
+        "country": np.array([r[3].encode() for r in ROWS], dtype="S2"),
+        "lat": np.array([r[4] for r in ROWS], dtype=np.float32),
+        "lon": np.array([r[5] for r in ROWS], dtype=np.float32),
+        "population": np.array([r[6] for r in ROWS], dtype=np.uint32),
+    })
+
+
+def test_fold():
+    assert fold("  São   Paulo ") == "sao paulo"
+
+
+def test_complete_orders_by_population():
+    g = make_gazetteer()
+    assert g.complete("Mia") == ["Miami, FL, US", "Miami Beach, FL, US"]
+    assert g.complete("new") == ["New York City, NY, US"]     # alias rows collapse
+    assert g.complete("sao") == ["São Paulo, BR"]
+    assert g.complete("zzz") == []
+    assert g.complete("l", limit=1) == ["London, GB"]
+
+
+def test_resolve_forms():
+    g = make_gazetteer()
+    assert g.resolve("London") == (np.float32(51.5), np.float32(-0.12))
+    assert g.resolve("London, CA")[0] == np.float32(42.98)
+    assert g.resolve("london, uk")[0] == np.float32(51.5)
+    assert g.resolve("Miami, FL, US")[0] == np.float32(25.77)
+    assert g.resolve("Miami, FL")[0] == np.float32(25.77)
+    assert g.resolve("Miami, GA, US") is None
+    assert g.resolve("Atlantis") is None
+
+
+def test_geocode_prefers_gazetteer(make_api):
+    api = make_api(no_network, gazetteer=make_gazetteer())
+    lat, lon = api.geocode("Sao Paulo, BR")
+    assert round(lat, 2) == -23.55
+
+
+def test_float32_coordinates_are_sent_rounded(make_api):
+    api = make_api(lambda url, params: {"current": {"dt": 1, "temp": 20.0}}, gazetteer=make_gazetteer())
+    api.get_snapshot("Miami, US")
+    params = api.transport.params[0]
+    assert (params["lat"], params["lon"]) == (25.77, -80.19)   # not 25.770000457763672
+
+
+def test_bundled_labels_resolve_locally():
+    g = Gazetteer.load()
+    assert not any(b"," in name for name in g._cols["name"])     # a comma would split the label
+    i = int(np.flatnonzero(g._cols["name"] == "Mianzhu".encode())[0])
+    assert g.label(i) == "Mianzhu, CN"
+    assert g.resolve(g.label(i)) == (float(g._cols["lat"][i]), float(g._cols["lon"][i]))
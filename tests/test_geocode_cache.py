@@ -0,0 +1,32 @@
+# tests/test_geocode_cache.py
+
+from core.geocode_cache import GeocodeCache, normalize_city
+
+
+def test_normalize_city():
+    assert normalize_city("  New   York ,US ") == "new york,us"
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "geo.db")
+    GeocodeCache(path).put("Miami", "en", 25.77, -80.19)
+    assert GeocodeCache(path).get("miami", "en") == (25.77, -80.19)
+    assert GeocodeCache(path).get("miami", "es") is None
+
+
+def test_ttl_expiry(tmp_path):
+    cache = GeocodeCache(str(tmp_path / "geo.db"), ttl_seconds=-1)
+    cache.put("Miami", "en", 25.77, -80.19)
+    assert cache.get("Miami", "en") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction(tmp_path):
+    cache = GeocodeCache(str(tmp_path / "geo.db"), max_entries=2)
+    cache.put("A", "en", 1, 1)
+    cache.put("B", "en", 2, 2)
+    cache.get("A", "en")          # A is now more recent than B
+    cache.put("C", "en", 3, 3)
+    assert cache.get("B", "en") is None
+    assert cache.get("A", "en") == (1, 1)
+    assert cache.get("C", "en") == (3, 3)
@@ -0,0 +1,29 @@
+import json
+import os
+
+from PIL import Image, ImageChops
+
+from features.current_conditions_icons import ATLAS_INDEX, ATLAS_PNG, ICON_MAP, ICONS_DIR, atlas_key
+
+
+def _atlas():
+    with open(os.path.join(ICONS_DIR, ATLAS_INDEX), encoding="utf-8") as f:
+        sprites = json.load(f)["sprites"]
+    return sprites, Image.open(os.path.join(ICONS_DIR, ATLAS_PNG)).convert("RGBA")
+
+
+def test_atlas_covers_every_icon_at_dashboard_size():
+    sprites, sheet = _atlas()
+    for fn in set(ICON_MAP.values()):
+        x, y, w, h = sprites[atlas_key(fn, (50, 50))]
+        assert (w, h) == (50, 50)
+        assert x + w <= sheet.width and y + h <= sheet.height
+
+
+def test_atlas_sprite_matches_resized_source():
+    # guards against a stale atlas after an icon changes: re-run tools/build_icon_atlas.py
+    sprites, sheet = _atlas()
+    x, y, w, h = sprites[atlas_key("rain.png", (50, 50))]
+    with Image.open(os.path.join(ICONS_DIR, "rain.png")) as src:
+        expected = src.convert("RGBA").resize((w, h), Image.LANCZOS)
+    assert ImageChops.difference(sheet.crop((x, y, x + w, y + h)), expected).getbbox() is None
@@ -0,0 +1,69 @@
+# tests/test_icon_service.py
+
+from types import SimpleNamespace
+
+import PIL.Image
+import pytest
+
+from features import current_conditions_icons as icons
+from features.current_conditions_icons import IconService
+
+
+class FakePhoto:
+    """tk.PhotoImage stand-in; records the atlas region copied into it."""
+
+    def __init__(self, file=None, width=None, height=None):
+        self.file = file
+        self.size = (width, height)
+        self.copied = []
+        self.tk = SimpleNamespace(call=lambda *args: self.copied.append(args))
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Source PNG decodes and PIL-built photos, counted."""
+    counts = {"open": 0, "pil_photos": 0}
+    real_open = PIL.Image.open
+
+    def counting_open(path, *a, **kw):
+        counts["open"] += 1
+        return real_open(path, *a, **kw)
+
+    def pil_photo(img):
+        counts["pil_photos"] += 1
+        return ("pil", img.size)
+
+    monkeypatch.setattr(icons.tk, "PhotoImage", FakePhoto)
+    monkeypatch.setattr(PIL.Image, "open", counting_open)
+    monkeypatch.setattr(icons, "ImageTk", SimpleNamespace(PhotoImage=pil_photo))
+    return counts
+
+
+def test_lru_hits_and_evicts_within_its_bound(loads):
+    service = IconService(max_entries=2)
+    first = service.get("01d")
+    assert service.get("01d") is first
+    service.get("02d")
+    service.get("01d")                     # most recent again
+    service.get("03d")                     # evicts 02d, the least recently used
+    assert len(service._photos) == 2
+    assert (service.hits, service.misses) == (2, 3)
+    assert service.get("01d") is first
+    service.get("02d")
+    assert service.misses == 4
+
+
+def test_atlas_serves_dashboard_size_without_pil(loads):
+    photo = IconService().get("10d", (50, 50))
+    assert photo.size == (50, 50) and photo.copied
+    assert loads == {"open": 0, "pil_photos": 0}
+
+
+def test_atlas_miss_falls_back_to_one_source_load(loads):
+    service = IconService()
+    photo = service.get("10d", (37, 37))           # no such size in the atlas
+    assert photo == ("pil", (37, 37))
+    assert service.get("10d", (37, 37)) is photo
+    assert loads == {"open": 1, "pil_photos": 1}
+    service.get("10d", (41, 41))                   # another size: resized from the decoded copy
+    assert loads == {"open": 1, "pil_photos": 2}
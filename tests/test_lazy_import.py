@@ -0,0 +1,26 @@
+# tests/test_lazy_import.py
+
+import os
+import subprocess
+import sys
+
+from core import lazy_import
+
+
+def test_import_deferred_until_attribute_access(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    mod = lazy_import.lazy_import("colorsys")
+    assert not mod.loaded and "colorsys" not in sys.modules
+    assert "colorsys" in lazy_import.pending()
+
+    assert mod.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1.0)
+    assert mod.loaded and "colorsys" in lazy_import.import_timings()
+    assert lazy_import.lazy_import("colorsys") is mod
+
+
+def test_features_package_is_lazy():
+    code = ("import sys, features, features.current_conditions_icons; "
+            "print('pandas' in sys.modules, 'PIL' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert out.stdout.split() == ["False", "False"], out.stderr
@@ -0,0 +1,51 @@
+# tests/test_metrics.py
+
+import json
+
+from core import weather_api
+from core.metrics import Metrics, percentile
+
+
+def test_percentile_nearest_rank():
+    data = list(range(1, 101))
+    assert percentile(data, 50) == 50
+    assert percentile(data, 99) == 99
+    assert percentile([7.0], 90) == 7.0
+
+
+def test_disabled_metrics_record_nothing():
+    m = Metrics(enabled=False)
+    with m.span("render.chart"):
+        pass
+    m.record("tk.loop_lag", 12)
+    assert m.summary() == {}
+
+
+def test_rolling_window_summary():
+    m = Metrics(enabled=True, window=10)
+    for ms in range(100):
+        m.record("refresh.fetch", ms)
+    row = m.summary()["refresh.fetch"]
+    assert row["count"] == 100          # total seen
+    assert row["p50"] == 94 and row["max"] == 99 and row["last"] == 99   # last 10 only
+    with m.span("render.table"):
+        pass
+    assert m.summary()["render.table"]["count"] == 1
+
+
+def test_dump_writes_summary_and_extras(tmp_path):
+    m = Metrics(enabled=True)
+    m.record("http.onecall", 120.0)
+    path = m.dump(str(tmp_path / "diag.json"), extra={"ui": {"ticks": 3}})
+    data = json.loads(open(path, encoding="utf-8").read())
+    assert data["metrics"]["http.onecall"]["p90"] == 120.0
+    assert data["ui"] == {"ticks": 3}
+
+
+def test_http_requests_are_timed_per_endpoint(monkeypatch, make_api):
+    m = Metrics(enabled=True)
+    monkeypatch.setattr(weather_api, "metrics", m)
+    api = make_api(lambda url, params: {"current": {"dt": 1, "temp": 20.0}, "daily": []})
+    api.get_forecast_bundle(25.77, -80.19)
+    api.get_forecast_bundle(25.77, -80.19)      # cache hit: no request, no sample
+    assert m.summary()["http.onecall"]["count"] == 1
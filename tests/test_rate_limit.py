@@ -0,0 +1,72 @@
+# tests/test_rate_limit.py
+
+import pytest
+
+from conftest import FakeClock
+from core.rate_limit import BACKGROUND, FOREGROUND, QuotaExceededError, QuotaLimiter
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    limiter = QuotaLimiter(rate_per_minute=60, burst=2, clock=clock)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(1.0)
+    clock.now += 1
+    assert limiter.reserve() == 0.0
+
+
+def test_background_cannot_spend_foreground_reserve():
+    limiter = QuotaLimiter(rate_per_minute=6000, burst=100, daily_budget=10,
+                           background_reserve=0.2, clock=FakeClock())
+    for _ in range(8):
+        limiter.reserve(BACKGROUND)
+    with pytest.raises(QuotaExceededError):
+        limiter.reserve(BACKGROUND)
+    assert limiter.reserve(FOREGROUND) == 0.0
+    assert limiter.remaining_today() == 1
+
+
+def test_budget_resets_at_utc_midnight_and_geocodes_are_free():
+    clock = FakeClock()
+    limiter = QuotaLimiter(rate_per_minute=6000, burst=100, daily_budget=1, clock=clock)
+    limiter.reserve(budgeted=False)
+    limiter.reserve()
+    with pytest.raises(QuotaExceededError):
+        limiter.reserve()
+    clock.now += 86400
+    assert limiter.reserve() == 0.0
+
+
+def test_retry_after_pauses_everyone():
+    clock = FakeClock()
+    limiter = QuotaLimiter(clock=clock)
+    limiter.defer(30)
+    assert limiter.reserve() == pytest.approx(30)
+    clock.now += 30
+    assert limiter.reserve() == 0.0
+
+
+def test_pace_interval_spreads_remaining_budget():
+    clock = FakeClock(now=86400 * 19000)       # exactly 00:00 UTC
+    limiter = QuotaLimiter(daily_budget=96, clock=clock)
+    assert limiter.pace_interval(60) == 900      # 86400 s / 96 calls
+    assert limiter.pace_interval(3600) == 3600
+
+
+def test_share_interval_spreads_a_share_of_the_allowance():
+    limiter = QuotaLimiter(daily_budget=1000, background_reserve=0.2, clock=FakeClock())
+    assert limiter.share_interval(0.25) == 86400 / 200          # a quarter of 800 background calls
+    assert limiter.share_interval(0.25, FOREGROUND) == 86400 / 250
+
+
+def test_background_pace_leaves_the_foreground_reserve():
+    clock = FakeClock(now=86400 * 19000)
+    limiter = QuotaLimiter(daily_budget=100, background_reserve=0.2, clock=clock)
+    for _ in range(20):
+        limiter.record_call()
+    assert limiter.pace_interval(60, priority=FOREGROUND) == 86400 / 80
+    assert limiter.pace_interval(60, priority=BACKGROUND) == 86400 / 60
+    for _ in range(60):
+        limiter.record_call()
+    assert limiter.pace_interval(60, priority=BACKGROUND) == 86400    # share spent: wait for reset
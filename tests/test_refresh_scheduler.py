@@ -0,0 +1,87 @@
+# tests/test_refresh_scheduler.py
+
+from core.rate_limit import QuotaLimiter
+from core.refresh_scheduler import RefreshScheduler
+
+
+def make(tk, calls, **kwargs):
+    kwargs.setdefault("jitter", 0)
+    return RefreshScheduler(tk, lambda: calls.append(tk.now), interval=60,
+                            clock=lambda: tk.now, **kwargs)
+
+
+def test_rearms_after_each_run(fake_tk):
+    tk, calls = fake_tk, []
+    sched = make(tk, calls)
+    sched.start()
+    for _ in range(3):
+        tk.advance(60)
+        tk.advance(2)
+        sched.finished(True)
+    assert calls == [60, 122, 184]
+    assert sched.last_latency == 2
+    assert sched.next_run_at == 246
+
+
+def test_backoff_on_failure_and_reset(fake_tk):
+    tk, calls = fake_tk, []
+    sched = make(tk, calls, max_backoff=200)
+    sched.start()
+    tk.advance(60); sched.finished(False)
+    assert sched.next_run_at - tk.now == 120
+    tk.advance(120); sched.finished(False)
+    assert sched.next_run_at - tk.now == 200          # capped
+    tk.advance(200); sched.finished(True)
+    assert sched.next_run_at - tk.now == 60
+
+
+def test_callback_exception_counts_as_failure(fake_tk):
+    tk = fake_tk
+
+    def boom():
+        raise ValueError("API error")
+
+    sched = RefreshScheduler(tk, boom, interval=60, jitter=0, clock=lambda: tk.now)
+    sched.start()
+    tk.advance(60)
+    assert sched.failures == 1 and sched.next_run_at == 180
+
+
+def test_pause_when_iconified_and_slow_when_unfocused(fake_tk):
+    tk, calls = fake_tk, []
+    sched = make(tk, calls, unfocused_factor=3)
+    sched.start()
+    sched.set_visible(False)
+    tk.advance(600)
+    assert calls == []
+    sched.set_visible(True)                            # overdue -> runs right away
+    assert calls == [600]
+    sched.finished(True)
+    sched.set_focused(False)
+    assert sched.next_run_at - tk.now == 180
+
+
+def test_jitter_and_quota_pacing(fake_tk):
+    tk, calls = fake_tk, []
+    sched = make(tk, calls, jitter=0.1, rng=lambda: 1.0)
+    assert sched.next_delay() == 60
+    sched.start()
+    assert sched.next_run_at == 66
+
+    limiter = QuotaLimiter(daily_budget=24, clock=lambda: 0.0)
+    paced = make(tk, calls, limiter=limiter)
+    assert paced.next_delay() == 3600                  # 24 calls spread over the day
+    paced.calls_per_refresh = 2                        # Daily view: bundle + hourly lane
+    assert paced.next_delay() == 7200
+
+
+def test_aligns_to_provider_updates(fake_tk):
+    tk, calls = fake_tk, []
+    sched = make(tk, calls)                            # interval 60
+    sched.align_to(next_update=250, cadence=600)
+    sched.start()
+    assert sched.next_run_at == 250                    # nothing new before then
+    tk.advance(250); sched.finished(True)
+    sched.align_to(next_update=850, cadence=600)
+    sched.set_interval(900)
+    assert sched.next_run_at == 1450                   # first slot past now + 900
@@ -0,0 +1,103 @@
+# tests/test_response_cache.py
+
+import time
+
+from core.weather_api import ResponseCache
+
+
+def counting_bundle(calls):
+    """Handler whose bundles are observed at 1, 2, 3, ... per One Call request."""
+    def handler(url, params):
+        calls.append(url)
+        return {"current": {"dt": len(calls), "temp": 70.0}, "daily": []}
+    return handler
+
+
+def test_fresh_hit_skips_network(make_api):
+    calls = []
+    api = make_api(counting_bundle(calls))
+    first = api.get_forecast_bundle(25.77, -80.19)
+    second = api.get_forecast_bundle(25.7701, -80.1899)  # same rounded key
+    assert second is first
+    assert len(calls) == 1
+    assert api.cache_stats == {"hits": 1, "misses": 1, "stale": 0}
+
+
+def test_exclude_and_lang_are_part_of_key(make_api):
+    calls = []
+    api = make_api(counting_bundle(calls))
+    api.get_forecast_bundle(25.77, -80.19)
+    api.get_forecast_bundle(25.77, -80.19, exclude="minutely")
+    api.set_lang("es")
+    api.get_forecast_bundle(25.77, -80.19)
+    assert len(calls) == 3
+
+
+def test_stale_served_while_revalidating(make_api):
+    calls = []
+    api = make_api(counting_bundle(calls), cache_ttl=0)
+    first = api.get_forecast_bundle(25.77, -80.19)
+    time.sleep(0.01)
+    stale = api.get_forecast_bundle(25.77, -80.19)
+    assert stale is first
+    assert api.cache_stats["stale"] == 1
+
+    deadline = time.time() + 2
+    while len(calls) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 2
+
+
+def test_max_stale_fetches_through(make_api):
+    calls = []
+    api = make_api(counting_bundle(calls), cache_ttl=0)
+    api.get_forecast_bundle(25.77, -80.19)
+    time.sleep(0.01)
+    fresh = api.get_forecast_bundle(25.77, -80.19, max_stale=0)
+    assert fresh["current"]["dt"] == 2                 # fetched in the call, not in the background
+    assert len(calls) == 2 and api.cache_stats["stale"] == 0
+
+
+def test_refresh_aligned_to_next_update_gets_new_data(make_api):
+    calls = []
+    api = make_api(counting_bundle(calls))
+    now = [1_700_000_000.0]
+    api.response_cache._clock = lambda: now[0]
+    api.get_forecast_bundle(25.77, -80.19)
+    now[0] = api.next_expected_update(25.77, -80.19) + 1    # where RefreshScheduler aims
+    assert api.get_forecast_bundle(25.77, -80.19, max_stale=0)["current"]["dt"] == 2
+    assert api.next_expected_update(25.77, -80.19) > now[0]
+
+
+def test_max_stale_miss_keeps_the_entry():
+    now = [1000.0]
+    cache = ResponseCache(ttl=10, stale_ttl=100, clock=lambda: now[0])
+    cache.store("k", {"i": 1})
+    now[0] = 1020
+    assert cache.lookup("k", max_stale=5) == (None, None)
+    assert cache.lookup("k", max_stale=60) == ({"i": 1}, ResponseCache.STALE)
+    assert cache.lookup("k")[1] == ResponseCache.STALE
+
+
+def test_lru_bound():
+    cache = ResponseCache(max_entries=2)
+    for i in range(3):
+        cache.store(("k", i), {"i": i})
+    assert cache.lookup(("k", 0)) == (None, None)
+    assert cache.lookup(("k", 2))[0] == {"i": 2}
+
+
+def test_freshness_follows_observation_time():
+    now = [10_000.0]
+    cache = ResponseCache(ttl=600, cadence=600, grace=30, recheck=120, clock=lambda: now[0])
+    cache.store("k", {"current": {"dt": 9_900}})       # observed 100 s ago
+    assert cache.next_update("k") == 10_530             # next slot + grace, not fetch + ttl
+    now[0] = 10_529
+    assert cache.lookup("k")[1] == ResponseCache.FRESH
+    now[0] = 10_531
+    assert cache.lookup("k")[1] == ResponseCache.STALE
+
+    cache.store("late", {"current": {"dt": now[0] - 590}})   # update due in 10 s
+    assert cache.next_update("late") == now[0] + 120          # but not refetched sooner
+    cache.store("lane", {"hourly": []})
+    assert cache.next_update("lane") == now[0] + 600
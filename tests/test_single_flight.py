@@ -0,0 +1,62 @@
+# tests/test_single_flight.py
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.weather_api import SingleFlight
+
+
+def test_threads_share_one_call_and_its_exception():
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError("API error: boom")
+
+    errors = []
+
+    def caller():
+        try:
+            flight.do("miami", slow)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    assert len(calls) == 1
+    assert len(errors) == 5 and len({id(e) for e in errors}) == 1
+    assert flight.shared == 4
+
+
+def test_async_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"temp": 20.0}
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("miami", fetch) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_next_call_after_completion_runs_again():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
+    with pytest.raises(KeyError):
+        flight.do("k", lambda: {}["missing"])
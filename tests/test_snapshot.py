@@ -0,0 +1,74 @@
+# tests/test_snapshot.py
+
+import pytest
+
+from core.weather_api import WeatherAPI, WeatherSnapshot
+
+BUNDLE = {
+    "timezone_offset": -14400,
+    "current": {"dt": 1700000000, "temp": 81.0, "humidity": 70, "weather": [{"icon": "01d"}]},
+    "daily": [{"dt": 1700000000, "temp": {"min": 75.0, "max": 88.0}, "pop": 0.2}],
+    "alerts": [{"event": "Heat Advisory", "start": 1700000000, "end": 1700030000}],
+}
+
+
+def answer(url, params):
+    if url.endswith("/onecall"):
+        if params["exclude"] == "current,minutely,daily,alerts":
+            return {"hourly": [{"dt": 1700000000 + 3600 * i, "temp": 20.0 + i} for i in range(48)]}
+        return BUNDLE
+    if params["q"] == "Atlantis":
+        return []
+    return [{"name": params["q"], "lat": 25.77, "lon": -80.19}]
+
+
+@pytest.fixture
+def api(make_api):
+    return make_api(answer, units="metric")
+
+
+def test_snapshot_fetches_once(api):
+
+    snap = api.get_snapshot("Miami")
+    assert isinstance(snap, WeatherSnapshot)
+    assert (snap.lat, snap.lon) == (25.77, -80.19)
+    assert snap.current["temp"] == 81.0
+    assert snap.current["timezone"] == -14400
+    assert snap.daily[0]["temp"]["max"] == 88.0
+    assert snap.alerts[0]["event"] == "Heat Advisory"
+    assert len(api.transport.calls) == 2  # one geocode + one One Call
+
+
+def test_geocode_uses_cache_after_first_lookup(api):
+
+    api.geocode("Miami")
+    api.geocode("  miami ")
+    assert api.transport.calls == [WeatherAPI.GEO_URL]
+
+
+def test_snapshots_keep_order_and_isolate_errors(api):
+
+    results = api.get_snapshots(["Miami", "Atlantis", "Tampa"], max_workers=16)
+    assert [r.city for r in results] == ["Miami", "Atlantis", "Tampa"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[2].snapshot.current["temp"] == 81.0
+
+
+def test_hourly_lane_is_separate_and_memoized(api):
+    api.set_units("imperial")
+    block = api.get_lane(25.77, -80.19, "hourly")
+    assert len(block) == 48
+    assert block.temp[0] == 68.0
+    assert api.get_lane(25.77, -80.19, "hourly") is block
+    assert api.transport.calls == [WeatherAPI.BASE_URL + "/onecall"]
+
+
+def test_peek_lane_reads_only_the_cache(api):
+    assert api.peek_lane(25.77, -80.19, "hourly") is None
+    assert api.transport.calls == []
+    block = api.get_lane(25.77, -80.19, "hourly")
+    assert api.peek_lane(25.77, -80.19, "hourly") is block
+    api.set_lang("es")                                   # other language: not cached
+    assert api.peek_lane(25.77, -80.19, "hourly") is None
+    assert len(api.transport.calls) == 1
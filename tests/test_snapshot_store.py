@@ -0,0 +1,75 @@
+# tests/test_snapshot_store.py
+
+import os
+
+from conftest import no_network
+from core.snapshot_store import SnapshotStore
+from core.weather_api import WeatherSnapshot
+
+BUNDLE = {"current": {"dt": 1_700_000_000, "temp": 30.0}, "daily": [{"dt": 1, "temp": {"max": 31}}],
+          "timezone_offset": -14400}
+
+
+def make_snapshot(city="Miami, US", fetched_at=1_700_000_100.0):
+    snap = WeatherSnapshot.from_bundle(city, 25.77, -80.19, BUNDLE)
+    snap.fetched_at = fetched_at
+    return snap
+
+
+def test_round_trip_and_canonical_source(tmp_path):
+    path = str(tmp_path / "snaps.json.gz")
+    imperial = make_snapshot().in_units("imperial")
+    SnapshotStore(path).save(imperial, lang="en")
+
+    loaded = SnapshotStore(path).load("  miami , us ", "en")
+    assert loaded.current["temp"] == 30.0 and loaded.units == "metric"
+    assert loaded.fetched_at == 1_700_000_100.0
+    assert SnapshotStore(path).load("Miami, US", "es") is None
+
+
+def test_keeps_most_recent_cities(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snaps.json.gz"), max_cities=2)
+    for city in ("A", "B", "C"):
+        store.save(make_snapshot(city))
+    assert store.cities() == ["C", "B"]
+    assert store.load("A") is None
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "snaps.json.gz"
+    path.write_bytes(b"not gzip")
+    store = SnapshotStore(str(path))
+    assert store.load("Miami, US") is None
+    store.save(make_snapshot())
+    assert SnapshotStore(str(path)).load("Miami, US") is not None
+    assert not os.path.exists(str(path) + ".tmp")
+
+
+def test_prime_serves_without_network(monkeypatch, make_api):
+    api = make_api(no_network, units="metric")
+    now = BUNDLE["current"]["dt"] + 60
+    monkeypatch.setattr(api.response_cache, "_clock", lambda: now)
+    api.prime(make_snapshot(fetched_at=now - 30))
+    assert api.get_snapshot("Miami, US").current["temp"] == 30.0
+
+
+def test_saved_time_is_the_download_time(tmp_path, make_api):
+    def answer(url, params):
+        if "/geo/" in url:
+            return [{"name": params["q"], "lat": 25.77, "lon": -80.19}]
+        return dict(BUNDLE)
+
+    now = [BUNDLE["current"]["dt"] + 60.0]
+    api = make_api(answer)
+    api.response_cache._clock = lambda: now[0]
+    downloaded = api.get_snapshot("Miami, US")
+    now[0] += 200                                        # still fresh: next call is a cache hit
+    store = SnapshotStore(str(tmp_path / "snaps.json.gz"))
+    store.save(api.get_snapshot("Miami, US"))
+    assert len(api.transport.calls) == 2
+
+    restarted = make_api(no_network)
+    restarted.response_cache._clock = lambda: now[0]
+    restarted.prime(SnapshotStore(str(tmp_path / "snaps.json.gz")).load("Miami, US"))
+    assert store.load("Miami, US").fetched_at == downloaded.fetched_at
+    assert restarted.next_expected_update(25.77, -80.19) == api.next_expected_update(25.77, -80.19)
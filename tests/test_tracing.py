@@ -0,0 +1,61 @@
+# tests/test_tracing.py
+
+import builtins
+import json
+
+from core import metrics as metrics_mod
+from core.metrics import Metrics
+from core.tracing import Tracer
+
+
+def _events(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["traceEvents"]
+
+
+def test_records_spans_imports_and_writes_after_last_cycle(tmp_path, monkeypatch):
+    (tmp_path / "traced_mod_xyz.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    real_import = builtins.__import__
+    tracer = Tracer()
+    tracer.start(str(tmp_path / "trace.json"), cycles=2)
+    try:
+        import traced_mod_xyz  # noqa: F401
+        with tracer.span("icon.load", code="01d"):
+            pass
+        tracer.instant("http.retry", "http", status=503)
+        tracer.cycle_done()
+        assert tracer.enabled                      # one cycle to go
+        tracer.cycle_done()
+    finally:
+        tracer.finish()
+    assert not tracer.enabled
+    assert builtins.__import__ is real_import      # hook removed
+
+    events = _events(tmp_path / "trace.json")
+    names = {e["name"]: e for e in events}
+    assert names["import traced_mod_xyz"]["ph"] == "X"
+    assert names["icon.load"]["cat"] == "icon" and names["icon.load"]["args"] == {"code": "01d"}
+    assert names["http.retry"]["ph"] == "i"
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+
+
+def test_idle_tracer_is_free_and_writes_nothing(tmp_path):
+    tracer = Tracer()
+    with tracer.span("chart.draw"):
+        pass
+    tracer.cycle_done()
+    assert tracer.finish() is None
+
+
+def test_metrics_spans_land_in_the_trace(tmp_path, monkeypatch):
+    tracer = Tracer()
+    monkeypatch.setattr(metrics_mod, "tracer", tracer)
+    tracer.start(str(tmp_path / "trace.json"), imports=False)
+    with Metrics(enabled=False).span("refresh.fetch"):
+        pass
+    with Metrics(enabled=True).span("render.chart"):
+        pass
+    tracer.finish()
+    names = [e["name"] for e in _events(tmp_path / "trace.json") if e["ph"] == "X"]
+    assert names == ["refresh.fetch", "render.chart"]
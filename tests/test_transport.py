@@ -0,0 +1,46 @@
+# tests/test_transport.py
+
+import gzip
+import os
+
+import pytest
+import requests
+
+from core.transport import (LiveTransport, RecordingTransport, ReplayTransport,
+                            request_key, transport_from_env)
+
+CASSETTE = os.path.join(os.path.dirname(__file__), "fixtures", "miami.cassette.json")
+
+
+def test_request_key_drops_api_key():
+    assert request_key("u", {"q": "Miami", "appid": "SECRET"}) == "u?q=Miami"
+
+
+def test_replay_runs_full_snapshot_offline(make_api):
+    snap = make_api(units="metric", transport=ReplayTransport(CASSETTE)).get_snapshot("Miami, US")
+    assert snap.current["temp"] == 29.4
+    assert len(snap.daily) == 8
+    assert snap.alerts[0]["event"] == "Heat Advisory"
+
+
+def test_replay_miss_behaves_like_offline(make_api):
+    with pytest.raises(ValueError):
+        make_api(units="metric", transport=ReplayTransport(CASSETTE)).geocode("Atlantis")
+
+
+def test_record_then_replay(tmp_path, make_api):
+    path = str(tmp_path / "rec.json.gz")
+    recorder = RecordingTransport(ReplayTransport(CASSETTE), path)
+    make_api(units="metric", transport=recorder).get_snapshot("Miami, US")
+
+    replayed = make_api(units="metric", transport=ReplayTransport(path)).get_snapshot("Miami, US")
+    assert replayed.current["humidity"] == 74
+    with open(path, "rb") as f:
+        assert b"KEY123" not in gzip.decompress(f.read())
+
+
+def test_transport_from_env(monkeypatch):
+    monkeypatch.delenv("WEATHER_CASSETTE", raising=False)
+    assert isinstance(transport_from_env(requests.Session()), LiveTransport)
+    monkeypatch.setenv("WEATHER_CASSETTE", CASSETTE)
+    assert isinstance(transport_from_env(requests.Session()), ReplayTransport)
@@ -0,0 +1,80 @@
+# tests/test_ui_scheduler.py
+
+import pytest
+
+from core.refresh_scheduler import RefreshScheduler
+from core.ui_scheduler import UiScheduler
+
+
+@pytest.fixture
+def ui(fake_tk):
+    return UiScheduler(fake_tk, clock=lambda: fake_tk.now)
+
+
+def test_reregistering_a_task_replaces_it(fake_tk, ui):
+    tk = fake_tk
+    flashes = []
+    for _ in range(5):   # five refreshes with an active alert
+        ui.every("flash", 500, lambda: flashes.append(tk.now), delay_ms=0)
+    tk.advance(2.0)
+    assert len(flashes) == 5            # t = 0, 0.5, 1.0, 1.5, 2.0
+    assert len(tk.jobs) == 1            # a single Tk timer outstanding
+    ui.cancel("flash")
+    tk.advance(2.0)
+    assert len(flashes) == 5
+
+
+def test_tasks_due_in_the_same_frame_share_a_tick(fake_tk, ui):
+    tk = fake_tk
+    runs = []
+    ui.every("a", 1000, lambda: runs.append("a"))
+    ui.every("b", 1000, lambda: runs.append("b"), delay_ms=1005)
+    ui.every("c", 1000, lambda: runs.append("c"), delay_ms=1010)
+    tk.advance(1.02)
+    assert sorted(runs) == ["a", "b", "c"]
+    assert ui.ticks == 1 and ui.callbacks == 3
+
+
+def test_reports_loop_lag_and_skips_lost_beats(fake_tk, ui):
+    tk = fake_tk
+    runs = []
+    ui.every("worker", 50, lambda: runs.append(tk.now))
+    ui.once("stall", 100, lambda: None)
+    tk.advance(0.1)
+    tk.now += 0.4                        # something blocked the loop for 400 ms
+    before = len(runs)
+    tk.advance(0.0)
+    assert ui.lag_ms >= 350
+    assert ui.max_lag_ms >= 350
+    assert len(runs) - before == 1       # one beat for the lagged tick, not one per lost beat
+    ticks, callbacks = ui.ticks, ui.callbacks
+    tk.advance(0.1)
+    assert ui.ticks - ticks == ui.callbacks - callbacks == 2    # back on a 50 ms beat
+
+
+def test_drives_refresh_scheduler_through_after(fake_tk, ui):
+    tk = fake_tk
+    calls = []
+    sched = RefreshScheduler(ui, lambda: calls.append(tk.now), interval=60, jitter=0,
+                             clock=lambda: tk.now)
+    sched.start()
+    tk.advance(60)
+    assert calls == [60]
+    sched.finished(True)
+    sched.stop()
+    tk.advance(120)
+    assert calls == [60]
+    assert not ui.scheduled("after#1")
+
+
+def test_close_from_a_task_stops_the_tick(fake_tk, ui):
+    tk = fake_tk
+    runs = []
+    ui.every("a", 100, lambda: (runs.append("a"), ui.close()))
+    ui.every("b", 100, lambda: runs.append("b"), delay_ms=105)    # same frame as "a"
+    tk.advance(1.0)
+    assert runs == ["a"]
+    assert tk.jobs == {}                 # nothing re-armed on the closed widget
+    ui.once("late", 0, lambda: runs.append("late"))
+    tk.advance(1.0)
+    assert runs == ["a"]
@@ -0,0 +1,35 @@
+# tests/test_units.py
+
+from core.units import convert_bundle
+from core.weather_api import WeatherSnapshot
+
+BUNDLE = {
+    "current": {"temp": 20.0, "feels_like": 18.0, "wind_speed": 10.0, "pressure": 1013},
+    "daily": [{"temp": {"min": 10.0, "max": 30.0}, "wind_speed": 5.0, "pop": 0.4}],
+}
+
+
+def test_imperial_conversion_leaves_source_untouched():
+    out = convert_bundle(BUNDLE, "imperial")
+    assert out["current"]["temp"] == 68.0
+    assert out["current"]["feels_like"] == 64.4
+    assert out["current"]["wind_speed"] == 22.37          # mph
+    assert out["current"]["pressure"] == 29.91            # inHg
+    assert out["daily"][0]["temp"] == {"min": 50.0, "max": 86.0}
+    assert out["daily"][0]["pop"] == 0.4
+    assert BUNDLE["current"]["temp"] == 20.0
+
+
+def test_wind_unit_is_independent_of_temperature_units():
+    out = convert_bundle(BUNDLE, "metric", "km/h")
+    assert out["current"]["temp"] == 20.0
+    assert out["current"]["wind_speed"] == 36.0
+
+
+def test_snapshot_views_are_memoized():
+    snap = WeatherSnapshot.from_bundle("Miami", 25.77, -80.19, BUNDLE)
+    imperial = snap.in_units("imperial")
+    assert imperial.current["temp"] == 68.0
+    assert snap.in_units("imperial") is imperial
+    assert imperial.in_units("metric") is snap
+    assert imperial.in_units("imperial", "km/h").current["wind_speed"] == 36.0
@@ -0,0 +1,75 @@
+# tests/test_view_model.py
+
+from gui import ViewModel
+
+
+class FakeWidget:
+    def __init__(self):
+        self.configured = []
+
+    def configure(self, **options):
+        self.configured.append(options)
+
+
+class FakeTree:
+    def __init__(self):
+        self.rows = {}          # iid -> values, in display order
+        self.calls = []
+        self._next = 0
+
+    def insert(self, parent, index, values):
+        self._next += 1
+        iid = f"I{self._next}"
+        self.rows[iid] = values
+        self.calls.append(("insert", iid))
+        return iid
+
+    def item(self, iid, values):
+        self.rows[iid] = values
+        self.calls.append(("item", iid))
+
+    def delete(self, iid):
+        del self.rows[iid]
+        self.calls.append(("delete", iid))
+
+
+def test_set_pushes_only_changed_options():
+    view, label = ViewModel(), FakeWidget()
+    assert view.set(label, text="21°", fg="red")
+    assert not view.set(label, text="21°", fg="red")
+    assert view.set(label, text="22°", fg="red")
+    assert label.configured == [{"text": "21°", "fg": "red"}, {"text": "22°"}]
+
+
+def test_set_icon_reloads_only_on_new_code_or_theme():
+    view, label, loads = ViewModel(), FakeWidget(), []
+
+    def loader(code, theme):
+        loads.append((code, theme))
+        return object()
+
+    view.set_icon(label, "01d", loader)
+    assert not view.set_icon(label, "01d", loader)
+    view.set_icon(label, "01d", loader, theme="dark")
+    view.set_icon(label, "10d", loader, theme="dark")
+    assert loads == [("01d", "light"), ("01d", "dark"), ("10d", "dark")]
+    assert len(label.configured) == 3
+
+
+def test_sync_rows_updates_in_place_and_reuses_items():
+    view, tree = ViewModel(), FakeTree()
+    assert view.sync_rows(tree, [("Mon", 30), ("Tue", 31)]) == 2
+    first = list(tree.rows)
+    tree.calls.clear()
+
+    assert view.sync_rows(tree, [("Mon", 30), ("Tue", 31)]) == 0
+    assert tree.calls == []
+
+    view.sync_rows(tree, [("Mon", 30), ("Tue", 29), ("Wed", 28)])
+    assert tree.calls == [("item", first[1]), ("insert", "I3")]
+    assert list(tree.rows)[:2] == first                  # existing rows kept
+
+    tree.calls.clear()
+    view.sync_rows(tree, [("Mon", 30)])
+    assert tree.calls == [("delete", first[1]), ("delete", "I3")]
+    assert list(tree.rows) == first[:1]
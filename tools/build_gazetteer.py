@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Build Gazetteer: generate data/gazetteer/*.npy for core/gazetteer.py.
+
+Source is GeoNames cities with 15,000+ inhabitants, taken either from the
+`geonamescache` package (pip install geonamescache) or from a downloaded
+GeoNames dump (cities15000.txt, tab separated).
+
+Each column is written as its own .npy file so the app can memory-map it.
+Rows are sorted by the folded search key, then by population (descending).
+Names ending in " City" (New York City, Mexico City, ...) get an extra row
+without the suffix, because that is how people type them. Names that carry
+their district after a comma ("Mianzhu, Deyang, Sichuan") are cut at the
+comma, since labels and queries use commas to separate state and country.
+
+GeoNames data is CC BY 4.0; keep data/gazetteer/NOTICE next to the output.
+
+Usage
+-----
+  python tools/build_gazetteer.py                        # from geonamescache
+  python tools/build_gazetteer.py --geonames cities15000.txt
+  python tools/build_gazetteer.py --min-population 50000 --out data/gazetteer
+"""
+
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from core.gazetteer import KEY_BYTES, fold  # noqa: E402
+
+NAME_BYTES = 24
+
+
+def _from_geonamescache():
+    import geonamescache
+    for c in geonamescache.GeonamesCache().get_cities().values():
+        yield c["name"], c["admin1code"], c["countrycode"], c["latitude"], c["longitude"], c["population"]
+
+
+def _from_dump(path: Path):
+    # http://download.geonames.org/export/dump/readme.txt (geoname table)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            col = line.rstrip("\n").split("\t")
+            yield col[1], col[10], col[8], float(col[4]), float(col[5]), int(col[14] or 0)
+
+
+def clean_name(name: str) -> str:
+    """'Mianzhu, Deyang, Sichuan' -> 'Mianzhu'; commas separate label parts."""
+    return name.split(",")[0].strip()
+
+
+def _clip_utf8(text: str, limit: int) -> bytes:
+    return text.encode("utf-8")[:limit].decode("utf-8", "ignore").encode("utf-8")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--geonames", type=Path, help="GeoNames cities*.txt dump (default: geonamescache)")
+    ap.add_argument("--min-population", type=int, default=15000)
+    ap.add_argument("--out", type=Path, default=REPO_ROOT / "data" / "gazetteer")
+    args = ap.parse_args()
+
+    source = _from_dump(args.geonames) if args.geonames else _from_geonamescache()
+    rows = []
+    for name, admin, country, lat, lon, pop in source:
+        if pop < args.min_population:
+            continue
+        admin = admin if country == "US" else ""   # state codes only mean something in the US
+        name = clean_name(name)
+        keys = {fold(name)}
+        if name.endswith(" City"):
+            keys.add(fold(name[:-5]))
+        for key in keys:
+            if key:
+                rows.append((key.encode("ascii")[:KEY_BYTES], _clip_utf8(name, NAME_BYTES),
+                             admin[:2].encode("ascii", "ignore"), country.encode("ascii"),
+                             lat, lon, pop))
+    rows.sort(key=lambda r: (r[0], -r[6]))
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    columns = {
+        "key":        np.array([r[0] for r in rows], dtype=f"S{KEY_BYTES}"),
+        "name":       np.array([r[1] for r in rows], dtype=f"S{NAME_BYTES}"),
+        "admin":      np.array([r[2] for r in rows], dtype="S2"),
+        "country":    np.array([r[3] for r in rows], dtype="S2"),
+        "lat":        np.array([r[4] for r in rows], dtype=np.float32),
+        "lon":        np.array([r[5] for r in rows], dtype=np.float32),
+        "population": np.array([r[6] for r in rows], dtype=np.uint32),
+    }
+    total = 0
+    for col, arr in columns.items():
+        path = args.out / f"{col}.npy"
+        np.save(path, arr)
+        total += path.stat().st_size
+    print(f"Wrote {len(rows)} rows to {args.out} ({total / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Build Icon Atlas: pre-resize every weather icon into one sprite sheet.
+
+Writes features/icons/atlas.png (all icons at every requested size, packed
+in rows, one row per size) and features/icons/atlas.json (sprite rectangles)
+for features/current_conditions_icons.IconService, which then serves icons
+with a Tk region copy instead of decoding and resizing PNGs at runtime.
+Theme overrides in features/icons/<theme>/ are included under '<theme>/'.
+
+Re-run after adding or changing icons.
+
+Usage
+-----
+  python tools/build_icon_atlas.py                    # sizes 32, 50, 64, 100
+  python tools/build_icon_atlas.py --sizes 50 64
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from features.current_conditions_icons import (ATLAS_INDEX, ATLAS_PNG, ICON_MAP,  # noqa: E402
+                                               ICONS_DIR, atlas_key)
+
+PADDING = 1
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[32, 50, 64, 100])
+    ap.add_argument("--icons", type=Path, default=Path(ICONS_DIR))
+    args = ap.parse_args()
+
+    files = sorted(set(ICON_MAP.values()))
+    sources = [(None, args.icons / fn, fn) for fn in files]
+    for theme_dir in sorted(p for p in args.icons.iterdir() if p.is_dir()):
+        sources += [(theme_dir.name, theme_dir / fn, fn) for fn in files if (theme_dir / fn).exists()]
+
+    decoded = {}
+    for _, path, _ in sources:
+        with Image.open(path) as img:
+            decoded[path] = img.convert("RGBA")
+
+    width = max(len(sources) * (s + PADDING) for s in args.sizes)
+    height = sum(s + PADDING for s in args.sizes)
+    sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    sprites = {}
+    y = 0
+    for s in args.sizes:
+        x = 0
+        for theme, path, fn in sources:
+            sheet.paste(decoded[path].resize((s, s), Image.LANCZOS), (x, y))
+            sprites[atlas_key(fn, (s, s), theme)] = [x, y, s, s]
+            x += s + PADDING
+        y += s + PADDING
+
+    sheet.save(args.icons / ATLAS_PNG, optimize=True)
+    with open(args.icons / ATLAS_INDEX, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "sizes": args.sizes, "sprites": sprites}, f, indent=1, sort_keys=True)
+    print(f"Wrote {len(sprites)} sprites ({width}x{height}) to {args.icons / ATLAS_PNG}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Replay Bench: time the snapshot pipeline against a recorded cassette.
+
+Runs WeatherAPI.get_snapshot() (geocode + One Call + unit conversion) for
+the given cities, N times each, with every request served by a
+ReplayTransport. No network is needed, and the numbers are repeatable.
+
+Usage
+-----
+  # 1) record once (needs a key + network)
+  WEATHER_CASSETTE=data/cassette.json.gz WEATHER_CASSETTE_MODE=record python main.py
+
+  # 2) benchmark anywhere
+  python tools/replay_bench.py data/cassette.json.gz --city "New York, US" --runs 200
+  python tools/replay_bench.py data/cassette.json.gz --latency 0.15 --no-cache
+  python tools/replay_bench.py tests/fixtures/miami.cassette.json --city "Miami, US"
+"""
+
+from __future__ import annotations
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from core.geocode_cache import GeocodeCache  # noqa: E402
+from core.rate_limit import QuotaLimiter     # noqa: E402
+from core.transport import ReplayTransport    # noqa: E402
+from core.weather_api import WeatherAPI       # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("cassette")
+    ap.add_argument("--city", action="append", default=None, help="repeatable; default 'New York, US'")
+    ap.add_argument("--runs", type=int, default=50)
+    ap.add_argument("--latency", type=float, default=0.0, help="simulated seconds per request")
+    ap.add_argument("--units", default="imperial")
+    ap.add_argument("--no-cache", action="store_true", help="disable the response cache (every run refetches)")
+    args = ap.parse_args()
+
+    cities = args.city or ["New York, US"]
+    api = WeatherAPI(
+        api_key="replay",
+        units=args.units,
+        transport=ReplayTransport(args.cassette, latency=args.latency),
+        geocode_cache=GeocodeCache(":memory:"),
+        limiter=QuotaLimiter(rate_per_minute=1e9, burst=10**9, daily_budget=10**9),
+        cache_ttl=0 if args.no_cache else 600,
+        cache_stale_ttl=0 if args.no_cache else 3600,
+    )
+
+    for city in cities:
+        samples = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            api.get_snapshot(city)
+            samples.append((time.perf_counter() - t0) * 1000)
+        samples.sort()
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        print(f"{city}: runs={len(samples)} mean={statistics.mean(samples):.2f}ms "
+              f"p50={statistics.median(samples):.2f}ms p95={p95:.2f}ms max={samples[-1]:.2f}ms")
+    print("cache:", api.cache_stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())